@@ -0,0 +1,73 @@
+"""Local HTTP server for the benchmark fixtures.
+
+    /<scenario>/jobs/search/       full search page, from ?start=N if given (Selenium engine)
+    /<scenario>/fragment?start=N   guest API card fragment (http engine and 'See more jobs')
+    /<scenario>/jobPosting/<id>    guest job detail page (--enrich)
+"""
+import argparse
+import sys
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from fixtures import SCENARIOS, render_cards, render_job_detail, render_search_page
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    # Fixtures are deterministic, so each response is rendered once
+    cache = {}
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        parts = [part for part in url.path.split("/") if part]
+        if not parts or parts[0] not in SCENARIOS:
+            self.send_error(404)
+            return
+
+        scenario = parts[0]
+        start = int(urllib.parse.parse_qs(url.query).get("start", ["0"])[0])
+        if parts[1:] == ["jobs", "search"]:
+            key = (scenario, "page", start)
+            render = lambda: render_search_page(scenario, start)
+        elif parts[1:] == ["fragment"]:
+            key = (scenario, start)
+            render = lambda: render_cards(scenario, start)
+        elif len(parts) == 3 and parts[1] == "jobPosting" and parts[2].isdigit():
+            key = ("detail", parts[2])
+            render = lambda: render_job_detail(parts[2])
+        else:
+            self.send_error(404)
+            return
+
+        if key not in self.cache:
+            self.cache[key] = render().encode("utf-8")
+        body = self.cache[key]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the benchmark fixtures")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on (default: any free port)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), FixtureHandler)
+    # The benchmark runner reads the address from this line
+    print(f"Serving fixtures on http://{args.host}:{server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
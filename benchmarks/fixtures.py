@@ -0,0 +1,193 @@
+"""Deterministic LinkedIn search result fixtures for the offline benchmarks.
+
+The markup follows the three card layouts the scraper's selector cascades target:
+the public guest search ("guest"), the older job-search-card list ("search-card")
+and the logged-in job card list ("logged-in").
+"""
+import html
+import random
+
+TITLES = ["Software Engineer", "Data Analyst", "Backend Developer", "Frontend Engineer", "DevOps Engineer",
+          "Machine Learning Engineer", "QA Analyst", "Product Manager", "Site Reliability Engineer", "Full Stack Developer"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries", "Wayne Enterprises",
+             "Tyrell Systems", "Soylent Data", "Cyberdyne"]
+LOCATIONS = ["Pune, Maharashtra, India", "Bengaluru, Karnataka, India", "Remote", "New York, NY", "London, England, United Kingdom"]
+SENIORITY_LEVELS = ["Internship", "Entry level", "Associate", "Mid-Senior level", "Director"]
+EMPLOYMENT_TYPES = ["Full-time", "Part-time", "Contract", "Internship"]
+
+# name: layout, cards per page, number of pages, share of obfuscated cards
+SCENARIOS = {
+    "guest-small": {"layout": "guest", "per_page": 10, "pages": 1, "obfuscated": 0.0},
+    "guest-100": {"layout": "guest", "per_page": 100, "pages": 3, "obfuscated": 0.0},
+    "guest-1000": {"layout": "guest", "per_page": 1000, "pages": 1, "obfuscated": 0.0},
+    "obfuscated-100": {"layout": "guest", "per_page": 100, "pages": 2, "obfuscated": 0.3},
+    "search-card-100": {"layout": "search-card", "per_page": 100, "pages": 2, "obfuscated": 0.0},
+    "logged-in-100": {"layout": "logged-in", "per_page": 100, "pages": 2, "obfuscated": 0.0},
+}
+
+# Results list wrapper per layout; both class names satisfy the scraper's readiness wait
+LIST_CLASSES = {"guest": "jobs-search__results-list", "search-card": "job-search-resultsList", "logged-in": "job-search-resultsList"}
+
+
+def total_cards(scenario):
+    return SCENARIOS[scenario]["per_page"] * SCENARIOS[scenario]["pages"]
+
+
+def _card_data(scenario, index):
+    """Fields of card `index`, the same on every call."""
+    config = SCENARIOS[scenario]
+    rng = random.Random(f"{scenario}:{index}")
+    job_id = 3900000000 + index
+    data = {
+        "id": job_id,
+        "title": rng.choice(TITLES),
+        "company": rng.choice(COMPANIES),
+        "location": rng.choice(LOCATIONS),
+        "days_ago": rng.randint(0, 30),
+    }
+    data["date"] = f"2025-02-{28 - min(data['days_ago'], 27):02d}"
+    data["slug"] = f"{data['title']}-at-{data['company']}".lower().replace(" ", "-")
+    if rng.random() < config["obfuscated"]:
+        data["title"] = "*" * len(data["title"])
+        data["company"] = "*" * len(data["company"])
+    return data
+
+
+def expected_job(scenario, index):
+    """Fields the scraper should parse out of card `index`, or None for an obfuscated card it must skip."""
+    card = _card_data(scenario, index)
+    if card["title"].startswith("*"):
+        return None
+    return {
+        "title": card["title"],
+        "company": card["company"],
+        "location": card["location"],
+        "link": f"https://www.linkedin.com/jobs/view/{card['id']}",
+        # Only the guest layout carries a <time datetime>; the others show the relative date
+        "date_posted": card["date"] if SCENARIOS[scenario]["layout"] == "guest" else f"{card['days_ago']} days ago",
+    }
+
+
+def _guest_card(card, position):
+    return f"""<li>
+    <div class="base-card relative w-full hover:no-underline focus:no-underline base-card--link base-search-card base-search-card--link job-search-card" data-entity-urn="urn:li:jobPosting:{card['id']}" data-impression-id="jobs-search-result-{position}">
+        <a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" href="https://in.linkedin.com/jobs/view/{card['slug']}-{card['id']}?position={position}&amp;pageNum=0&amp;refId=bench&amp;trackingId=bench">
+            <span class="sr-only">{html.escape(card['title'])}</span>
+        </a>
+        <div class="search-entity-media">
+            <img class="artdeco-entity-image artdeco-entity-image--square-4" data-delayed-url="https://media.licdn.com/dms/image/logo-{card['id']}" alt="">
+        </div>
+        <div class="base-search-card__info">
+            <h3 class="base-search-card__title">{html.escape(card['title'])}</h3>
+            <h4 class="base-search-card__subtitle">
+                <a class="hidden-nested-link" href="https://in.linkedin.com/company/{card['id'] % 97}">{html.escape(card['company'])}</a>
+            </h4>
+            <div class="base-search-card__metadata">
+                <span class="job-search-card__location">{html.escape(card['location'])}</span>
+                <time class="job-search-card__listdate" datetime="{card['date']}">{card['days_ago']} days ago</time>
+            </div>
+        </div>
+    </div>
+</li>"""
+
+
+def _search_card(card, position):
+    return f"""<li>
+    <div class="job-search-card" data-id="{card['id']}">
+        <a class="job-search-card__link" href="https://www.linkedin.com/jobs/view/{card['slug']}-{card['id']}?position={position}">
+            <h3 class="job-search-card__title">{html.escape(card['title'])}</h3>
+        </a>
+        <h4 class="job-search-card__subtitle">{html.escape(card['company'])}</h4>
+        <span class="job-result-card__location">{html.escape(card['location'])}</span>
+        <span class="job-search-card__listdate">{card['days_ago']} days ago</span>
+    </div>
+</li>"""
+
+
+def _logged_in_card(card, position):
+    return f"""<li class="jobs-search-results__list-item occludable-update" data-occludable-job-id="{card['id']}">
+    <div class="job-card-container job-card-container--clickable" data-job-id="{card['id']}">
+        <a class="job-card-list__title job-card-container__link" href="https://www.linkedin.com/jobs/view/{card['id']}/?eBP=bench&amp;refId=bench&amp;trackingId=bench">{html.escape(card['title'])}</a>
+        <div class="job-card-container__company-name">{html.escape(card['company'])}</div>
+        <ul class="job-card-container__metadata-wrapper">
+            <li class="job-card-container__metadata-item">{html.escape(card['location'])}</li>
+        </ul>
+        <ul class="job-card-list__footer-wrapper">
+            <li class="job-card-container__footer-item">{card['days_ago']} days ago</li>
+        </ul>
+    </div>
+</li>"""
+
+
+CARD_RENDERERS = {"guest": _guest_card, "search-card": _search_card, "logged-in": _logged_in_card}
+
+
+def render_cards(scenario, start, count=None):
+    """The <li> cards from offset `start`, as the guest API returns them."""
+    config = SCENARIOS[scenario]
+    end = min(total_cards(scenario), start + (count or config["per_page"]))
+    render = CARD_RENDERERS[config["layout"]]
+    return "\n".join(render(_card_data(scenario, index), index + 1) for index in range(max(0, start), end))
+
+
+def detail_data(job_id):
+    """Detail page fields of a job, the same on every call (also used to check enrichment results)."""
+    rng = random.Random(f"detail:{job_id}")
+    return {
+        "description": f"We are hiring for role {job_id}.\nYou will build and run production services.",
+        "seniority_level": rng.choice(SENIORITY_LEVELS),
+        "employment_type": rng.choice(EMPLOYMENT_TYPES),
+        "job_function": "Engineering and Information Technology",
+        "industries": "Software Development",
+        "applicants": rng.choice([12, 25, 87, 200]),
+    }
+
+
+def render_job_detail(job_id):
+    """A guest job detail page (jobPosting/<id>) with description, job criteria and applicant count."""
+    detail = detail_data(job_id)
+    paragraphs = "".join(f"<p>{html.escape(line)}</p>" for line in detail["description"].split("\n"))
+    criteria = "".join(f"""
+        <li class="description__job-criteria-item">
+            <h3 class="description__job-criteria-subheader">{heading}</h3>
+            <span class="description__job-criteria-text description__job-criteria-text--criteria">{html.escape(detail[field])}</span>
+        </li>""" for heading, field in [("Seniority level", "seniority_level"), ("Employment type", "employment_type"),
+                                         ("Job function", "job_function"), ("Industries", "industries")])
+    applicants = f"Over {detail['applicants']} applicants" if detail["applicants"] == 200 else f"{detail['applicants']} applicants"
+    return f"""<section class="top-card-layout">
+    <h2 class="top-card-layout__title">Job {job_id}</h2>
+    <figcaption class="num-applicants__caption">{applicants}</figcaption>
+</section>
+<section class="description">
+    <div class="show-more-less-html__markup show-more-less-html__markup--clamp-after-5">{paragraphs}</div>
+    <ul class="description__job-criteria-list">{criteria}
+    </ul>
+</section>"""
+
+
+def render_search_page(scenario, start=0):
+    """A full search results page: the page of cards at offset `start` and a 'See more jobs' button that appends the next."""
+    config = SCENARIOS[scenario]
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{scenario} | Jobs</title></head>
+<body>
+<main>
+    <ul class="{LIST_CLASSES[config['layout']]}">
+{render_cards(scenario, start)}
+    </ul>
+    <button class="infinite-scroller__show-more-button" aria-label="See more jobs" type="button"{'' if start + config['per_page'] < total_cards(scenario) else ' style="display: none"'}>See more jobs</button>
+</main>
+<script>
+var nextStart = {start + config['per_page']}, totalCards = {total_cards(scenario)};
+document.querySelector('.infinite-scroller__show-more-button').addEventListener('click', function() {{
+    var button = this;
+    fetch('/{scenario}/fragment?start=' + nextStart).then(function(response) {{ return response.text(); }}).then(function(cards) {{
+        document.querySelector('ul').insertAdjacentHTML('beforeend', cards);
+        nextStart += {config['per_page']};
+        if (nextStart >= totalCards) button.style.display = 'none';
+    }});
+}});
+</script>
+</body>
+</html>"""
@@ -0,0 +1,345 @@
+"""Offline benchmarks for the LinkedIn extraction pipeline.
+
+Starts the fixture server, drives the real JobScraper against each fixture scenario and
+records cards/sec, WebDriver commands per card, wall time per phase and peak RSS of
+Python and Chrome. Every scraped job is checked against the fixture it came from, and a
+run with a wrongly parsed field fails. Results are written to a JSON file so runs can be compared across commits.
+
+    python benchmarks/run_benchmarks.py --engine http selenium --repeat 3
+    python benchmarks/run_benchmarks.py --compare benchmarks/results/<earlier run>.json
+    python benchmarks/run_benchmarks.py --engine http --enrich 8
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, REPO_DIR)
+
+from job_scraper import (JobEnricher, JobScraper, RateLimiter, RunMetrics, SelectorPlan, canonical_job_id, logger,
+                         process_tree_rss, setup_logging, tabs_count)
+from fixtures import SCENARIOS, detail_data, expected_job, total_cards
+
+RESULTS_DIR = os.path.join(BENCHMARK_DIR, "results")
+# Detail page fields compared against the fixtures when --enrich is on
+CHECKED_DETAIL_FIELDS = ["seniority_level", "employment_type", "applicants"]
+
+
+class RssSampler(threading.Thread):
+    """Samples the peak RSS of this Python process and of the browser's process tree."""
+
+    def __init__(self, browser_pid, interval=0.1):
+        super().__init__(daemon=True)
+        self.browser_pid = browser_pid
+        self.interval = interval
+        self.peak_python = 0
+        self.peak_browser = 0
+        self._stop_event = threading.Event()
+
+    def sample(self):
+        self.peak_python = max(self.peak_python, process_tree_rss(os.getpid(), descendants=False) or 0)
+        pid = self.browser_pid()
+        if pid:
+            self.peak_browser = max(self.peak_browser, process_tree_rss(pid) or 0)
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.sample()
+
+
+def _browser_pid(scraper):
+    driver = scraper._driver
+    try:
+        return driver.service.process.pid if driver is not None else None
+    except AttributeError:
+        return None
+
+
+def check_jobs(scenario, jobs, enriched):
+    """Compare the scraped jobs with the fixture cards (and detail pages) they came from.
+
+    Returns a description of the first mismatch, or None when every field was parsed right.
+    """
+    expected = {}
+    for index in range(total_cards(scenario)):
+        job = expected_job(scenario, index)
+        if job is not None:
+            expected[canonical_job_id(job["link"])] = job
+    if len(jobs) != len(expected):
+        return f"{len(jobs)} jobs scraped, expected {len(expected)}"
+    for job in jobs:
+        job_id = canonical_job_id(job.get("link"))
+        if job_id not in expected:
+            return f"unexpected job {job.get('link')!r}"
+        fields = dict(expected[job_id])
+        if enriched:
+            detail = detail_data(int(job_id))
+            fields.update({field: detail[field] for field in CHECKED_DETAIL_FIELDS})
+        for field, value in fields.items():
+            if job.get(field) != value:
+                return f"{field} of job {job_id} is {job.get(field)!r}, expected {value!r}"
+    return None
+
+
+def run_scenario(base_url, scenario, engine, extraction, workdir, enrich=0, tabs=1):
+    """Scrape one fixture scenario with a fresh scraper and return its measurements.
+
+    With enrich > 0 every job's detail page is also fetched, that many at a time; with
+    tabs > 1 the result pages after the first are loaded that many at once.
+    """
+    config = SCENARIOS[scenario]
+    store_path = os.path.join(workdir, f"{scenario}-{engine}-{extraction}.db")
+    for suffix in ["", "-wal", "-shm"]:
+        if os.path.exists(store_path + suffix):
+            os.remove(store_path + suffix)
+
+    result = {
+        "scenario": scenario,
+        "layout": config["layout"],
+        "engine": engine,
+        "extraction": extraction if engine == "selenium" else "html",
+        "cards_served": total_cards(scenario),
+        "error": None,
+    }
+    scraper = None
+    sampler = None
+    enricher = JobEnricher(f"{base_url}/{scenario}/jobPosting/{{job_id}}", enrich, rate_limiter=RateLimiter(0)) if enrich else None
+    try:
+        scraper = JobScraper(
+            engine=engine,
+            extraction=extraction,
+            search_url=f"{base_url}/{scenario}/jobs/search/",
+            guest_search_url=f"{base_url}/{scenario}/fragment",
+            wait_timeout=10,
+            store_path=store_path,
+            max_jobs=total_cards(scenario),
+            pages_to_scrape=config["pages"],
+            rate_limiter=RateLimiter(0),
+            # Every run starts cold and learns its layout from the first cards, as on a fresh install
+            selector_plan=SelectorPlan(None),
+            enricher=enricher,
+            tabs=tabs,
+        )
+        sampler = RssSampler(lambda: _browser_pid(scraper))
+        sampler.start()
+
+        # Browser startup is reported on its own and kept out of the throughput numbers
+        if engine == "selenium":
+            started = time.perf_counter()
+            scraper.driver
+            result["browser_startup"] = round(time.perf_counter() - started, 4)
+
+        # Only the scrape itself goes into the phase breakdown
+        scraper.metrics = RunMetrics()
+        commands_before = scraper.webdriver_commands
+        started = time.perf_counter()
+        if engine == "selenium":
+            scraper.scrape_linkedin("Software Engineer", "Pune", "2")
+        else:
+            scraper.scrape_linkedin_http("Software Engineer", "Pune", "2")
+        wall_time = time.perf_counter() - started
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+    finally:
+        if sampler is not None:
+            sampler.stop()
+        if scraper is not None:
+            scraper.close()
+        if enricher is not None:
+            enricher.close()
+
+    cards = scraper.progress["cards"]
+    commands = scraper.webdriver_commands - commands_before
+    metrics = scraper.metrics.snapshot()
+    phases = {phase: stats["seconds"] for phase, stats in metrics["phases"].items()}
+    phases["other"] = round(max(0.0, wall_time - sum(phases.values())), 4)
+    result.update({
+        "cards": cards,
+        "jobs": len(scraper.results),
+        "pages": scraper.progress["pages"],
+        "wall_time": round(wall_time, 4),
+        "cards_per_sec": round(cards / wall_time, 1) if wall_time else None,
+        "webdriver_commands": commands,
+        "commands_per_card": round(commands / cards, 2) if cards else None,
+        "result_wait": round(sum(timing["wait"] for timing in scraper.page_timings), 4),
+        "phases": phases,
+        "counters": metrics["counters"],
+        "enriched": sum(1 for job in scraper.results if "description" in job) if enrich else None,
+        "peak_rss_python_mb": round(sampler.peak_python / 2**20, 1),
+        "peak_rss_browser_mb": round(sampler.peak_browser / 2**20, 1) if engine == "selenium" else None,
+    })
+    if cards < total_cards(scenario):
+        result["error"] = f"only {cards} of {total_cards(scenario)} cards were examined"
+    elif enrich and result["enriched"] < result["jobs"]:
+        result["error"] = f"only {result['enriched']} of {result['jobs']} jobs were enriched"
+    else:
+        mismatch = check_jobs(scenario, scraper.results, bool(enrich))
+        if mismatch:
+            result["error"] = f"wrong results: {mismatch}"
+    return result
+
+
+def start_fixture_server():
+    """Run the fixture server in a child process so it doesn't share the GIL or RSS with the scraper."""
+    process = subprocess.Popen([sys.executable, os.path.join(BENCHMARK_DIR, "fixture_server.py")],
+                               stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline().strip()
+    if not line.startswith("Serving fixtures on "):
+        process.kill()
+        raise RuntimeError(f"Fixture server did not start: {line!r}")
+    return process, line[len("Serving fixtures on "):]
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def summarize(results):
+    """Median of the repeated runs for every scenario/engine/extraction combination."""
+    groups = {}
+    for result in results:
+        if result["error"] is None:
+            groups.setdefault((result["scenario"], result["engine"], result["extraction"]), []).append(result)
+    summary = []
+    for (scenario, engine, extraction), runs in groups.items():
+        entry = {"scenario": scenario, "engine": engine, "extraction": extraction, "runs": len(runs)}
+        for metric in ["wall_time", "cards_per_sec", "commands_per_card", "peak_rss_python_mb", "peak_rss_browser_mb"]:
+            values = [run[metric] for run in runs if run.get(metric) is not None]
+            entry[metric] = round(statistics.median(values), 4) if values else None
+        summary.append(entry)
+    return summary
+
+
+def print_summary(summary, baseline=None):
+    baseline = {(e["scenario"], e["engine"], e["extraction"]): e for e in baseline or []}
+    print(f"\n{'scenario':<18} {'engine':<9} {'extraction':<10} {'wall s':>8} {'cards/s':>9} {'cmd/card':>8} "
+          f"{'py MB':>7} {'chrome MB':>9}" + ("  vs baseline" if baseline else ""))
+    for entry in summary:
+        line = (f"{entry['scenario']:<18} {entry['engine']:<9} {entry['extraction']:<10} {entry['wall_time']:>8.3f} "
+                f"{entry['cards_per_sec'] or 0:>9.1f} {entry['commands_per_card'] or 0:>8.2f} "
+                f"{entry['peak_rss_python_mb'] or 0:>7.1f} {entry['peak_rss_browser_mb'] or 0:>9.1f}")
+        previous = baseline.get((entry["scenario"], entry["engine"], entry["extraction"]))
+        if previous and previous.get("cards_per_sec") and entry["cards_per_sec"]:
+            change = (entry["cards_per_sec"] - previous["cards_per_sec"]) / previous["cards_per_sec"] * 100
+            line += f"  {change:+.1f}% cards/s"
+        print(line)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the LinkedIn extraction pipeline")
+    parser.add_argument("--scenario", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS),
+                        help="Fixture scenarios to run (default: all)")
+    parser.add_argument("--engine", nargs="+", choices=["http", "selenium"], default=["http", "selenium"],
+                        help="Scraping engines to benchmark (default: both)")
+    parser.add_argument("--extraction", nargs="+", choices=["batch", "legacy"], default=["batch", "legacy"],
+                        help="Selenium card extraction modes to benchmark (default: both)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per combination; the summary reports the median (default: 3)")
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/<timestamp>_<commit>.json)")
+    parser.add_argument("--compare", metavar="FILE", help="Earlier results file to compare cards/sec against")
+    parser.add_argument("--enrich", type=int, default=0, metavar="CONCURRENCY",
+                        help="Also fetch every job's detail page, this many at a time (default: off)")
+    parser.add_argument("--tabs", type=tabs_count, default=1, metavar="N",
+                        help="Load this many result pages at once by their start= offset (default: 1)")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show the scraper's own log output")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    setup_logging(debug=False)
+    # The scraper's per-page logging would drown out the benchmark's own output
+    if not args.verbose:
+        logger.setLevel(logging.ERROR)
+
+    combinations = []
+    for engine in args.engine:
+        for extraction in (args.extraction if engine == "selenium" else ["batch"]):
+            for scenario in args.scenario:
+                combinations.append((scenario, engine, extraction))
+
+    server, base_url = start_fixture_server()
+    print(f"Fixture server running at {base_url}")
+    workdir = tempfile.mkdtemp(prefix="job_scraper_bench_")
+    original_cwd = os.getcwd()
+    # JobScraper writes to ./output, keep that out of the repository
+    os.chdir(workdir)
+
+    results = []
+    browser_error = None
+    try:
+        for scenario, engine, extraction in combinations:
+            for run in range(1, args.repeat + 1):
+                if engine == "selenium" and browser_error:
+                    # No point starting Chrome again for every scenario once it failed
+                    results.append({"scenario": scenario, "engine": engine, "extraction": extraction, "run": run,
+                                    "error": f"skipped, browser unavailable ({browser_error})"})
+                    continue
+                result = run_scenario(base_url, scenario, engine, extraction, workdir, args.enrich, args.tabs)
+                result["run"] = run
+                results.append(result)
+                if result["error"]:
+                    print(f"{scenario} [{engine}/{result['extraction']}] run {run}: {result['error']}")
+                    if engine == "selenium" and "browser_startup" not in result:
+                        browser_error = result["error"].splitlines()[0]
+                else:
+                    print(f"{scenario} [{engine}/{result['extraction']}] run {run}: {result['cards']} cards in "
+                          f"{result['wall_time']:.3f}s ({result['cards_per_sec']} cards/s)")
+    except KeyboardInterrupt:
+        print("\nInterrupted, writing the runs completed so far...")
+    finally:
+        os.chdir(original_cwd)
+        server.terminate()
+        server.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    summary = summarize(results)
+    report = {
+        "commit": git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "enrich": args.enrich,
+        "tabs": args.tabs,
+        "summary": summary,
+        "results": results,
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f).get("summary")
+    print_summary(summary, baseline)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{report['commit'] or 'nogit'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nBenchmark results saved to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,1811 @@
 import requests
 from bs4 import BeautifulSoup
 import json
+import logging
 import os
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 import random
 import argparse
 import sys
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
+import re
+import hashlib
+import gzip
+import zlib
+import sqlite3
+import threading
+import shutil
+import socket
+import subprocess
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 
-class JobScraper:
+logger = logging.getLogger("job_scraper")
+
+# Reference point for --startup-profile
+PROCESS_STARTED = time.perf_counter()
+
+
+class SeleniumNotLoaded(Exception):
+    """Placeholder for Selenium's exception types until load_selenium() has run."""
+
+
+# Selenium is imported lazily by load_selenium() so the http engine and the
+# non-scraping commands don't pay for it
+webdriver = Options = Service = By = WebDriverWait = EC = None
+TimeoutException = WebDriverException = NoSuchElementException = SeleniumNotLoaded
+
+
+def load_selenium():
+    """Import Selenium on first use and publish its names at module level."""
+    global webdriver, Options, Service, By, WebDriverWait, EC
+    global TimeoutException, WebDriverException, NoSuchElementException
+    if webdriver is not None:
+        return
+    from selenium import webdriver as _webdriver
+    from selenium.webdriver.chrome.options import Options as _Options
+    from selenium.webdriver.chrome.service import Service as _Service
+    from selenium.webdriver.common.by import By as _By
+    from selenium.webdriver.support.ui import WebDriverWait as _WebDriverWait
+    from selenium.webdriver.support import expected_conditions as _EC
+    from selenium.common import exceptions as _exceptions
+    Options, Service, By, WebDriverWait, EC = _Options, _Service, _By, _WebDriverWait, _EC
+    TimeoutException = _exceptions.TimeoutException
+    WebDriverException = _exceptions.WebDriverException
+    NoSuchElementException = _exceptions.NoSuchElementException
+    webdriver = _webdriver
+
+
+# Resolved chromedriver path and the Chrome version it was resolved for
+DRIVER_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "job_scraper", "chromedriver.json")
+# Without a detectable Chrome version the cached driver is trusted for this long before it is resolved again
+DRIVER_CACHE_TTL = 7 * 86400
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome",
+                   "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"]
+
+
+def detect_chrome_version():
+    """Return the installed Chrome version string, or None if it can't be determined."""
+    for binary in CHROME_BINARIES:
+        path = shutil.which(binary) or (binary if os.path.isfile(binary) else None)
+        if not path:
+            continue
+        try:
+            output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r"(\d+\.\d+\.\d+\.\d+)", output)
+        if match:
+            return match.group(1)
+    return None
+
+
+def resolve_chromedriver():
+    """Return a chromedriver path, reusing the cached one while the Chrome version still matches.
+
+    When the Chrome version can't be detected (an unusual binary name, Windows, a flatpak
+    install), the cached driver is reused for DRIVER_CACHE_TTL seconds after it was resolved.
+    """
+    chrome_version = detect_chrome_version()
+    try:
+        with open(DRIVER_CACHE_FILE, "r") as f:
+            cached = json.load(f)
+        if os.path.isfile(cached.get("driver_path", "")):
+            if chrome_version is not None and cached.get("chrome_version") == chrome_version:
+                return cached["driver_path"]
+            if chrome_version is None and time.time() - cached.get("resolved_at", 0) < DRIVER_CACHE_TTL:
+                return cached["driver_path"]
+    except (OSError, ValueError, TypeError):
+        pass
+    
+    # Cache miss or Chrome was upgraded: let webdriver-manager resolve (and maybe download) a driver
+    from webdriver_manager.chrome import ChromeDriverManager
+    driver_path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(DRIVER_CACHE_FILE), exist_ok=True)
+        with open(DRIVER_CACHE_FILE, "w") as f:
+            json.dump({"driver_path": driver_path, "chrome_version": chrome_version, "resolved_at": time.time()}, f)
+    except OSError as e:
+        logger.warning(f"Could not cache chromedriver location: {e}")
+    return driver_path
+
+
+# Public search page (browser engine) and the guest API that serves its result fragments (http engine)
+LINKEDIN_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+LINKEDIN_GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+# Guest job detail page used for enrichment; {job_id} is the numeric posting id
+LINKEDIN_JOB_DETAIL_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+
+# Rotating set of user agents to avoid detection
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+]
+
+# URL patterns blocked through CDP for each resource category; we only read card text and hrefs
+BLOCKED_RESOURCE_PATTERNS = {
+    "images": ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*", "*media.licdn.com/dms/image*"],
+    "fonts": ["*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*", "*fonts.googleapis.com*", "*fonts.gstatic.com*"],
+    "media": ["*.mp4*", "*.webm*", "*.mp3*", "*.m3u8*", "*.ogg*", "*.wav*"],
+    "analytics": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+        "*px.ads.linkedin.com*", "*linkedin.com/li/track*", "*linkedin.com/li/tscp*", "*snap.licdn.com*",
+        "*facebook.net*", "*facebook.com/tr*", "*bat.bing.com*", "*hotjar.com*", "*adservice.google.com*",
+    ],
+}
+DEFAULT_BLOCKED_RESOURCES = ["images", "fonts", "media", "analytics"]
+
+# Selector cascades for LinkedIn job cards and their fields, tried in order
+CARD_SELECTORS = [
+    ".jobs-search__results-list li", 
+    ".job-search-card",
+    "li.jobs-search-results__list-item",
+    ".jobs-search-results__list-item",
+    ".job-card-container"
+]
+TITLE_SELECTORS = ["h3.base-search-card__title", ".job-search-card__title", "h3", ".job-card-list__title"]
+COMPANY_SELECTORS = ["h4.base-search-card__subtitle", ".job-search-card__subtitle", "h4", ".job-card-container__company-name"]
+LOCATION_SELECTORS = [".job-search-card__location", ".job-result-card__location", ".base-search-card__metadata", ".job-card-container__metadata-item"]
+LINK_SELECTORS = ["a.base-card__full-link", "a.job-search-card__link", "a.job-card-list__title", "a.job-card-container__link"]
+# Date fallbacks: the <time> datetime attribute first, then the visible text of the others
+DATE_SELECTORS = ["time", ".job-search-card__listdate", ".job-card-container__footer-item"]
+# The one date selector whose value is read from its datetime attribute rather than its text
+DATETIME_SELECTOR = DATE_SELECTORS[0]
+FIELD_SELECTORS = {
+    "card": CARD_SELECTORS,
+    "title": TITLE_SELECTORS,
+    "company": COMPANY_SELECTORS,
+    "location": LOCATION_SELECTORS,
+    "link": LINK_SELECTORS,
+    "date": DATE_SELECTORS,
+}
+SELECTOR_PLAN_FILE = os.path.join("output", "selector_plan.json")
+
+# Cheap readiness probe: how many cards are rendered and what the first one says
+CARD_SNAPSHOT_SCRIPT = """
+var cardSelectors = arguments[0];
+for (var s = 0; s < cardSelectors.length; s++) {
+    var cards = document.querySelectorAll(cardSelectors[s]);
+    if (cards.length) return [cards.length, (cards[0].textContent || '').trim().slice(0, 200)];
+}
+return [0, null];
+"""
+
+# Shared helpers for the incremental card cursor. A card's key is its job id (from
+# data-entity-urn or the /jobs/view/ link) so re-rendered lists can be recognised.
+CARD_CURSOR_JS = """
+function cardKey(card, index) {
+    var urn = card.getAttribute('data-entity-urn') || card.getAttribute('data-job-id');
+    if (!urn) {
+        var inner = card.querySelector('[data-entity-urn], [data-job-id]');
+        if (inner) urn = inner.getAttribute('data-entity-urn') || inner.getAttribute('data-job-id');
+    }
+    if (urn) return urn.split(':').pop();
+    var anchor = card.querySelector('a[href*="/jobs/view/"]');
+    var match = anchor && anchor.href.match(/\\/jobs\\/view\\/(?:[^\\/?]*-)?(\\d+)/);
+    return match ? match[1] : 'index:' + index;
+}
+
+function findCards(cardSelectors) {
+    for (var s = 0; s < cardSelectors.length; s++) {
+        var cards = document.querySelectorAll(cardSelectors[s]);
+        if (cards.length) return {selector: cardSelectors[s], cards: cards};
+    }
+    return {selector: null, cards: []};
+}
+
+// Resume after the last processed card, or rescan from the top if the list was replaced
+function cursorStart(cards, cursor) {
+    var index = cursor.index;
+    if (index > 0 && (index > cards.length || cardKey(cards[index - 1], index - 1) !== cursor.last_key)) return 0;
+    return index;
+}
+"""
+
+# Returns the element handles of the cards after the cursor, for per-element extraction
+CARD_SLICE_SCRIPT = CARD_CURSOR_JS + """
+var found = findCards(arguments[0]), cursor = arguments[1], limit = arguments[2];
+var start = cursorStart(found.cards, cursor);
+var end = Math.min(found.cards.length, start + limit);
+var elements = [], keys = [];
+for (var c = start; c < end; c++) {
+    elements.push(found.cards[c]);
+    keys.push(cardKey(found.cards[c], c));
+}
+return {selector: found.selector, total: found.cards.length, start: start, elements: elements, keys: keys};
+"""
+
+# Extracts the fields of every unseen job card on the page in a single WebDriver round trip.
+# Mirrors the per-element fallbacks: the first non-empty, non-asterisk match wins.
+CARD_EXTRACTION_SCRIPT = CARD_CURSOR_JS + """
+var fields = arguments[1];
+
+// How often each selector supplied a field on this page ('' when none of them did)
+var matches = {title: {}, company: {}, location: {}, link: {}, date: {}};
+
+function tally(field, selector) {
+    var key = selector || '';
+    matches[field][key] = (matches[field][key] || 0) + 1;
+}
+
+function isObfuscated(text) {
+    return !text || /^\\*+$/.test(text);
+}
+
+function firstText(card, field) {
+    var selectors = fields[field];
+    for (var i = 0; i < selectors.length; i++) {
+        var element = card.querySelector(selectors[i]);
+        if (!element) continue;
+        var text = (element.innerText || element.textContent || '').trim();
+        if (!isObfuscated(text)) {
+            tally(field, selectors[i]);
+            return text;
+        }
+    }
+    tally(field, null);
+    return null;
+}
+
+function findLink(card) {
+    for (var i = 0; i < fields.link.length; i++) {
+        var element = card.querySelector(fields.link[i]);
+        if (element && element.href) {
+            tally('link', fields.link[i]);
+            return element.href;
+        }
+    }
+    tally('link', null);
+    var anchors = card.querySelectorAll('a');
+    for (var j = 0; j < anchors.length; j++) {
+        if (anchors[j].href && anchors[j].href.indexOf('linkedin.com/jobs/view') !== -1) return anchors[j].href;
+    }
+    return null;
+}
+
+function findDate(card) {
+    for (var i = 0; i < fields.date.length; i++) {
+        var element = card.querySelector(fields.date[i]);
+        if (!element) continue;
+        if (fields.date[i] === fields.datetime) {
+            if (!element.getAttribute('datetime')) continue;
+            tally('date', fields.date[i]);
+            return element.getAttribute('datetime');
+        }
+        tally('date', fields.date[i]);
+        return (element.innerText || element.textContent || '').trim();
+    }
+    tally('date', null);
+    return null;
+}
+
+var found = findCards(arguments[0]);
+var start = cursorStart(found.cards, arguments[2]);
+var results = [];
+for (var c = start; c < found.cards.length; c++) {
+    var card = found.cards[c];
+    results.push({
+        key: cardKey(card, c),
+        title: firstText(card, 'title'),
+        company: firstText(card, 'company'),
+        location: firstText(card, 'location'),
+        link: findLink(card),
+        date_posted: findDate(card)
+    });
+}
+return {selector: found.selector, total: found.cards.length, start: start, cards: results, matches: matches};
+"""
+
+
+def _soup_text(element):
+    """Visible text of a BeautifulSoup element with whitespace collapsed."""
+    return " ".join(element.get_text(" ").split())
+
+
+def parse_job_cards(html, selectors=None, matches=None):
+    """Parse job cards out of a search results page or guest API fragment.
+    
+    Applies the same selector fallbacks and asterisk filtering as the browser
+    extraction and returns (card selector, list of card field dicts). `selectors`
+    overrides the cascade order per field (see SelectorPlan); when `matches` is
+    given it is filled with how often each selector supplied each field.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    selectors = dict(FIELD_SELECTORS, **(selectors or {}))
+    matches = matches if matches is not None else {}
+    
+    def tally(field, selector):
+        counts = matches.setdefault(field, {})
+        counts[selector] = counts.get(selector, 0) + 1
+    
+    def first_text(card, field):
+        for selector in selectors[field]:
+            element = card.select_one(selector)
+            if element is None:
+                continue
+            text = _soup_text(element)
+            if text and not all(c == '*' for c in text):
+                tally(field, selector)
+                return text
+        tally(field, None)
+        return None
+    
+    def find_link(card):
+        for selector in selectors["link"]:
+            element = card.select_one(selector)
+            if element is not None and element.get("href"):
+                tally("link", selector)
+                return element["href"]
+        tally("link", None)
+        for anchor in card.find_all("a", href=True):
+            if "linkedin.com/jobs/view" in anchor["href"]:
+                return anchor["href"]
+        return None
+    
+    def find_date(card):
+        for selector in selectors["date"]:
+            element = card.select_one(selector)
+            if element is None:
+                continue
+            if selector == DATETIME_SELECTOR:
+                if not element.get("datetime"):
+                    continue
+                tally("date", selector)
+                return element["datetime"]
+            tally("date", selector)
+            return _soup_text(element)
+        tally("date", None)
+        return None
+    
+    for selector in selectors["card"]:
+        cards = soup.select(selector)
+        if not cards:
+            continue
+        tally("card", selector)
+        return selector, [
+            {
+                "title": first_text(card, "title"),
+                "company": first_text(card, "company"),
+                "location": first_text(card, "location"),
+                "link": find_link(card),
+                "date_posted": find_date(card),
+            }
+            for card in cards
+        ]
+    tally("card", None)
+    return None, []
+
+
+# Fields added to a job by enrichment, and the detail page's criteria headings they come from
+DETAIL_FIELDS = ["description", "seniority_level", "employment_type", "job_function", "industries", "applicants"]
+JOB_CRITERIA_FIELDS = {
+    "seniority level": "seniority_level",
+    "employment type": "employment_type",
+    "job function": "job_function",
+    "industries": "industries",
+}
+
+
+def parse_job_detail(html):
+    """Parse description, job criteria and applicant count out of a job detail page.
+    
+    Returns a dict with the DETAIL_FIELDS that were found; applicants is an int
+    ("Over 200 applicants" gives 200).
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    details = {}
+    
+    description = soup.select_one(".show-more-less-html__markup, .description__text")
+    if description is not None:
+        details["description"] = description.get_text("\n", strip=True)
+    
+    for item in soup.select(".description__job-criteria-item"):
+        heading = item.select_one(".description__job-criteria-subheader")
+        value = item.select_one(".description__job-criteria-text")
+        field = JOB_CRITERIA_FIELDS.get(_soup_text(heading).lower()) if heading is not None else None
+        if field and value is not None:
+            details[field] = _soup_text(value)
+    
+    applicants = soup.select_one(".num-applicants__caption")
+    match = re.search(r"\d[\d,]*", _soup_text(applicants)) if applicants is not None else None
+    if match:
+        details["applicants"] = int(match.group(0).replace(",", ""))
+    return details
+
+
+class SelectorPlan:
+    """Which selector of each cascade won last, tried first from then on and saved between runs.
+    
+    Only one LinkedIn layout is live at a time, so after the first page nearly every lookup hits
+    on the first try; a miss falls back to the full cascade and moves the new winner to the front.
+    Plans are kept per scope (the engine) because guest API fragments and full pages differ in
+    their card wrappers. Shared by every scraper of a run; a path of None keeps it in memory only.
+    """
+    
+    def __init__(self, path=SELECTOR_PLAN_FILE):
+        self.path = path
+        self.winners = {}
+        self.stats = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        """Read the saved plan, ignoring selectors that are no longer in a cascade."""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable selector plan {self.path}: {e}")
+            return
+        for scope, winners in (saved.get("plans") or {}).items():
+            for field, selector in winners.items():
+                if selector in FIELD_SELECTORS.get(field, []):
+                    self.winners[(scope, field)] = selector
+        logger.debug(f"Loaded selector plan from {self.path} ({len(self.winners)} fields)")
+    
+    def order(self, scope, field):
+        """The cascade for a field with the current winner first."""
+        cascade = FIELD_SELECTORS[field]
+        winner = self.winners.get((scope, field))
+        if winner is None or winner == cascade[0]:
+            return cascade
+        return [winner] + [selector for selector in cascade if selector != winner]
+    
+    def orders(self, scope):
+        return {field: self.order(scope, field) for field in FIELD_SELECTORS}
+    
+    def record(self, scope, field, counts):
+        """Record how often each selector (None: none of them) supplied a field; returns (hits, misses).
+        
+        A hit is a lookup answered by the selector tried first. The selector that answered most
+        of the misses becomes the new winner.
+        """
+        first = self.order(scope, field)[0]
+        hits = counts.get(first, 0)
+        misses = sum(counts.values()) - hits
+        fallbacks = {selector: count for selector, count in counts.items() if selector is not None and selector != first}
+        with self._lock:
+            stats = self.stats.setdefault(field, {"hits": 0, "misses": 0})
+            stats["hits"] += hits
+            stats["misses"] += misses
+            if fallbacks and max(fallbacks.values()) > hits:
+                winner = max(fallbacks, key=fallbacks.get)
+                logger.debug(f"Selector plan: {field} now tries {winner!r} first (was {first!r})")
+                self.winners[(scope, field)] = winner
+                self._dirty = True
+            elif hits and (scope, field) not in self.winners:
+                self.winners[(scope, field)] = first
+                self._dirty = True
+        return hits, misses
+    
+    def summary(self):
+        """Hits and misses per field plus totals, e.g. for the run output."""
+        with self._lock:
+            stats = {field: dict(counts) for field, counts in self.stats.items()}
+        hits = sum(counts["hits"] for counts in stats.values())
+        misses = sum(counts["misses"] for counts in stats.values())
+        return {"hits": hits, "misses": misses, "fields": stats}
+    
+    def save(self):
+        """Write the plan if it changed since it was loaded or last saved."""
+        with self._lock:
+            if not self.path or not self._dirty:
+                return
+            plans = {}
+            for (scope, field), selector in sorted(self.winners.items()):
+                plans.setdefault(scope, {})[field] = selector
+            self._dirty = False
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            _write_json_atomic(self.path, {"updated": datetime.now().isoformat(timespec="seconds"), "plans": plans}, indent=2)
+            logger.debug(f"Selector plan saved to {self.path}")
+        except OSError as e:
+            logger.warning(f"Could not save selector plan to {self.path}: {e}")
+
+
+# LinkedIn job URLs end in the numeric posting id: /jobs/view/<slug>-<id> or /jobs/view/<id>
+JOB_ID_PATTERN = re.compile(r"/jobs/view/(?:[^/?#]*-)?(\d+)")
+
+
+def canonical_job_id(link):
+    """Return the numeric LinkedIn job id in a job link, or None if there isn't one."""
+    if not link:
+        return None
+    match = JOB_ID_PATTERN.search(link)
+    return match.group(1) if match else None
+
+
+def canonical_job_link(link):
+    """Reduce a job link to https://www.linkedin.com/jobs/view/<id>, dropping tracking params."""
+    job_id = canonical_job_id(link)
+    if job_id:
+        return f"https://www.linkedin.com/jobs/view/{job_id}"
+    return link
+
+
+def job_key(job):
+    """Stable key for a job: its LinkedIn id, or a hash of its text fields when the link has none."""
+    job_id = canonical_job_id(job.get("link"))
+    if job_id:
+        return job_id
+    text = "|".join(str(job.get(field, "")) for field in ("title", "company", "location"))
+    return "sha1:" + hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def search_key(job_title, location, experience=None):
+    """Identifier recorded against every job a search produced."""
+    return f"{job_title}|{location}|{experience or ''}"
+
+
+# Posting dates from <time datetime> start with an ISO date
+ISO_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}")
+# Relative posting dates shown by the card fallbacks ("3 days ago", "Reposted 1 week ago", "30+ days ago")
+RELATIVE_DATE_PATTERN = re.compile(r"(\d+|an?|one)\+?\s*(minute|hour|day|week|month|year)s?\s+ago", re.IGNORECASE)
+DATE_UNIT_SECONDS = {"minute": 60, "hour": 3600, "day": 86400, "week": 7 * 86400, "month": 30 * 86400, "year": 365 * 86400}
+
+
+def posted_epoch(date_posted, reference=None):
+    """Posting time as Unix seconds, or None if date_posted can't be read.
+    
+    ISO dates (from <time datetime>) count as UTC midnight; relative text is counted
+    back from reference, the Unix time the card was seen (default: now).
+    """
+    if not date_posted or not isinstance(date_posted, str):
+        return None
+    if ISO_DATE_PATTERN.match(date_posted):
+        try:
+            return int(datetime.strptime(date_posted[:10], "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp())
+        except ValueError:
+            return None
+    reference = time.time() if reference is None else reference
+    text = date_posted.lower()
+    if "just now" in text or "today" in text:
+        return int(reference)
+    match = RELATIVE_DATE_PATTERN.search(text)
+    if match is None:
+        return None
+    amount = int(match.group(1)) if match.group(1).isdigit() else 1
+    return int(reference - amount * DATE_UNIT_SECONDS[match.group(2).lower()])
+
+
+# Near-duplicate clusters collapsed into one job list the links and locations of the other postings
+VARIANT_FIELDS = ["variant_links", "variant_locations"]
+JOB_RECORD_FIELDS = ("source", "title", "company", "location", "link", "date_posted", "posted_epoch") + tuple(DETAIL_FIELDS + VARIANT_FIELDS)
+
+
+class JobRecord:
+    """One accepted job, in a fraction of the memory of the dict it replaces.
+    
+    __slots__ drop the per-record key dict, source/company/location are interned since a few
+    values repeat across the whole corpus, and posted_epoch is parsed from date_posted once.
+    Reads like a dict (job["title"], job.get(), "description" in job, update()) so the store,
+    stream, enricher and result writers take records and plain dicts alike; to_dict() gives
+    the JSON form. Unset enrichment fields are None and left out of to_dict().
+    """
+    
+    __slots__ = JOB_RECORD_FIELDS
+    
+    def __init__(self, source="LinkedIn", title=None, company=None, location=None, link=None,
+                 date_posted=None, posted_epoch=None, **extra):
+        self.source = sys.intern(source) if isinstance(source, str) else source
+        self.title = title
+        self.company = sys.intern(company) if isinstance(company, str) else company
+        self.location = sys.intern(location) if isinstance(location, str) else location
+        self.link = link
+        self.date_posted = date_posted
+        self.posted_epoch = posted_epoch
+        for field in DETAIL_FIELDS + VARIANT_FIELDS:
+            setattr(self, field, extra.get(field))
+    
+    @classmethod
+    def from_dict(cls, data, reference=None):
+        """Build a record from a job dict (JSONL stream, store export), parsing posted_epoch if it's missing."""
+        if isinstance(data, cls):
+            return data
+        record = cls(**{field: data.get(field) for field in JOB_RECORD_FIELDS if field in data})
+        if record.posted_epoch is None:
+            record.posted_epoch = posted_epoch(record.date_posted, reference)
+        return record
+    
+    def __getitem__(self, field):
+        if field not in JOB_RECORD_FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+    
+    def __setitem__(self, field, value):
+        if field not in JOB_RECORD_FIELDS:
+            raise KeyError(field)
+        setattr(self, field, value)
+    
+    def __contains__(self, field):
+        return field in JOB_RECORD_FIELDS and getattr(self, field) is not None
+    
+    def get(self, field, default=None):
+        value = getattr(self, field, None) if field in JOB_RECORD_FIELDS else None
+        return default if value is None else value
+    
+    def update(self, fields):
+        for field, value in fields.items():
+            self[field] = value
+    
+    def to_dict(self):
+        job = {field: getattr(self, field) for field in JOB_RECORD_FIELDS[:7]}
+        job.update((field, getattr(self, field)) for field in DETAIL_FIELDS + VARIANT_FIELDS if getattr(self, field) is not None)
+        return job
+    
+    def __repr__(self):
+        return f"JobRecord({self.to_dict()!r})"
+
+
+def job_as_dict(job):
+    """The JSON form of a JobRecord or job dict."""
+    return job.to_dict() if isinstance(job, JobRecord) else job
+
+
+def job_sort_key(job):
+    """Sort key for newest-first ordering: source, then posted_epoch (unknown dates last)."""
+    epoch = job.get("posted_epoch")
+    return (job.get("source", ""), epoch if epoch is not None else float("-inf"))
+
+
+# Near-duplicate detection: MinHash signatures of title + company, bucketed with LSH. Collapsing is
+# opt-in; NEAR_DUPLICATE_THRESHOLD is the similarity used when it is turned on without a value
+NEAR_DUPLICATE_THRESHOLD = 0.8
+MINHASH_PERMUTATIONS = 64
+MINHASH_PRIME = (1 << 31) - 1
+TITLE_SHINGLE_SIZE = 4
+DESCRIPTION_SHINGLE_WORDS = 3
+# Reposts share their description's opening; comparing the first words keeps the check cheap
+DESCRIPTION_SHINGLE_LIMIT = 150
+# Per-shingle hash values kept by the pure Python MinHasher (about 3 KB each)
+MINHASH_SHINGLE_CACHE_SIZE = 100000
+
+
+def _normalize_text(text):
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", (text or "").lower()).split())
+
+
+def title_shingles(job):
+    """Hashed character shingles of a job's normalized title and company."""
+    text = f"{_normalize_text(job.get('title'))} | {_normalize_text(job.get('company'))}"
+    size = min(TITLE_SHINGLE_SIZE, len(text))
+    return {zlib.crc32(text[i:i + size].encode("utf-8")) for i in range(len(text) - size + 1)}
+
+
+def description_shingles(job):
+    """Hashed word shingles of the start of a job's description, or None if it has none."""
+    words = _normalize_text(job.get("description")).split()[:DESCRIPTION_SHINGLE_LIMIT + DESCRIPTION_SHINGLE_WORDS - 1]
+    if not words:
+        return None
+    size = min(DESCRIPTION_SHINGLE_WORDS, len(words))
+    return {zlib.crc32(" ".join(words[i:i + size]).encode("utf-8")) for i in range(len(words) - size + 1)}
+
+
+def lsh_bands(permutations, threshold):
+    """(bands, rows) for LSH whose similarity threshold (1/bands)^(1/rows) is closest to `threshold`."""
+    options = [(permutations // rows, rows) for rows in range(1, permutations + 1) if permutations // rows]
+    return min(options, key=lambda option: abs((1 / option[0]) ** (1 / option[1]) - threshold))
+
+
+class MinHasher:
+    """MinHash signatures over hashed shingles, using (a * x + b) mod p as the permutations.
+    
+    Uses numpy when it is installed, which is much faster for large corpora, and the
+    same arithmetic in plain Python otherwise.
+    """
+    
+    def __init__(self, permutations=MINHASH_PERMUTATIONS, seed=1):
+        rng = random.Random(seed)
+        self.permutations = permutations
+        self.a = [rng.randrange(1, MINHASH_PRIME) for _ in range(permutations)]
+        self.b = [rng.randrange(0, MINHASH_PRIME) for _ in range(permutations)]
+        self._shingle_hashes = {}
+        try:
+            import numpy
+        except ImportError:
+            self._numpy = None
+        else:
+            self._numpy = numpy
+            self._a = numpy.array(self.a, dtype=numpy.uint64)
+            self._b = numpy.array(self.b, dtype=numpy.uint64)
+    
+    def signature(self, shingles):
+        if not shingles:
+            return (MINHASH_PRIME,) * self.permutations
+        if self._numpy is not None:
+            np = self._numpy
+            values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+            # a < 2^31 and crc32 values < 2^32, so the products fit in uint64
+            return tuple(((np.outer(values, self._a) + self._b) % MINHASH_PRIME).min(axis=0).tolist())
+        # Titles share most of their shingles, so each shingle's hash values are computed once
+        # and a signature is the element-wise minimum over its shingles'
+        columns = []
+        for shingle in shingles:
+            values = self._shingle_hashes.get(shingle)
+            if values is None:
+                if len(self._shingle_hashes) >= MINHASH_SHINGLE_CACHE_SIZE:
+                    self._shingle_hashes.clear()
+                values = self._shingle_hashes[shingle] = tuple((a * shingle + b) % MINHASH_PRIME for a, b in zip(self.a, self.b))
+            columns.append(values)
+        return tuple(map(min, zip(*columns)))
+
+
+def find_near_duplicates(jobs, threshold=NEAR_DUPLICATE_THRESHOLD, permutations=MINHASH_PERMUTATIONS):
+    """Group jobs whose title + company are at least `threshold` similar (estimated Jaccard).
+    
+    Jobs sharing an LSH band are compared with the first job that landed in that bucket
+    rather than with each other, so the work stays linear in the number of jobs even when
+    one posting is repeated thousands of times. Pairs that both have descriptions must
+    also have descriptions that similar. Returns clusters of two or more job indexes.
+    """
+    hasher = MinHasher(permutations)
+    bands, rows = lsh_bands(permutations, threshold)
+    signatures = [hasher.signature(title_shingles(job)) for job in jobs]
+    descriptions = {}
+    
+    def description(index):
+        if index not in descriptions:
+            descriptions[index] = description_shingles(jobs[index])
+        return descriptions[index]
+    
+    def similar(i, j):
+        agree = sum(1 for x, y in zip(signatures[i], signatures[j]) if x == y) / permutations
+        if agree < threshold:
+            return False
+        first, second = description(i), description(j)
+        if first is None or second is None:
+            return True
+        return len(first & second) / len(first | second) >= threshold
+    
+    parent = list(range(len(jobs)))
+    
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+    
+    for band in range(bands):
+        buckets = {}
+        for index, signature in enumerate(signatures):
+            key = signature[band * rows:(band + 1) * rows]
+            first = buckets.setdefault(key, index)
+            if first != index and find(first) != find(index) and similar(first, index):
+                parent[find(index)] = find(first)
+    
+    clusters = {}
+    for index in range(len(jobs)):
+        clusters.setdefault(find(index), []).append(index)
+    return [members for members in clusters.values() if len(members) > 1]
+
+
+def collapse_near_duplicates(jobs, threshold=NEAR_DUPLICATE_THRESHOLD):
+    """Replace each cluster of near-duplicate jobs with its newest posting, listing the others' links and locations."""
+    clusters = find_near_duplicates(jobs, threshold)
+    if not clusters:
+        return jobs
+    dropped = set()
+    for members in clusters:
+        members.sort(key=lambda index: job_sort_key(jobs[index]), reverse=True)
+        canonical = jobs[members[0]]
+        links, locations = list(canonical.get("variant_links") or []), list(canonical.get("variant_locations") or [])
+        for index in members[1:]:
+            variant = jobs[index]
+            for link in [variant.get("link")] + list(variant.get("variant_links") or []):
+                if link and link != canonical.get("link") and link not in links:
+                    links.append(link)
+            for location in [variant.get("location")] + list(variant.get("variant_locations") or []):
+                if location and location != canonical.get("location") and location not in locations:
+                    locations.append(location)
+            dropped.add(index)
+        canonical["variant_links"] = links
+        canonical["variant_locations"] = locations
+    logger.info(f"Collapsed {len(dropped) + len(clusters)} near-duplicate jobs into {len(clusters)} "
+                f"(similarity threshold {threshold})")
+    return [job for index, job in enumerate(jobs) if index not in dropped]
+
+
+# Full-text index of the job store behind `job_scraper.py query`; title matches rank above company, location and description
+SEARCH_INDEX_COLUMNS = ["title", "company", "location", "description"]
+SEARCH_INDEX_WEIGHTS = [10.0, 5.0, 2.0, 1.0]
+# Every indexed job has "1" in this extra column; FTS5 has no unary NOT, so `NOT intern` is read as "all jobs NOT intern"
+SEARCH_INDEX_ALL_COLUMN = "all_jobs"
+SEARCH_INDEX_ALL_JOBS = f'{SEARCH_INDEX_ALL_COLUMN} : "1"'
+# Column filter for terms without a field, which keeps them out of the all-jobs column
+SEARCH_INDEX_TEXT_COLUMNS = "{" + " ".join(SEARCH_INDEX_COLUMNS) + "}"
+SEARCH_QUERY_TOKEN = re.compile(r'[^\s()"]*"[^"]*"\*?|[()]|[^\s()"]+')
+SEARCH_QUERY_OPERATORS = {"AND", "OR", "NOT"}
+
+
+def fts_query(text):
+    """Turn a query such as `data* AND (company:acme OR company:"big corp") NOT intern` into an FTS5 MATCH expression.
+    
+    AND, OR, NOT (uppercase), parentheses, "phrases", a trailing * for prefix matches and
+    title:, company:, location: or description: in front of a term are kept; terms side by
+    side must all match. Every term is quoted, so words like c++ or node.js don't trip FTS5.
+    A NOT with nothing before it excludes from all jobs, operators with nothing to join are
+    dropped and parentheses are balanced. Raises ValueError for a field with no term.
+    """
+    parts, depth = [], 0
+    
+    def follows_operand():
+        return bool(parts) and parts[-1] not in SEARCH_QUERY_OPERATORS | {"("}
+    
+    def drop_dangling(groups=False):
+        # Trailing operators (and, at the end of the query, unclosed parentheses) have nothing to act on
+        nonlocal depth
+        while parts and (parts[-1] in SEARCH_QUERY_OPERATORS or groups and parts[-1] == "("):
+            token = parts.pop()
+            if token == "(":
+                depth -= 1
+            elif token == "NOT" and parts and parts[-1] == SEARCH_INDEX_ALL_JOBS:
+                parts.pop()
+    
+    for token in SEARCH_QUERY_TOKEN.findall(text):
+        if token == ")":
+            if not depth:
+                continue
+            drop_dangling()
+            depth -= 1
+            if parts[-1] == "(":
+                parts.pop()
+            else:
+                parts.append(")")
+            continue
+        if token in SEARCH_QUERY_OPERATORS:
+            if follows_operand():
+                parts.append(token)
+            elif token == "NOT" and (not parts or parts[-1] != "NOT"):
+                parts += [SEARCH_INDEX_ALL_JOBS, "NOT"]
+            continue
+        if token == "(":
+            phrase = token
+            depth += 1
+        else:
+            column, separator, term = token.partition(":")
+            if separator and column.lower() in SEARCH_INDEX_COLUMNS:
+                if not term.rstrip("*").strip('"'):
+                    raise ValueError(f"'{token}' needs a term after the colon, e.g. {column.lower()}:python")
+            else:
+                column, term = "", token
+            prefix = term.endswith("*")
+            term = term.rstrip("*").strip('"')
+            if not term:
+                continue
+            phrase = '"' + term.replace('"', '""') + '"' + ("*" if prefix else "")
+            phrase = f"{column.lower() or SEARCH_INDEX_TEXT_COLUMNS} : {phrase}"
+        # FTS5 only reads side by side phrases as AND, not a phrase next to a group
+        if follows_operand():
+            parts.append("AND")
+        parts.append(phrase)
+    drop_dangling(groups=True)
+    return " ".join(parts + [")"] * depth)
+
+
+class JobStore:
+    """SQLite store of every job seen across runs, keyed by the canonical LinkedIn job id."""
+    
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        job_id TEXT PRIMARY KEY,
+        source TEXT NOT NULL,
+        title TEXT,
+        company TEXT,
+        location TEXT,
+        link TEXT,
+        date_posted TEXT,
+        posted_epoch INTEGER,
+        first_seen TEXT NOT NULL,
+        last_seen TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS job_searches (
+        job_id TEXT NOT NULL,
+        search TEXT NOT NULL,
+        first_seen TEXT NOT NULL,
+        last_seen TEXT NOT NULL,
+        PRIMARY KEY (job_id, search)
+    );
+    CREATE TABLE IF NOT EXISTS job_details (
+        job_id TEXT PRIMARY KEY,
+        description TEXT,
+        seniority_level TEXT,
+        employment_type TEXT,
+        job_function TEXT,
+        industries TEXT,
+        applicants INTEGER,
+        enriched_at TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS query_stats (
+        search TEXT PRIMARY KEY,
+        runs INTEGER NOT NULL,
+        skipped INTEGER NOT NULL,
+        pages INTEGER NOT NULL,
+        jobs INTEGER NOT NULL,
+        unique_jobs INTEGER NOT NULL,
+        last_unique_page INTEGER NOT NULL,
+        last_run TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+    CREATE INDEX IF NOT EXISTS idx_jobs_location ON jobs (location);
+    CREATE INDEX IF NOT EXISTS idx_jobs_date_posted ON jobs (date_posted);
+    CREATE INDEX IF NOT EXISTS idx_job_searches_search ON job_searches (search);
+    """
+    
+    # FTS5 rows are keyed by the docids of job_index_docs, since the implicit rowids of jobs can change on VACUUM.
+    # c++ and c# stay whole words.
+    SEARCH_INDEX_SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS job_index_docs (
+        docid INTEGER PRIMARY KEY,
+        job_id TEXT NOT NULL UNIQUE
+    );
+    CREATE VIRTUAL TABLE IF NOT EXISTS job_index USING fts5(
+        {", ".join(SEARCH_INDEX_COLUMNS + [SEARCH_INDEX_ALL_COLUMN])},
+        tokenize = "unicode61 remove_diacritics 2 tokenchars '+#'",
+        prefix = '2 3'
+    );
+    """
+    
+    EXPORT_FIELDS = ["source", "title", "company", "location", "link", "date_posted", "posted_epoch"]
+    
+    def __init__(self, path):
+        self.path = path
+        # Overlap between searches is counted from here on, i.e. within one run (or daemon lifetime)
+        self.opened_at = datetime.now().isoformat(timespec="seconds")
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        # WAL lets concurrent workers read while another one writes
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+        self._add_posted_epoch()
+        self.conn.commit()
+        self.search_index = self._add_search_index()
+    
+    def _add_posted_epoch(self):
+        """Add and fill the posted_epoch column in stores created before it existed."""
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(jobs)")]
+        if "posted_epoch" not in columns:
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN posted_epoch INTEGER")
+            # Relative dates were relative to when the job was first seen
+            rows = self.conn.execute("SELECT job_id, date_posted, first_seen FROM jobs").fetchall()
+            self.conn.executemany("UPDATE jobs SET posted_epoch = ? WHERE job_id = ?", [
+                (posted_epoch(date_posted, datetime.fromisoformat(first_seen).timestamp()), job_id)
+                for job_id, date_posted, first_seen in rows
+            ])
+            logger.info(f"Added posted_epoch to {len(rows)} jobs in {self.path}")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_posted_epoch ON jobs (posted_epoch)")
+    
+    def _add_search_index(self):
+        """Create the full-text index and fill it in stores created before it existed; False if SQLite has no FTS5."""
+        try:
+            self.conn.executescript(self.SEARCH_INDEX_SCHEMA)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Full-text job index disabled, SQLite was built without FTS5: {e}")
+            return False
+        with self.conn:
+            # Indexes built before the all-jobs column are rebuilt with it
+            if SEARCH_INDEX_ALL_COLUMN not in [row[1] for row in self.conn.execute("PRAGMA table_info(job_index)")]:
+                self.conn.execute("DROP TABLE job_index")
+                self.conn.executescript(self.SEARCH_INDEX_SCHEMA)
+                self.conn.execute("DELETE FROM job_index_docs")
+            if self.conn.execute("SELECT NOT EXISTS (SELECT 1 FROM job_index_docs)").fetchone()[0]:
+                indexed = self._index_jobs()
+                if indexed:
+                    logger.info(f"Added {indexed} jobs to the full-text index in {self.path}")
+        return True
+    
+    def _index_jobs(self, job_ids=None):
+        """(Re)index the given stored jobs, or all of them; the caller holds the transaction."""
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS index_ids (job_id TEXT PRIMARY KEY)")
+        self.conn.execute("DELETE FROM index_ids")
+        if job_ids is None:
+            self.conn.execute("INSERT INTO index_ids (job_id) SELECT job_id FROM jobs")
+        else:
+            self.conn.executemany("INSERT OR IGNORE INTO index_ids (job_id) VALUES (?)", ((job_id,) for job_id in job_ids))
+        self.conn.execute("INSERT OR IGNORE INTO job_index_docs (job_id) SELECT job_id FROM index_ids")
+        self.conn.execute("""
+            DELETE FROM job_index WHERE rowid IN (SELECT docid FROM job_index_docs JOIN index_ids USING (job_id))
+        """)
+        return self.conn.execute(f"""
+            INSERT INTO job_index (rowid, {", ".join(SEARCH_INDEX_COLUMNS + [SEARCH_INDEX_ALL_COLUMN])})
+            SELECT x.docid, j.title, j.company, j.location, d.description, '1'
+            FROM index_ids i JOIN job_index_docs x ON x.job_id = i.job_id JOIN jobs j ON j.job_id = i.job_id
+            LEFT JOIN job_details d ON d.job_id = i.job_id
+        """).rowcount
+    
+    def index_jobs(self, job_ids=None):
+        """Bring the full-text index up to date for the given job ids, or rebuild it for every stored job.
+        
+        Returns how many jobs were indexed (0 without FTS5).
+        """
+        if not self.search_index:
+            return 0
+        with self._lock, self.conn:
+            indexed = self._index_jobs(job_ids)
+            # A full rebuild is the moment to merge the index's segments
+            if job_ids is None:
+                self.conn.execute("INSERT INTO job_index (job_index) VALUES ('optimize')")
+        return indexed
+    
+    def search_jobs(self, query=None, since=None, until=None, limit=20, offset=0, order="date"):
+        """Return (number of matches, one page of matching jobs) for a query in fts_query syntax.
+        
+        since and until bound posted_epoch (Unix seconds, until exclusive). Jobs come newest
+        first, or best match first with order="relevance", with the same fields as export_jobs.
+        """
+        match = fts_query(query) if query else ""
+        if match and not self.search_index:
+            raise sqlite3.OperationalError("the full-text index is not available (SQLite was built without FTS5)")
+        fields = ", ".join([f"j.{field}" for field in self.EXPORT_FIELDS] + [f"d.{field}" for field in DETAIL_FIELDS])
+        joins, conditions, params = "", [], []
+        if match:
+            joins = "JOIN job_index_docs x ON x.job_id = j.job_id JOIN job_index ON job_index.rowid = x.docid"
+            conditions.append("job_index MATCH ?")
+            params.append(match)
+        if since is not None:
+            conditions.append("j.posted_epoch >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("j.posted_epoch < ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        newest = "j.posted_epoch IS NULL, j.posted_epoch DESC"
+        order_by = f"bm25(job_index, {', '.join(map(str, SEARCH_INDEX_WEIGHTS + [0.0]))}), {newest}" if match and order == "relevance" else newest
+        # Without a date range the matches can be counted without joining them to the jobs
+        count = ("SELECT COUNT(*) FROM job_index WHERE job_index MATCH ?" if match and len(params) == 1
+                 else f"SELECT COUNT(*) FROM jobs j {joins} {where}")
+        with self._lock, self.conn:
+            total = self.conn.execute(count, params).fetchone()[0]
+            rows = self.conn.execute(f"""
+                SELECT {fields} FROM jobs j {joins} LEFT JOIN job_details d ON d.job_id = j.job_id
+                {where} ORDER BY {order_by} LIMIT ? OFFSET ?
+            """, params + [limit, offset]).fetchall()
+        columns = self.EXPORT_FIELDS + DETAIL_FIELDS
+        return total, [{field: value for field, value in zip(columns, row) if field in self.EXPORT_FIELDS or value is not None}
+                       for row in rows]
+    
+    def upsert_jobs(self, jobs, search):
+        """Insert or refresh a page of jobs in one transaction and record the search that found them.
+        
+        Returns how many of the jobs no other search has found since this store was opened,
+        which is what the search planner measures a query's yield by.
+        """
+        if not jobs:
+            return 0
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = []
+        for job in jobs:
+            # Clean up any excessive whitespace in text fields
+            text = {field: " ".join(job[field].split()) if isinstance(job.get(field), str) else job.get(field)
+                    for field in ("title", "company", "location")}
+            rows.append((job_key(job), job.get("source", "LinkedIn"), text["title"], text["company"], text["location"],
+                         job.get("link"), job.get("date_posted"), job.get("posted_epoch"), now, now))
+        
+        with self._lock, self.conn:
+            overlap = self.conn.execute(f"""
+                SELECT COUNT(DISTINCT job_id) FROM job_searches
+                WHERE job_id IN ({', '.join('?' * len(rows))}) AND search != ? AND last_seen >= ?
+            """, [row[0] for row in rows] + [search, self.opened_at]).fetchone()[0]
+            self.conn.executemany("""
+                INSERT INTO jobs (job_id, source, title, company, location, link, date_posted, posted_epoch, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (job_id) DO UPDATE SET
+                    title = excluded.title,
+                    company = excluded.company,
+                    location = excluded.location,
+                    link = excluded.link,
+                    date_posted = excluded.date_posted,
+                    posted_epoch = excluded.posted_epoch,
+                    last_seen = excluded.last_seen
+            """, rows)
+            self.conn.executemany("""
+                INSERT INTO job_searches (job_id, search, first_seen, last_seen)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (job_id, search) DO UPDATE SET last_seen = excluded.last_seen
+            """, [(row[0], search, now, now) for row in rows])
+        return len(rows) - overlap
+    
+    def found_since(self, search, since):
+        """Ids of the jobs a search has found (again) since `since`, an ISO timestamp like first_seen."""
+        with self._lock:
+            return [row[0] for row in self.conn.execute(
+                "SELECT job_id FROM job_searches WHERE search = ? AND last_seen >= ?", (search, since))]
+    
+    def record_query(self, search, pages, jobs, unique_jobs, last_unique_page):
+        """Save what a search's latest run yielded: pages loaded, jobs, jobs no other search found and the last page with one."""
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._lock, self.conn:
+            self.conn.execute("""
+                INSERT INTO query_stats (search, runs, skipped, pages, jobs, unique_jobs, last_unique_page, last_run)
+                VALUES (?, 1, 0, ?, ?, ?, ?, ?)
+                ON CONFLICT (search) DO UPDATE SET
+                    runs = runs + 1, skipped = 0, pages = excluded.pages, jobs = excluded.jobs,
+                    unique_jobs = excluded.unique_jobs, last_unique_page = excluded.last_unique_page, last_run = excluded.last_run
+            """, (search, pages, jobs, unique_jobs, last_unique_page, now))
+    
+    def skip_queries(self, searches):
+        """Count one more consecutive run in which the planner skipped each of these searches."""
+        with self._lock, self.conn:
+            self.conn.executemany("UPDATE query_stats SET skipped = skipped + 1 WHERE search = ?", [(search,) for search in searches])
+    
+    def query_stats(self):
+        """Return {search: latest run stats} for every search recorded so far."""
+        columns = ["runs", "skipped", "pages", "jobs", "unique_jobs", "last_unique_page"]
+        with self._lock, self.conn:
+            rows = self.conn.execute(f"SELECT search, {', '.join(columns)} FROM query_stats").fetchall()
+        return {row[0]: dict(zip(columns, row[1:])) for row in rows}
+    
+    def upsert_job_details(self, details):
+        """Save enrichment fields, given as {job id: {field: value}}, in one transaction."""
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = [(job_id,) + tuple(fields.get(field) for field in DETAIL_FIELDS) + (now,)
+                for job_id, fields in details.items()]
+        columns = ", ".join(DETAIL_FIELDS)
+        with self._lock, self.conn:
+            self.conn.executemany(f"""
+                INSERT OR REPLACE INTO job_details (job_id, {columns}, enriched_at)
+                VALUES ({", ".join("?" * (len(DETAIL_FIELDS) + 2))})
+            """, rows)
+        return len(rows)
+    
+    def job_details(self, job_ids):
+        """Return {job id: details} for the given ids that have already been enriched."""
+        job_ids = list(job_ids)
+        if not job_ids:
+            return {}
+        columns = ", ".join(DETAIL_FIELDS)
+        with self._lock, self.conn:
+            rows = self.conn.execute(
+                f"SELECT job_id, {columns} FROM job_details WHERE job_id IN ({', '.join('?' * len(job_ids))})", job_ids
+            ).fetchall()
+        return {row[0]: {field: value for field, value in zip(DETAIL_FIELDS, row[1:]) if value is not None} for row in rows}
+    
+    def export_jobs(self, job_ids=None):
+        """Return stored jobs (all of them, or just job_ids) as dicts, newest first, with any enrichment fields."""
+        fields = ", ".join([f"j.{field}" for field in self.EXPORT_FIELDS] + [f"d.{field}" for field in DETAIL_FIELDS])
+        with self._lock, self.conn:
+            if job_ids is None:
+                cursor = self.conn.execute(f"""
+                    SELECT {fields} FROM jobs j LEFT JOIN job_details d ON d.job_id = j.job_id
+                    ORDER BY j.source DESC, j.posted_epoch DESC
+                """)
+            else:
+                # Join against a temp table rather than a giant IN (...) list
+                self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS export_ids (job_id TEXT PRIMARY KEY)")
+                self.conn.execute("DELETE FROM export_ids")
+                self.conn.executemany("INSERT OR IGNORE INTO export_ids (job_id) VALUES (?)", ((job_id,) for job_id in job_ids))
+                cursor = self.conn.execute(f"""
+                    SELECT {fields} FROM jobs j JOIN export_ids e ON e.job_id = j.job_id
+                    LEFT JOIN job_details d ON d.job_id = j.job_id
+                    ORDER BY j.source DESC, j.posted_epoch DESC
+                """)
+            # Jobs that were never enriched keep the original set of keys
+            columns = self.EXPORT_FIELDS + DETAIL_FIELDS
+            return [{field: value for field, value in zip(columns, row) if field in self.EXPORT_FIELDS or value is not None}
+                    for row in cursor.fetchall()]
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+# Record/replay cache of fetched pages: gzipped HTML blobs named by content hash plus a SQLite index
+PAGE_CACHE_DIR = os.path.join("output", "page_cache")
+DEFAULT_PAGE_CACHE_TTL_HOURS = 24
+DEFAULT_PAGE_CACHE_SIZE_MB = 500
+# Query parameters that only track the click and never change the page that is served
+TRACKING_PARAMS = {"refId", "trackingId", "position", "pageNum", "eBP"}
+
+
+def normalize_url(url):
+    """Lowercase scheme and host, drop tracking params and the fragment, and sort the query."""
+    parts = urllib.parse.urlsplit(url)
+    query = sorted((name, value) for name, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+                   if name not in TRACKING_PARAMS)
+    return urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/",
+                                    urllib.parse.urlencode(query), ""))
+
+
+class PageCache:
+    """On-disk cache of fetched search and detail pages, keyed by normalized URL plus engine.
+    
+    Page bodies are stored once per content hash, so identical pages under different URLs
+    share a blob. Entries older than ttl seconds are fetched again, and the least recently
+    used ones are evicted once the blobs take more than max_bytes. An offline cache serves
+    every entry it has regardless of age and the scrapers never touch the network (--replay).
+    """
+    
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS pages (
+        key TEXT PRIMARY KEY,
+        engine TEXT NOT NULL,
+        url TEXT NOT NULL,
+        digest TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        fetched_at REAL NOT NULL,
+        last_used REAL NOT NULL,
+        offset_pages INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE INDEX IF NOT EXISTS idx_pages_last_used ON pages (last_used);
+    CREATE INDEX IF NOT EXISTS idx_pages_digest ON pages (digest);
+    """
+    
+    def __init__(self, directory=PAGE_CACHE_DIR, ttl=DEFAULT_PAGE_CACHE_TTL_HOURS * 3600,
+                 max_bytes=DEFAULT_PAGE_CACHE_SIZE_MB * 2**20, offline=False):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        os.makedirs(os.path.join(directory, "blobs"), exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(directory, "index.db"), timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(self.SCHEMA)
+        # Caches created before offset_pages existed
+        if "offset_pages" not in [row[1] for row in self.conn.execute("PRAGMA table_info(pages)")]:
+            self.conn.execute("ALTER TABLE pages ADD COLUMN offset_pages INTEGER NOT NULL DEFAULT 0")
+        self.conn.commit()
+    
+    @staticmethod
+    def cache_key(url, engine):
+        return hashlib.sha256(f"{engine} {normalize_url(url)}".encode("utf-8")).hexdigest()
+    
+    def _blob_path(self, digest):
+        return os.path.join(self.directory, "blobs", digest[:2], f"{digest}.html.gz")
+    
+    def get(self, url, engine):
+        """Return the cached HTML for the URL, or None if it is missing or (unless offline) expired."""
+        key = self.cache_key(url, engine)
+        with self._lock:
+            row = self.conn.execute("SELECT digest, fetched_at FROM pages WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        digest, fetched_at = row
+        if not self.offline and self.ttl and time.time() - fetched_at > self.ttl:
+            return None
+        try:
+            with gzip.open(self._blob_path(digest), "rt", encoding="utf-8") as f:
+                html = f.read()
+        except OSError:
+            # Blob removed by hand or by another process's eviction
+            with self._lock, self.conn:
+                self.conn.execute("DELETE FROM pages WHERE key = ?", (key,))
+            return None
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE pages SET last_used = ? WHERE key = ?", (time.time(), key))
+        return html
+    
+    def offset_pages(self, url, engine):
+        """True if the cached page was the first page of a --tabs crawl, which recorded the
+        following pages under their start= offsets; a scrolled page holds all of its results."""
+        with self._lock:
+            row = self.conn.execute("SELECT offset_pages FROM pages WHERE key = ?", (self.cache_key(url, engine),)).fetchone()
+        return bool(row and row[0])
+    
+    def put(self, url, engine, html, offset_pages=False):
+        """Record a fetched page, then evict the least recently used pages if the cache is over budget."""
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        
+        key = self.cache_key(url, engine)
+        now = time.time()
+        with self._lock, self.conn:
+            previous = self.conn.execute("SELECT digest FROM pages WHERE key = ?", (key,)).fetchone()
+            self.conn.execute("""
+                INSERT OR REPLACE INTO pages (key, engine, url, digest, size, fetched_at, last_used, offset_pages)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, engine, normalize_url(url), digest, os.path.getsize(path), now, now, int(offset_pages)))
+            if previous and previous[0] != digest:
+                self._remove_unreferenced([previous[0]])
+            self._evict()
+    
+    def _remove_unreferenced(self, digests):
+        """Delete the blobs no entry points to any more (caller holds the lock)."""
+        for digest in set(digests):
+            if self.conn.execute("SELECT 1 FROM pages WHERE digest = ? LIMIT 1", (digest,)).fetchone() is None:
+                try:
+                    os.remove(self._blob_path(digest))
+                except OSError:
+                    pass
+    
+    def _total_bytes(self):
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM pages)").fetchone()[0]
+    
+    def _evict(self):
+        """Drop least recently used entries until the blobs fit in max_bytes (caller holds the lock)."""
+        if not self.max_bytes:
+            return
+        total = self._total_bytes()
+        while total > self.max_bytes:
+            # Pick the oldest entries that add up to the excess (shared blobs may free less, hence the loop)
+            evicted, freed = [], 0
+            for key, digest, size in self.conn.execute("SELECT key, digest, size FROM pages ORDER BY last_used"):
+                evicted.append((key, digest))
+                freed += size
+                if freed >= total - self.max_bytes:
+                    break
+            if not evicted:
+                break
+            self.conn.executemany("DELETE FROM pages WHERE key = ?", [(key,) for key, _ in evicted])
+            self._remove_unreferenced(digest for _, digest in evicted)
+            total = self._total_bytes()
+            logger.debug(f"Evicted {len(evicted)} pages from the page cache ({total / 2**20:.1f} MB left)")
+    
+    def stats(self):
+        """Number of cached pages and bytes on disk."""
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            return {"pages": entries, "bytes": self._total_bytes()}
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class JsonlWriter:
+    """Append-only JSONL stream of accepted jobs that survives a crashed or killed run.
+    
+    Every job is written as one line as soon as it is accepted. The file is flushed every
+    flush_every lines and fsynced at most every fsync_interval seconds.
+    """
+    
+    def __init__(self, path, flush_every=10, fsync_interval=5.0):
+        self.path = path
+        self.flush_every = flush_every
+        self.fsync_interval = fsync_interval
+        self.count = 0
+        self._pending = 0
+        self._last_sync = time.time()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+    
+    def write(self, job):
+        line = json.dumps(job_as_dict(job), ensure_ascii=False)
+        with self._lock:
+            # A worker may still be finishing a card after the run was interrupted and the stream closed
+            if self._file.closed:
+                return
+            self._file.write(line + "\n")
+            self.count += 1
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._flush()
+    
+    def flush(self):
+        with self._lock:
+            if not self._file.closed:
+                self._flush()
+    
+    def _flush(self):
+        self._file.flush()
+        self._pending = 0
+        if time.time() - self._last_sync >= self.fsync_interval:
+            os.fsync(self._file.fileno())
+            self._last_sync = time.time()
+    
+    def close(self):
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+
+def read_jsonl(path):
+    """Yield the jobs in a JSONL stream, skipping a line left truncated by a crash."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable line {line_number} in {path}")
+
+
+# Crawl budget per search (config.json's max_pages/max_jobs, per title under crawl_budgets, or --max-pages/--max-jobs);
+# the search planner may shorten the pages
+DEFAULT_PAGES_TO_SCRAPE = 5
+DEFAULT_MAX_JOBS = 100
+# Result pages loaded at once with --tabs; each is a browser tab or a pooled HTTP connection
+MAX_TABS = 8
+
+
+def tabs_count(value):
+    """argparse type for --tabs: a whole number from 1 to MAX_TABS."""
+    try:
+        tabs = int(value)
+    except ValueError:
+        tabs = 0
+    if not 1 <= tabs <= MAX_TABS:
+        raise argparse.ArgumentTypeError(f"expected a number of tabs from 1 to {MAX_TABS}, got {value!r}")
+    return tabs
+
+# Both engines wait on this results list wrapper after loading a search page
+RESULTS_LIST_SELECTOR = ".jobs-search__results-list, .job-search-resultsList"
+
+# Chrome's memory grows with every navigation and infinite-scroll page, so between searches the browser is
+# restarted once its process tree uses this many MB or has served this many pages. Above
+# BROWSER_SOFT_RECYCLE_RATIO of the memory limit it is only emptied (about:blank, cleared cache, GC)
+DEFAULT_BROWSER_MEMORY_MB = 1500
+DEFAULT_BROWSER_MAX_PAGES = 200
+BROWSER_SOFT_RECYCLE_RATIO = 0.6
+
+
+def process_tree_rss(pid, descendants=True):
+    """Resident memory in bytes of a process and all of its descendants (or, with descendants=False,
+    of the process alone), or None if it can't be read.
+    
+    Uses psutil when it is installed and /proc otherwise, so it works without extra packages on Linux.
+    """
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + (root.children(recursive=True) if descendants else [])
+        except psutil.Error:
+            return None
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                pass
+        return total
+    
+    if not os.path.isdir("/proc"):
+        return None
+    rss, children = {}, {}
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    for entry in os.listdir("/proc") if descendants else [str(pid)]:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "rb") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name may contain spaces; the fields after its closing parenthesis start at the state
+        fields = stat[stat.rfind(b")") + 2:].split()
+        rss[int(entry)] = int(fields[21]) * page_size
+        children.setdefault(int(fields[1]), []).append(int(entry))
+    if pid not in rss:
+        return None
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        total += rss.get(current, 0)
+        pending.extend(children.get(current, []))
+    return total
+
+
+# Page-level retries: exponential backoff with jitter, capped
+DEFAULT_RETRIES = 3
+RETRY_BACKOFF_BASE = 2.0
+RETRY_BACKOFF_MAX = 60.0
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Request budget per host shared by every search of a run
+DEFAULT_REQUESTS_PER_MINUTE = 30
+DEFAULT_RATE_LIMIT_BURST = 3
+
+
+def backoff_delay(attempt, base=RETRY_BACKOFF_BASE, cap=RETRY_BACKOFF_MAX):
+    """Delay before retry number attempt + 1: half of base * 2**attempt (capped) plus up to as much again at random."""
+    delay = min(cap, base * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def error_summary(error):
+    """First line of an exception message, e.g. without Selenium's stack trace."""
+    message = str(error).strip()
+    return message.splitlines()[0] if message else type(error).__name__
+
+
+class RateLimiter:
+    """Token bucket per host, shared by every search and worker of a run.
+    
+    Each host refills requests_per_minute tokens per minute, holding at most `burst`. A request
+    takes a token, waiting for the next one when the bucket is empty. A rate of 0 disables limiting.
+    """
+    
+    def __init__(self, requests_per_minute=DEFAULT_REQUESTS_PER_MINUTE, burst=DEFAULT_RATE_LIMIT_BURST):
+        self.requests_per_minute = requests_per_minute
+        self.burst = max(1, burst)
+        self._buckets = {}
+        self._lock = threading.Lock()
+    
+    def acquire(self, url):
+        """Wait for a request slot for the URL's host and return how long that took."""
+        if not self.requests_per_minute or self.requests_per_minute <= 0:
+            return 0.0
+        rate = self.requests_per_minute / 60.0
+        host = urllib.parse.urlsplit(url).netloc or url
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, updated = self._buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - updated) * rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return waited
+                self._buckets[host] = (tokens, now)
+                delay = (1 - tokens) / rate
+            time.sleep(delay)
+            waited += delay
+
+
+class JobEnricher:
+    """Fetch job detail pages concurrently and add their fields to job records.
+    
+    One pooled requests.Session and a bounded thread pool are shared by every scraper
+    of a run, so `concurrency` caps detail requests in flight across all workers. Job
+    ids enriched earlier in the run or found in the job store are not fetched again.
+    """
+    
+    def __init__(self, detail_url=LINKEDIN_JOB_DETAIL_URL, concurrency=4, timeout=10, rate_limiter=None, page_cache=None):
+        self.detail_url = detail_url
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.page_cache = page_cache
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "User-Agent": random.choice(USER_AGENTS),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+        })
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="enrich")
+        self._details = {}
+        self._lock = threading.Lock()
+    
+    def enrich(self, jobs, store=None, metrics=None):
+        """Add detail fields to the jobs in place and return how many detail pages were fetched."""
+        metrics = metrics if metrics is not None else RunMetrics()
+        jobs_by_id = {}
+        for job in jobs:
+            job_id = canonical_job_id(job.get("link"))
+            if job_id:
+                jobs_by_id.setdefault(job_id, []).append(job)
+        if not jobs_by_id:
+            return 0
+        
+        with self._lock:
+            known = {job_id: self._details[job_id] for job_id in jobs_by_id if job_id in self._details}
+        if store is not None:
+            try:
+                known.update(store.job_details([job_id for job_id in jobs_by_id if job_id not in known]))
+            except sqlite3.Error as e:
+                logger.warning(f"Error reading job details from store: {e}")
+        
+        missing = [job_id for job_id in jobs_by_id if job_id not in known]
+        metrics.count("details_skipped", len(jobs_by_id) - len(missing))
+        fetched = {}
+        futures = {self._executor.submit(self._fetch, job_id, metrics): job_id for job_id in missing}
+        for future in as_completed(futures):
+            details = future.result()
+            if details:
+                fetched[futures[future]] = details
+        
+        if fetched:
+            with self._lock:
+                self._details.update(fetched)
+            if store is not None:
+                try:
+                    store.upsert_job_details(fetched)
+                except sqlite3.Error as e:
+                    metrics.count("store_errors")
+                    logger.error(f"Error saving job details to store: {e}")
+        
+        known.update(fetched)
+        for job_id, details in known.items():
+            for job in jobs_by_id[job_id]:
+                job.update(details)
+        logger.debug(f"Enriched {len(known)} of {len(jobs_by_id)} jobs ({len(fetched)} detail pages fetched)")
+        return len(fetched)
+    
+    def _fetch(self, job_id, metrics):
+        """Fetch and parse one detail page; None if it failed (it is retried on a later run)."""
+        url = self.detail_url.format(job_id=job_id)
+        if self.page_cache is not None:
+            html = self.page_cache.get(url, "detail")
+            metrics.count("page_cache_hits" if html is not None else "page_cache_misses")
+            if html is not None:
+                with metrics.timer("detail_parse"):
+                    return parse_job_detail(html)
+            if self.page_cache.offline:
+                return None
+        
+        if self.rate_limiter is not None:
+            waited = self.rate_limiter.acquire(url)
+            if waited:
+                metrics.observe("rate_limit_wait", waited)
+        try:
+            metrics.count("detail_requests")
+            with metrics.timer("detail_fetch"):
+                response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            metrics.count("detail_errors")
+            logger.debug(f"Error fetching details of job {job_id}: {error_summary(e)}")
+            return None
+        if response.status_code != 200:
+            metrics.count("detail_errors")
+            logger.debug(f"Job detail page for {job_id} returned HTTP {response.status_code}")
+            return None
+        
+        if self.page_cache is not None:
+            try:
+                self.page_cache.put(url, "detail", response.text)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Could not save job detail page to the page cache: {e}")
+        with metrics.timer("detail_parse"):
+            return parse_job_detail(response.text)
+    
+    def close(self):
+        self._executor.shutdown(wait=True)
+        self.session.close()
+
+
+class RunMetrics:
+    """Phase timers and counters for one run, shared by every scraper and worker thread taking part in it.
+    
+    Phases (seconds spent, how often, longest): browser_startup, navigation, result_wait, extraction,
+    pagination, fetch, parse, store, enrichment, detail_fetch, detail_parse, retry_wait, rate_limit_wait,
+    save_results. Counters: pages_loaded, cards_seen, jobs_accepted, cards_skipped, duplicates_dropped,
+    selector_fallbacks, selector_plan_hits/misses, webdriver_commands, retries, detail_requests, ...
+    """
+    
     def __init__(self):
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.phases = {}
+        self.searches = []
+    
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+    
+    def observe(self, phase, seconds):
+        with self._lock:
+            stats = self.phases.setdefault(phase, {"count": 0, "seconds": 0.0, "max": 0.0})
+            stats["count"] += 1
+            stats["seconds"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+    
+    @contextmanager
+    def timer(self, phase):
+        """Time a block of code as one occurrence of a phase."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - started)
+    
+    def record_search(self, search, engine, progress, seconds, output_file, browser_memory=None):
+        record = dict(progress, search=search, engine=engine, seconds=round(seconds, 3), output_file=output_file)
+        # Peak and average MB of Chrome's process tree, sampled after every page (selenium engine only)
+        if browser_memory is not None:
+            record["browser_memory"] = browser_memory
+        with self._lock:
+            self.searches.append(record)
+    
+    def snapshot(self):
+        """The metrics collected so far as a JSON-serialisable document."""
+        with self._lock:
+            return {
+                "started_at": self.started_at.isoformat(timespec="seconds"),
+                "duration_seconds": round(time.perf_counter() - self._started, 3),
+                "counters": dict(sorted(self.counters.items())),
+                "phases": {phase: {"count": stats["count"], "seconds": round(stats["seconds"], 4), "max": round(stats["max"], 4)}
+                           for phase, stats in sorted(self.phases.items())},
+                "searches": list(self.searches),
+            }
+    
+    def write_json(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        _write_json_atomic(path, self.snapshot(), indent=2)
+    
+    def write_prometheus(self, path):
+        """Write the metrics in the Prometheus text format, e.g. for node_exporter's textfile collector."""
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP job_scraper_run_duration_seconds Wall time of the last run.",
+            "# TYPE job_scraper_run_duration_seconds gauge",
+            f"job_scraper_run_duration_seconds {snapshot['duration_seconds']}",
+            "# HELP job_scraper_last_run_timestamp_seconds When the last run finished.",
+            "# TYPE job_scraper_last_run_timestamp_seconds gauge",
+            f"job_scraper_last_run_timestamp_seconds {int(time.time())}",
+        ]
+        for name, value in snapshot["counters"].items():
+            metric = f"job_scraper_{re.sub(r'[^a-zA-Z0-9_]', '_', name)}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        for field, kind in [("seconds", "counter"), ("count", "counter"), ("max", "gauge")]:
+            metric = {"seconds": "job_scraper_phase_seconds_total", "count": "job_scraper_phase_runs_total",
+                      "max": "job_scraper_phase_max_seconds"}[field]
+            lines.append(f"# TYPE {metric} {kind}")
+            for phase, stats in snapshot["phases"].items():
+                lines.append(f'{metric}{{phase="{phase}"}} {stats[field]}')
+        
+        # Write and rename so the collector never reads a partial file
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temp_path, path)
+
+
+class JobScraper:
+    def __init__(self, extraction="batch", engine="selenium",
+                 search_url=LINKEDIN_SEARCH_URL, guest_search_url=LINKEDIN_GUEST_SEARCH_URL, wait_timeout=15,
+                 store_path=os.path.join("output", "jobs.db"), stream=None, startup_profile=False,
+                 block_resources=DEFAULT_BLOCKED_RESOURCES, max_jobs=DEFAULT_MAX_JOBS, pages_to_scrape=DEFAULT_PAGES_TO_SCRAPE,
+                 metrics=None, rate_limiter=None, retries=DEFAULT_RETRIES, selector_plan=None, enricher=None,
+                 page_cache=None, near_duplicate_threshold=0,
+                 browser_memory_mb=DEFAULT_BROWSER_MEMORY_MB, browser_max_pages=DEFAULT_BROWSER_MAX_PAGES, tabs=1):
         self.results = []
+        self.seen_job_ids = set()
         self.output_dir = "output"
         
+        # Progress of the current search (pages loaded, cards examined, jobs accepted) for status reporting
+        self.progress = {"pages": 0, "cards": 0, "jobs": 0}
+        
+        # Jobs the current query found that no other search had, and the last page with any, for the search planner
+        self.query_yield = {"unique_jobs": 0, "last_unique_page": 0}
+        
+        # "selenium" drives headless Chrome, "http" fetches guest result fragments with requests
+        self.engine = engine
+        self.search_url = search_url
+        self.guest_search_url = guest_search_url
+        
+        # Crawl limits per search (scrape_jobs can override them), and how many result pages after the
+        # first are loaded at once by their start= offset: browser tabs, or concurrent guest API requests
+        self.max_jobs = max_jobs
+        self.pages_to_scrape = pages_to_scrape
+        self.tabs = min(max(1, tabs), MAX_TABS)
+        
+        # Requests to LinkedIn are paced by a per-host token bucket (pass one RateLimiter to share it),
+        # and a failed navigation or page load is retried up to `retries` times with backoff
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.retries = retries
+        
+        # "batch" pulls every card on a page in one script call, "legacy" queries element by element
+        self.extraction = extraction
+        
+        # Winning selector per card field, tried first and saved to output/selector_plan.json
+        self.selector_plan = selector_plan if selector_plan is not None else SelectorPlan()
+        self.webdriver_commands = 0
+        
+        # Ceiling in seconds for page readiness waits; pages move on as soon as cards appear
+        self.wait_timeout = wait_timeout
+        self.page_timings = []
+        
         # Default filename (will be updated with search params later)
         current_date = datetime.now()
         date_str = current_date.strftime('%b%d_%Y')
@@ -29,13 +1814,80 @@ class JobScraper:
         # Ensure output directory exists
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
-            print(f"Created output directory: {self.output_dir}")
+            logger.debug(f"Created output directory: {self.output_dir}")
             
-        # Initialize Selenium for LinkedIn (which needs JavaScript)
-        self.setup_selenium()
+        # Persistent job store shared by every run; JSON files are exported from it
+        self.store = JobStore(store_path) if store_path else None
+        self.current_search = None
+        
+        # Optional JSONL stream (possibly shared between workers) that every accepted job is appended to
+        self.stream = stream
+        
+        # Optional JobEnricher that adds detail page fields to each page of jobs before it is stored
+        self.enricher = enricher
+        
+        # Optional PageCache that fetched pages are recorded to and served from (offline for --replay)
+        self.page_cache = page_cache
+        
+        # QueueTask of the current search when it came from a TaskQueue, checkpointed after every page
+        self.task = None
+        # Event set by ScraperPool on Ctrl-C; the running search then stops after its current page
+        self.stop = None
+        
+        # Reposts of one job this similar (title + company) are collapsed when results are saved; 0 keeps them all
+        self.near_duplicate_threshold = near_duplicate_threshold
+            
+        # Startup phases, printed once the first page has loaded when startup_profile is set
+        self.startup_profile = startup_profile
+        self.startup_timings = {}
+        
+        # Resource categories the browser never downloads, and per-page network totals
+        self.block_resources = list(block_resources or [])
+        self.network_totals = {"requests": 0, "bytes": 0, "blocked": 0}
+        
+        # Phase timings and counters; pass one RunMetrics to several scrapers to aggregate a run
+        self.metrics = metrics if metrics is not None else RunMetrics()
+        
+        # The browser is only started when something first uses self.driver
+        self._driver = None
+        
+        # Between searches the browser is recycled past these limits (0 disables a limit), or restarted if it crashed;
+        # browser_pages counts the pages the current browser has served, browser_memory holds this search's samples
+        self.browser_memory_mb = browser_memory_mb
+        self.browser_max_pages = browser_max_pages
+        self.browser_pages = 0
+        self.browser_memory = []
+        if self.engine == "http":
+            self.setup_http_session()
+    
+    @property
+    def driver(self):
+        """Selenium driver for LinkedIn (which needs JavaScript), started on first use."""
+        if self._driver is None:
+            with self.metrics.timer("browser_startup"):
+                self.setup_selenium()
+        return self._driver
+    
+    def _time_startup(self, phase, started):
+        self.startup_timings[phase] = time.perf_counter() - started
+    
+    def _report_startup(self):
+        """Log where the time to the first navigation went, once."""
+        if not self.startup_profile or "first_navigation" not in self.startup_timings or self.startup_timings.get("reported"):
+            return
+        self.startup_timings["reported"] = True
+        logger.info("Startup profile:")
+        for phase in ["import_selenium", "resolve_driver", "launch_chrome", "cdp_setup", "first_navigation"]:
+            if phase in self.startup_timings:
+                logger.info(f"  {phase:<18} {self.startup_timings[phase]:7.2f}s")
+        logger.info(f"  {'process_to_first_page':<18} {time.perf_counter() - PROCESS_STARTED:7.2f}s")
     
     def setup_selenium(self):
         """Set up headless Chrome browser for scraping."""
+        started = time.perf_counter()
+        load_selenium()
+        self._time_startup("import_selenium", started)
+        
         chrome_options = Options()
         
         # Headless mode
@@ -68,14 +1920,7 @@ class JobScraper:
         chrome_options.add_argument("--allow-running-insecure-content")
         
         # Add a rotating set of user agents to avoid detection
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ]
-        chrome_options.add_argument(f"user-agent={random.choice(user_agents)}")
+        chrome_options.add_argument(f"user-agent={random.choice(USER_AGENTS)}")
         
         # Set preferences to disable features
         chrome_prefs = {
@@ -83,7 +1928,8 @@ class JobScraper:
             "profile.default_content_setting_values.media_stream_camera": 2,  # Block camera
             "profile.default_content_setting_values.media_stream_mic": 2,  # Block microphone
             "profile.default_content_setting_values.geolocation": 2,  # Block location
-            "profile.managed_default_content_settings.images": 1,  # Load images (needed for many job sites)
+            # Images are only loaded when they aren't part of the blocking profile
+            "profile.managed_default_content_settings.images": 2 if "images" in self.block_resources else 1,
             "profile.default_content_setting_values.cookies": 1,  # Accept cookies (needed for many job sites)
         }
         chrome_options.add_experimental_option("prefs", chrome_prefs)
@@ -92,15 +1938,25 @@ class JobScraper:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
         
-        # Use webdriver-manager to handle chromedriver installation
+        # Record CDP network events so transfer sizes and blocked requests can be reported per page
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        
+        # Use the cached chromedriver, falling back to webdriver-manager when Chrome changed
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            print("Chrome WebDriver initialized successfully")
+            started = time.perf_counter()
+            service = Service(resolve_chromedriver())
+            self._time_startup("resolve_driver", started)
+            
+            started = time.perf_counter()
+            self._driver = webdriver.Chrome(service=service, options=chrome_options)
+            self._time_startup("launch_chrome", started)
+            self._count_webdriver_commands()
+            logger.debug("Chrome WebDriver initialized successfully")
             
             # Execute CDP commands to evade detection
+            started = time.perf_counter()
             try:
-                self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+                self._driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
                     "source": """
                     Object.defineProperty(navigator, 'webdriver', {
                         get: () => undefined
@@ -110,376 +1966,1037 @@ class JobScraper:
                     });
                     """
                 })
-                print("Added anti-detection scripts")
+                logger.debug("Added anti-detection scripts")
+            except Exception as e:
+                logger.warning(f"Could not add anti-detection scripts: {e}")
+            self._apply_resource_blocking()
+            self._time_startup("cdp_setup", started)
+                
+        except Exception as e:
+            logger.warning(f"Error setting up ChromeDriver with webdriver-manager: {e}")
+            logger.warning("Falling back to directly using Chrome WebDriver...")
+            started = time.perf_counter()
+            self._driver = webdriver.Chrome(options=chrome_options)
+            self._time_startup("launch_chrome", started)
+            self._count_webdriver_commands()
+            self._apply_resource_blocking()
+    
+    def _browser_rss(self):
+        """Resident memory of Chrome's process tree (chromedriver and every browser process) in bytes, or None."""
+        try:
+            return process_tree_rss(self._driver.service.process.pid)
+        except AttributeError:
+            return None
+    
+    def _sample_browser_memory(self):
+        """Add the browser's current memory to this search's samples."""
+        if self._driver is None:
+            return
+        rss = self._browser_rss()
+        if rss is not None:
+            self.browser_memory.append(rss)
+    
+    def _browser_alive(self):
+        # A dead chromedriver surfaces as connection errors from urllib3 rather than WebDriverException
+        try:
+            self._driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    def _restart_browser(self, reason):
+        """Quit the browser; the next use of self.driver starts a fresh one."""
+        logger.info(f"Restarting the browser: {reason}")
+        self.metrics.count("browser_restarts")
+        try:
+            self._driver.quit()
+        except Exception as e:
+            logger.debug(f"Error quitting the old browser: {e}")
+        self._driver = None
+        self.browser_pages = 0
+    
+    def _restart_if_crashed(self):
+        """Replace a browser that no longer answers, so a retried navigation gets a working one."""
+        if self._driver is not None and not self._browser_alive():
+            self.metrics.count("browser_crashes")
+            self._restart_browser("it stopped responding")
+    
+    def _maintain_browser(self):
+        """Between searches, restart a crashed browser and recycle one that has grown too large or served too many pages."""
+        if self._driver is None:
+            return
+        if not self._browser_alive():
+            self.metrics.count("browser_crashes")
+            self._restart_browser("it stopped responding")
+            return
+        if self.browser_max_pages and self.browser_pages >= self.browser_max_pages:
+            self._restart_browser(f"it has served {self.browser_pages} pages")
+            return
+        rss = self._browser_rss()
+        limit = self.browser_memory_mb * 2**20
+        if not limit or rss is None or rss < limit * BROWSER_SOFT_RECYCLE_RATIO:
+            return
+        if rss >= limit:
+            self._restart_browser(f"it uses {rss / 2**20:.0f} MB")
+            return
+        # Drop the previous search's DOM and cached responses without paying for a new browser
+        try:
+            self._driver.get("about:blank")
+            self._driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            self._driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+        except WebDriverException as e:
+            self._restart_browser(f"emptying it failed ({error_summary(e)})")
+            return
+        self.metrics.count("browser_soft_recycles")
+        after = self._browser_rss() or 0
+        logger.info(f"Emptied the browser: {rss / 2**20:.0f} MB before, {after / 2**20:.0f} MB after")
+    
+    def _apply_resource_blocking(self):
+        """Block the configured resource categories at the network level via CDP."""
+        patterns = []
+        for category in self.block_resources:
+            patterns.extend(BLOCKED_RESOURCE_PATTERNS.get(category, []))
+        if not patterns:
+            return
+        try:
+            self._driver.execute_cdp_cmd("Network.enable", {})
+            self._driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            logger.debug(f"Blocking {', '.join(self.block_resources)} ({len(patterns)} URL patterns)")
+        except Exception as e:
+            logger.warning(f"Could not set up resource blocking: {e}")
+    
+    def _network_stats(self):
+        """Drain the performance log and return requests, bytes and blocked requests since the last call."""
+        stats = {"requests": 0, "bytes": 0, "blocked": 0}
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return stats
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method = message.get("method")
+            if method == "Network.requestWillBeSent":
+                stats["requests"] += 1
+            elif method == "Network.loadingFinished":
+                stats["bytes"] += int(message.get("params", {}).get("encodedDataLength", 0))
+            elif method == "Network.loadingFailed" and message.get("params", {}).get("blockedReason"):
+                stats["blocked"] += 1
+        return stats
+    
+    def _report_network(self, page_number):
+        """Log the network traffic of one page and add it to the running totals."""
+        stats = self._network_stats()
+        for field, value in stats.items():
+            self.network_totals[field] += value
+            self.metrics.count(f"network_{field}", value)
+        logger.debug(f"Network for page {page_number}: {stats['requests']} requests, "
+                     f"{stats['bytes'] / 1024:.1f} KB transferred, {stats['blocked']} blocked")
+    
+    def _count_webdriver_commands(self):
+        """Wrap driver.execute so every WebDriver protocol command is counted."""
+        execute = self._driver.execute
+        
+        def counting_execute(driver_command, params=None):
+            self.webdriver_commands += 1
+            self.metrics.count("webdriver_commands")
+            return execute(driver_command, params)
+        
+        # WebElement calls go through their parent driver's execute, so this catches those too
+        self._driver.execute = counting_execute
+    
+    def _record_selectors(self, matches):
+        """Feed per-field selector matches into the selector plan and the run metrics.
+        
+        A page without cards (past the last result, or a search with no results) says nothing
+        about the layout, so it is left out rather than counted as a miss.
+        """
+        if not any(matches.get("card") or {}):
+            return
+        for field, counts in matches.items():
+            hits, misses = self.selector_plan.record(self.engine, field, counts)
+            self.metrics.count("selector_plan_hits", hits)
+            self.metrics.count("selector_plan_misses", misses)
+    
+    def _extract_cards_batch(self, cursor):
+        """Extract the fields of every card after the cursor with a single execute_script call."""
+        selectors = self.selector_plan.orders(self.engine)
+        fields = dict(selectors, datetime=DATETIME_SELECTOR)
+        del fields["card"]
+        extracted = self.driver.execute_script(CARD_EXTRACTION_SCRIPT, selectors["card"], fields, cursor) or {}
+        
+        # The script reports "no selector matched" as an empty string
+        matches = {field: {selector or None: count for selector, count in counts.items()}
+                   for field, counts in (extracted.get("matches") or {}).items()}
+        matches["card"] = {extracted.get("selector"): 1}
+        self._record_selectors(matches)
+        return extracted.get("selector"), extracted.get("total", 0), extracted.get("start", 0), extracted.get("cards") or []
+    
+    def _extract_cards_legacy(self, cursor, limit):
+        """Extract the cards after the cursor element by element (one WebDriver round trip per lookup)."""
+        selectors = self.selector_plan.orders(self.engine)
+        # Only fetch handles for unseen cards instead of re-fetching the whole list every page
+        found = self.driver.execute_script(CARD_SLICE_SCRIPT, selectors["card"], cursor, max(limit, 0)) or {}
+        start = found.get("start", 0)
+        
+        matches = {"card": {found.get("selector"): 1}}
+        card_fields = []
+        for card_index, (card, key) in enumerate(zip(found.get("elements") or [], found.get("keys") or [])):
+            try:
+                fields = self._extract_card_fields(card, selectors, matches)
+            except Exception as e:
+                logger.error(f"Error parsing LinkedIn job card {start+card_index+1}: {e}")
+                fields = {}
+            fields["key"] = key
+            card_fields.append(fields)
+        self._record_selectors(matches)
+        return found.get("selector"), found.get("total", 0), start, card_fields
+    
+    def _first_match(self, card, field, selectors, matches, read):
+        """Return read(element, selector) for the first selector whose element gives a value.
+        
+        Each miss is a full WebDriver round trip, which is why the selector plan puts the
+        selector that won last time first.
+        """
+        counts = matches.setdefault(field, {})
+        for selector in selectors[field]:
+            try:
+                value = read(card.find_element(By.CSS_SELECTOR, selector), selector)
+            except WebDriverException:
+                continue
+            if value:
+                counts[selector] = counts.get(selector, 0) + 1
+                return value
+        counts[None] = counts.get(None, 0) + 1
+        return None
+    
+    def _extract_card_fields(self, card, selectors=None, matches=None):
+        """Extract title, company, location, link and date from a single job card element."""
+        selectors = selectors or FIELD_SELECTORS
+        matches = matches if matches is not None else {}
+        fields = {}
+        
+        def valid_text(element, selector):
+            # Skip empty and obfuscated (all asterisks) text
+            raw_text = element.text.strip()
+            return raw_text if raw_text and not all(c == '*' for c in raw_text) else None
+        
+        def date_value(element, selector):
+            if selector == DATETIME_SELECTOR:
+                return element.get_attribute("datetime")
+            return element.text.strip() or None
+        
+        # Extract job title, company and location, handling obfuscated content
+        for field in ("title", "company", "location"):
+            try:
+                fields[field] = self._first_match(card, field, selectors, matches, valid_text)
             except Exception as e:
-                print(f"Could not add anti-detection scripts: {e}")
+                logger.error(f"Error extracting {field}: {e}")
+        
+        # Get job link - try multiple strategies
+        job_link = None
+        try:
+            job_link = self._first_match(card, "link", selectors, matches, lambda element, selector: element.get_attribute("href"))
                 
+            # If still no link, try getting any anchor tag
+            if not job_link:
+                anchors = card.find_elements(By.TAG_NAME, "a")
+                for anchor in anchors:
+                    href = anchor.get_attribute("href")
+                    if href and "linkedin.com/jobs/view" in href:
+                        job_link = href
+                        break
         except Exception as e:
-            print(f"Error setting up ChromeDriver with webdriver-manager: {e}")
-            print("Falling back to directly using Chrome WebDriver...")
-            self.driver = webdriver.Chrome(options=chrome_options)
+            logger.error(f"Error extracting job link: {e}")
+        fields["link"] = job_link
+        
+        # Get date - the <time> datetime attribute or the visible text of the fallbacks
+        date_posted = None
+        try:
+            date_posted = self._first_match(card, "date", selectors, matches, date_value)
+        except Exception as e:
+            logger.error(f"Error extracting date: {e}")
+        fields["date_posted"] = date_posted
+        
+        return fields
+    
+    def _card_snapshot(self):
+        """Return (card count, first card text) for the first card selector that matches."""
+        return tuple(self.driver.execute_script(CARD_SNAPSHOT_SCRIPT, self.selector_plan.order(self.engine, "card")))
+    
+    def _wait_for_new_cards(self, previous_snapshot):
+        """Wait until the card list grows or is replaced, up to the configured ceiling."""
+        def cards_changed(driver):
+            count, first_card = self._card_snapshot()
+            previous_count, previous_first_card = previous_snapshot
+            # Infinite scroll appends cards; numbered pagination swaps them out
+            return count > previous_count or (count and first_card != previous_first_card)
+        
+        try:
+            WebDriverWait(self.driver, self.wait_timeout, poll_frequency=0.25).until(cards_changed)
+            return True
+        except TimeoutException:
+            return False
+    
+    def _record_page_wait(self, page_number, seconds):
+        """Remember and report how long a page took to become ready."""
+        self.page_timings.append({"page": page_number, "wait": seconds})
+        logger.debug(f"LinkedIn page {page_number} ready after {seconds:.2f}s")
+    
+    def _accept_job(self, job_data, page_jobs):
+        """Keep an accepted job and append it to the JSONL stream right away (after enrichment, if enabled)."""
+        self.results.append(job_data)
+        page_jobs.append(job_data)
+        self.metrics.count("jobs_accepted")
+        if self.stream is not None and self.enricher is None:
+            self.stream.write(job_data)
     
-    def scrape_linkedin(self, job_title, location, experience=None):
+    def _update_progress(self, cards, jobs):
+        """Count one more finished page for status reporting."""
+        self.metrics.count("pages_loaded")
+        self.metrics.count("cards_seen", cards)
+        self.progress = {
+            "pages": self.progress["pages"] + 1,
+            "cards": self.progress["cards"] + cards,
+            "jobs": self.progress["jobs"] + jobs,
+        }
+    
+    def _store_page(self, page_jobs):
+        """Enrich one page of accepted jobs if enabled, then upsert it into the persistent store."""
+        if self.enricher is not None and page_jobs:
+            with self.metrics.timer("enrichment"):
+                self.enricher.enrich(page_jobs, self.store, self.metrics)
+            if self.stream is not None:
+                for job in page_jobs:
+                    self.stream.write(job)
+        if self.stream is not None:
+            self.stream.flush()
+        if self.store is None or not page_jobs:
+            return
+        try:
+            with self.metrics.timer("store"):
+                unique_jobs = self.store.upsert_jobs(page_jobs, self.current_search)
+            # Pages are counted once stored, so this page is number pages + 1
+            if unique_jobs:
+                self.query_yield["unique_jobs"] += unique_jobs
+                self.query_yield["last_unique_page"] = self.progress["pages"] + 1
+        except sqlite3.Error as e:
+            self.metrics.count("store_errors")
+            logger.error(f"Error saving page to job store: {e}")
+    
+    def _is_duplicate(self, job_data):
+        """Check a job against the ids already accepted in this search, remembering new ones."""
+        key = job_key(job_data)
+        if key in self.seen_job_ids:
+            return True
+        self.seen_job_ids.add(key)
+        return False
+    
+    def _report_duplicates(self, page_number, duplicates, examined):
+        """Log how many of the cards examined on a page were duplicates."""
+        self.metrics.count("duplicates_dropped", duplicates)
+        if examined:
+            logger.info(f"Dropped {duplicates} duplicate jobs on LinkedIn page {page_number} "
+                        f"(duplicate ratio {duplicates / examined:.0%})")
+    
+    def _build_job(self, fields):
+        """Turn extracted card fields into a job record, or None if the card is obfuscated."""
+        title = fields.get("title") or "Not available"
+        company = fields.get("company") or "Not available"
+        location = fields.get("location") or "Not available"
+        
+        # Skip invalid listings (e.g., mostly asterisks or empty fields)
+        if (title == "Not available" or title.count('*') > len(title) / 2) and \
+           (company == "Not available" or company.count('*') > len(company) / 2):
+            return None
+        
+        date_posted = fields.get("date_posted") or "Not specified"
+        return JobRecord(
+            source="LinkedIn",
+            title=title,
+            company=company,
+            location=location,
+            link=canonical_job_link(fields.get("link")) or "Not available",
+            date_posted=date_posted,
+            # Relative dates ("2 days ago") are resolved against the time the card was seen
+            posted_epoch=posted_epoch(date_posted),
+        )
+    
+    def _throttle(self, url):
+        """Take a request slot from the shared per-host rate limiter."""
+        waited = self.rate_limiter.acquire(url)
+        if waited:
+            self.metrics.observe("rate_limit_wait", waited)
+    
+    def _backoff(self, attempt, action, minimum=0):
+        """Sleep before retry number attempt + 1 of a failed navigation or page load."""
+        delay = max(minimum, backoff_delay(attempt))
+        self.metrics.count("retries")
+        logger.warning(f"{action} failed, retrying in {delay:.1f}s (attempt {attempt + 2}/{self.retries + 1})")
+        with self.metrics.timer("retry_wait"):
+            time.sleep(delay)
+    
+    def _open_search_page(self, url):
+        """Navigate to a search and wait for the results list, retrying with backoff. Returns True once it shows."""
+        for attempt in range(self.retries + 1):
+            self._throttle(url)
+            load_started = time.time()
+            try:
+                with self.metrics.timer("navigation"):
+                    self.driver.get(url)
+                if "first_navigation" not in self.startup_timings:
+                    self.startup_timings["first_navigation"] = time.time() - load_started
+                    self._report_startup()
+                
+                # Wait for job results to load - move on as soon as the list is present
+                with self.metrics.timer("result_wait"):
+                    WebDriverWait(self.driver, self.wait_timeout, poll_frequency=0.25).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, RESULTS_LIST_SELECTOR))
+                    )
+                self._record_page_wait(1, time.time() - load_started)
+                self.browser_pages += 1
+                return True
+            except TimeoutException:
+                self.metrics.count("result_wait_timeouts")
+                error = f"no results list within {self.wait_timeout}s"
+            except WebDriverException as e:
+                self.metrics.count("navigation_errors")
+                error = error_summary(e)
+                self._restart_if_crashed()
+            if attempt < self.retries:
+                self._backoff(attempt, f"Loading the LinkedIn search page ({error})")
+        
+        logger.warning("Could not find job results list on LinkedIn. The site may have changed or blocked access.")
+        # Save screenshot for debugging
+        try:
+            screenshot_path = os.path.join(self.output_dir, "linkedin_debug.png")
+            self.driver.save_screenshot(screenshot_path)
+            logger.info(f"Debug screenshot saved to {screenshot_path}")
+        except Exception as e:
+            logger.warning(f"Failed to save debug screenshot: {e}")
+        return False
+    
+    def _find_next_button(self, page):
+        """Return the visible "See more jobs"/"Next" button that loads the page after `page`, if any."""
+        next_selectors = [
+            "button.infinite-scroller__show-more-button",
+            "button.see-more-jobs",
+            "button[aria-label='See more jobs']",
+            ".artdeco-pagination__button--next",
+            "li.artdeco-pagination__indicator--number button"
+        ]
+        
+        for next_selector in next_selectors:
+            try:
+                for btn in self.driver.find_elements(By.CSS_SELECTOR, next_selector):
+                    if btn.is_displayed() and btn.is_enabled():
+                        # For numbered pagination, find the next page number
+                        if "artdeco-pagination__indicator--number" in next_selector:
+                            button_text = btn.text.strip()
+                            if button_text.isdigit() and int(button_text) == page + 2:
+                                return btn
+                        else:
+                            return btn
+            except WebDriverException:
+                continue
+        return None
+    
+    def _load_next_page(self, page):
+        """Click "Next" (or scroll) and wait for new cards, retrying a failed load of that page with backoff.
+        
+        Returns False when no more cards could be loaded. Cards already extracted are kept either way,
+        and the card cursor makes sure a retried page doesn't produce duplicates.
+        """
+        pagination_started = time.perf_counter()
+        try:
+            for attempt in range(self.retries + 1):
+                try:
+                    next_button = self._find_next_button(page)
+                    previous_snapshot = self._card_snapshot()
+                    self._throttle(self.search_url)
+                    load_started = time.time()
+                    
+                    if next_button:
+                        logger.debug(f"Found 'Next' button for page {page+2}, clicking to load more jobs")
+                        self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
+                        next_button.click()
+                    else:
+                        # If no next button, try scrolling down
+                        logger.debug("No 'Next' button found, scrolling down to load more jobs")
+                        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    
+                    # Wait until new cards show up instead of sleeping a fixed amount
+                    if self._wait_for_new_cards(previous_snapshot):
+                        self._record_page_wait(page + 2, time.time() - load_started)
+                        self.browser_pages += 1
+                        return True
+                    self.metrics.count("pagination_timeouts")
+                    error = f"no new job cards within {self.wait_timeout}s"
+                    
+                    # Without a button this is most likely the end of the results, not a transient failure
+                    if next_button is None:
+                        break
+                except WebDriverException as e:
+                    self.metrics.count("pagination_errors")
+                    error = error_summary(e)
+                if attempt < self.retries:
+                    self._backoff(attempt, f"Loading LinkedIn page {page+2} ({error})")
+            
+            logger.warning(f"Could not load LinkedIn page {page+2}: {error}. Stopping pagination.")
+            return False
+        finally:
+            # Finding and clicking "Next" (or scrolling), waiting for the new cards and any retries
+            self.metrics.observe("pagination", time.perf_counter() - pagination_started)
+    
+    def scrape_linkedin(self, job_title, location, experience=None, pages_to_scrape=None, max_jobs=None):
         """Scrape LinkedIn for job listings."""
-        print(f"Scraping LinkedIn for {job_title} in {location}...")
+        logger.info(f"Scraping LinkedIn for {job_title} in {location}...")
+        self.current_search = search_key(job_title, location, experience)
+        
+        # A resumed search opens the pages after its checkpoint by their start= offset; checkpoints
+        # saved without an offset (by older versions) can only start over
+        resume = self.task is not None and self.task.page and self.task.start
+        if resume:
+            logger.info(f"Resuming after page {self.task.page} (offset {self.task.start}, {self.task.jobs} jobs so far)")
+        elif self.task is not None and self.task.page:
+            logger.info(f"Restarting from page 1; the checkpoint after page {self.task.page} has no result offset")
         
         # Format the search URL
         query = job_title.replace(' ', '%20')
         location_query = location.replace(' ', '%20')
-        url = f"https://www.linkedin.com/jobs/search/?keywords={query}&location={location_query}"
+        url = f"{self.search_url}?keywords={query}&location={location_query}"
         
         # Add experience filter if provided
         if experience:
             url += f"&f_E={experience}"
         
+        # A recorded snapshot of the results this search rendered is parsed without starting the browser
+        html = self._cached_page(url, self.engine)
+        if html is not None:
+            logger.info("Replaying LinkedIn search results from the page cache")
+            max_jobs = max_jobs or self.max_jobs
+            card_count, accepted = self._process_html_page(html, 0, max_jobs, CARD_SELECTORS[:1])
+            # A search crawled with --tabs recorded its later pages under their start= offsets
+            if card_count and accepted < max_jobs and self.page_cache.offset_pages(url, self.engine):
+                self._crawl_offsets(
+                    lambda offsets, first_page: [self._cached_page(f"{url}&start={offset}", self.engine) for offset in offsets],
+                    1, card_count, card_count, pages_to_scrape or self.pages_to_scrape, max_jobs, accepted, CARD_SELECTORS[:1])
+            return
+        if self.replay:
+            logger.warning(f"Search is not in the page cache, skipping it: {url}")
+            return
+        
         try:
-            print(f"Navigating to URL: {url}")
-            self.driver.get(url)
-            time.sleep(5)  # Increase wait time to allow page to fully load
+            logger.debug(f"Navigating to URL: {url}")
+            self.page_timings = []
+            # Recycling only happens here, between searches, never while a page is being read
+            self._maintain_browser()
+            # Discard network events left over from the previous search
+            self._network_stats()
+            self.network_totals = {"requests": 0, "bytes": 0, "blocked": 0}
             
-            # Wait for job results to load
-            try:
-                WebDriverWait(self.driver, 15).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".jobs-search__results-list, .job-search-resultsList"))
-                )
-            except TimeoutException:
-                print("Could not find job results list on LinkedIn. The site may have changed or blocked access.")
-                # Save screenshot for debugging
-                try:
-                    screenshot_path = os.path.join(self.output_dir, "linkedin_debug.png")
-                    self.driver.save_screenshot(screenshot_path)
-                    print(f"Debug screenshot saved to {screenshot_path}")
-                except Exception as e:
-                    print(f"Failed to save debug screenshot: {e}")
+            if resume:
+                total_jobs_found = self._crawl_offsets(
+                    lambda offsets, first_page: self._load_offset_tabs([f"{url}&start={offset}" for offset in offsets]),
+                    self.task.page, self.task.start, max(1, self.task.start // self.task.page),
+                    pages_to_scrape or self.pages_to_scrape, max_jobs or self.max_jobs, self.task.jobs, CARD_SELECTORS[:1])
+                logger.info(f"Successfully scraped {total_jobs_found} jobs from LinkedIn")
+                return
+            
+            # Load the search and wait for the results list, retrying only this navigation if it fails
+            if not self._open_search_page(url):
                 return
             
             # Try to scroll down to load more results (pagination)
             try:
                 total_jobs_found = 0
-                pages_to_scrape = 5  # Increased to 5 pages to get more results
-                max_jobs = 100  # Maximum jobs to scrape to avoid overloading
+                pages_to_scrape = pages_to_scrape or self.pages_to_scrape
+                max_jobs = max_jobs or self.max_jobs  # Maximum jobs to scrape to avoid overloading
+                
+                # Incremental cursor: DOM index of the next unseen card and the key of the last card
+                # processed, so each page only extracts cards we haven't looked at yet
+                cursor = {"index": 0, "last_key": None}
+                seen_card_keys = set()
+                offset_pages = False
                 
                 for page in range(pages_to_scrape):
                     # Check if we've hit the maximum job limit
                     if total_jobs_found >= max_jobs:
-                        print(f"Reached maximum job limit of {max_jobs}. Stopping LinkedIn scraping.")
+                        logger.info(f"Reached maximum job limit of {max_jobs}. Stopping LinkedIn scraping.")
                         break
                         
-                    # Try multiple selectors for job cards
-                    job_cards = []
-                    selectors = [
-                        ".jobs-search__results-list li", 
-                        ".job-search-card",
-                        "li.jobs-search-results__list-item",
-                        ".jobs-search-results__list-item",
-                        ".job-card-container"
-                    ]
+                    # Snapshot the command counter so we can report per-page WebDriver traffic
+                    commands_before = self.webdriver_commands
+                    remaining_jobs = max_jobs - total_jobs_found
                     
-                    for selector in selectors:
-                        job_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if job_cards:
-                            print(f"Found job cards using selector: {selector}")
-                            break
+                    # Extract the unseen cards on the page, either in one script call or card by card
+                    with self.metrics.timer("extraction"):
+                        if self.extraction == "batch":
+                            card_selector, card_count, start, card_fields = self._extract_cards_batch(cursor)
+                        else:
+                            card_selector, card_count, start, card_fields = self._extract_cards_legacy(cursor, limit=remaining_jobs)
                     
-                    if not job_cards:
+                    if card_selector:
+                        logger.debug(f"Found job cards using selector: {card_selector}")
+                        if card_selector != CARD_SELECTORS[0]:
+                            self.metrics.count("selector_fallbacks")
+                    
+                    if not card_count:
                         if page == 0:  # First page should have results
-                            print("No job cards found on LinkedIn. All selectors failed.")
+                            logger.warning("No job cards found on LinkedIn. All selectors failed.")
                             return
                         else:  # Expected to eventually run out of results
-                            print(f"No more job cards found on page {page+1}. Stopping pagination.")
+                            logger.info(f"No more job cards found on page {page+1}. Stopping pagination.")
                             break
-                            
-                    print(f"Found {len(job_cards)} job cards on LinkedIn page {page+1}")
+                    
+                    if start == 0 and cursor["index"] > 0:
+                        logger.debug("Job card list was replaced, rescanning from the top")
+                    logger.info(f"Found {card_count} job cards on LinkedIn page {page+1}")
+                    logger.debug(f"Processing {len(card_fields)} new job listings from LinkedIn page {page+1} (cards {start+1}-{start+len(card_fields)})")
                     new_jobs = 0
+                    consumed = 0
+                    page_jobs = []
+                    page_duplicates = 0
                     
-                    # Process job cards from current page - limit according to max_jobs
-                    job_cards_to_process = job_cards[total_jobs_found:] if page > 0 else job_cards
-                    remaining_jobs = max_jobs - total_jobs_found
-                    if len(job_cards_to_process) > remaining_jobs:
-                        job_cards_to_process = job_cards_to_process[:remaining_jobs]
-                        print(f"Limiting to {remaining_jobs} more jobs to stay under maximum of {max_jobs}")
+                    for card_index, fields in enumerate(card_fields):
+                        # Process job cards from current page - limit according to max_jobs
+                        if new_jobs >= remaining_jobs:
+                            logger.info(f"Limiting to {remaining_jobs} more jobs to stay under maximum of {max_jobs}")
+                            break
+                        consumed += 1
+                        
+                        # Cards re-rendered after the list was replaced have already been handled
+                        if fields["key"] in seen_card_keys:
+                            page_duplicates += 1
+                            continue
+                        seen_card_keys.add(fields["key"])
                         
-                    print(f"Processing {len(job_cards_to_process)} new job listings from LinkedIn page {page+1}")
-                    
-                    for card_index, card in enumerate(job_cards_to_process):
                         try:
-                            # Extract job title, handling obfuscated content
-                            title = "Not available"
-                            try:
-                                title_elements = []
-                                try:
-                                    title_elements.append(card.find_element(By.CSS_SELECTOR, "h3.base-search-card__title"))
-                                except: pass
-                                try:
-                                    title_elements.append(card.find_element(By.CSS_SELECTOR, ".job-search-card__title"))
-                                except: pass
-                                try: 
-                                    title_elements.append(card.find_element(By.CSS_SELECTOR, "h3"))
-                                except: pass
-                                try:
-                                    title_elements.append(card.find_element(By.CSS_SELECTOR, ".job-card-list__title"))
-                                except: pass
-                                
-                                for element in title_elements:
-                                    raw_title = element.text.strip()
-                                    if raw_title and not all(c == '*' for c in raw_title):
-                                        title = raw_title
-                                        break
-                            except Exception as e:
-                                print(f"Error extracting title: {e}")
-                            
-                            # Extract company name
-                            company = "Not available"
-                            try:
-                                company_elements = []
-                                try:
-                                    company_elements.append(card.find_element(By.CSS_SELECTOR, "h4.base-search-card__subtitle"))
-                                except: pass
-                                try:
-                                    company_elements.append(card.find_element(By.CSS_SELECTOR, ".job-search-card__subtitle"))
-                                except: pass
-                                try:
-                                    company_elements.append(card.find_element(By.CSS_SELECTOR, "h4"))
-                                except: pass
-                                try:
-                                    company_elements.append(card.find_element(By.CSS_SELECTOR, ".job-card-container__company-name"))
-                                except: pass
-                                
-                                for element in company_elements:
-                                    raw_company = element.text.strip()
-                                    if raw_company and not all(c == '*' for c in raw_company):
-                                        company = raw_company
-                                        break
-                            except Exception as e:
-                                print(f"Error extracting company: {e}")
-                            
-                            # Extract location
-                            location = "Not available"
-                            try:
-                                location_elements = []
-                                try:
-                                    location_elements.append(card.find_element(By.CSS_SELECTOR, ".job-search-card__location"))
-                                except: pass
-                                try:
-                                    location_elements.append(card.find_element(By.CSS_SELECTOR, ".job-result-card__location"))
-                                except: pass
-                                try:
-                                    location_elements.append(card.find_element(By.CSS_SELECTOR, ".base-search-card__metadata"))
-                                except: pass
-                                try:
-                                    location_elements.append(card.find_element(By.CSS_SELECTOR, ".job-card-container__metadata-item"))
-                                except: pass
-                                
-                                for element in location_elements:
-                                    raw_location = element.text.strip()
-                                    if raw_location and not all(c == '*' for c in raw_location):
-                                        location = raw_location
-                                        break
-                            except Exception as e:
-                                print(f"Error extracting location: {e}")
-                            
-                            # Get job link - try multiple strategies
-                            job_link = "Not available"
-                            try:
-                                link_selectors = [
-                                    "a.base-card__full-link",
-                                    "a.job-search-card__link",
-                                    "a.job-card-list__title",
-                                    "a.job-card-container__link"
-                                ]
-                                
-                                for link_selector in link_selectors:
-                                    try:
-                                        link_element = card.find_element(By.CSS_SELECTOR, link_selector)
-                                        job_link = link_element.get_attribute("href")
-                                        if job_link:
-                                            break
-                                    except:
-                                        continue
-                                    
-                                # If still no link, try getting any anchor tag
-                                if job_link == "Not available":
-                                    anchors = card.find_elements(By.TAG_NAME, "a")
-                                    for anchor in anchors:
-                                        href = anchor.get_attribute("href")
-                                        if href and "linkedin.com/jobs/view" in href:
-                                            job_link = href
-                                            break
-                            except Exception as e:
-                                print(f"Error extracting job link: {e}")
-                            
-                            # Get date - try multiple strategies
-                            date_posted = "Not specified"
-                            try:
-                                try:
-                                    date_element = card.find_element(By.CSS_SELECTOR, "time")
-                                    date_posted = date_element.get_attribute("datetime")
-                                except:
-                                    try:
-                                        date_element = card.find_element(By.CSS_SELECTOR, ".job-search-card__listdate")
-                                        date_posted = date_element.text.strip()
-                                    except:
-                                        try:
-                                            date_element = card.find_element(By.CSS_SELECTOR, ".job-card-container__footer-item")
-                                            date_posted = date_element.text.strip()
-                                        except:
-                                            pass
-                            except Exception as e:
-                                print(f"Error extracting date: {e}")
-                            
-                            # Skip invalid listings (e.g., mostly asterisks or empty fields)
-                            if (title == "Not available" or title.count('*') > len(title) / 2) and \
-                               (company == "Not available" or company.count('*') > len(company) / 2):
-                                print(f"Skipping job with obfuscated or missing title/company")
+                            job_data = self._build_job(fields)
+                            if job_data is None:
+                                self.metrics.count("cards_skipped")
+                                logger.debug(f"Skipping job with obfuscated or missing title/company")
                                 continue
                             
-                            job_data = {
-                                "source": "LinkedIn",
-                                "title": title,
-                                "company": company,
-                                "location": location,
-                                "link": job_link,
-                                "date_posted": date_posted,
-                            }
+                            # The same posting often shows up again under different tracking params
+                            if self._is_duplicate(job_data):
+                                page_duplicates += 1
+                                continue
                             
                             # Print job data for debugging
-                            print(f"Found LinkedIn job: {title} at {company} in {location}")
+                            logger.debug(f"Found LinkedIn job: {job_data['title']} at {job_data['company']} in {job_data['location']}")
                             
-                            self.results.append(job_data)
+                            self._accept_job(job_data, page_jobs)
                             new_jobs += 1
                         except Exception as e:
-                            print(f"Error parsing LinkedIn job card {card_index+1}: {e}")
+                            self.metrics.count("card_errors")
+                            logger.error(f"Error parsing LinkedIn job card {start+card_index+1}: {e}")
+                    
+                    self._store_page(page_jobs)
+                    self._report_duplicates(page + 1, page_duplicates, consumed)
+                    self._update_progress(consumed, new_jobs)
+                    self._sample_browser_memory()
+                    
+                    # Advance the cursor past every card we looked at, accepted or not
+                    if consumed:
+                        cursor["index"] = start + consumed
+                        cursor["last_key"] = card_fields[consumed - 1]["key"]
+                    
+                    page_commands = self.webdriver_commands - commands_before
+                    per_card = page_commands / consumed if consumed else 0
+                    logger.debug(f"WebDriver commands for page {page+1} ({self.extraction} extraction): "
+                                 f"{page_commands} ({per_card:.1f} per card)")
+                    self._report_network(page + 1)
                     
                     # Update count of total jobs found
                     total_jobs_found += new_jobs
                     
-                    # If we've hit the maximum job limit, stop pagination
-                    if total_jobs_found >= max_jobs:
-                        print(f"Reached maximum job limit of {max_jobs}. Stopping LinkedIn pagination.")
+                    # The cursor's DOM index is the results offset a resumed search continues from
+                    if not self._checkpoint(page + 1, cursor["index"], total_jobs_found):
                         break
                     
-                    # If there are more pages, try to click "Next" button or scroll down
-                    if page < pages_to_scrape - 1:
-                        try:
-                            # Try to find and click the "Next" button
-                            next_button = None
-                            next_selectors = [
-                                "button.infinite-scroller__show-more-button",
-                                "button.see-more-jobs",
-                                "button[aria-label='See more jobs']",
-                                ".artdeco-pagination__button--next",
-                                "li.artdeco-pagination__indicator--number button"
-                            ]
-                            
-                            for next_selector in next_selectors:
-                                try:
-                                    next_buttons = self.driver.find_elements(By.CSS_SELECTOR, next_selector)
-                                    if next_buttons:
-                                        for btn in next_buttons:
-                                            if btn.is_displayed() and btn.is_enabled():
-                                                # For numbered pagination, find the next page number
-                                                if "artdeco-pagination__indicator--number" in next_selector:
-                                                    current_page = page + 1
-                                                    button_text = btn.text.strip()
-                                                    if button_text.isdigit() and int(button_text) == current_page + 1:
-                                                        next_button = btn
-                                                        break
-                                                else:
-                                                    next_button = btn
-                                                    break
-                                        if next_button:
-                                            break
-                                except:
-                                    continue
-                            
-                            if next_button:
-                                print(f"Found 'Next' button for page {page+2}, clicking to load more jobs")
-                                self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-                                time.sleep(1)
-                                next_button.click()
-                                time.sleep(4)  # Increased wait time for new results to load
-                            else:
-                                # If no next button, try scrolling down
-                                print("No 'Next' button found, scrolling down to load more jobs")
-                                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                time.sleep(3)  # Wait for scrolling to trigger more results
-                        except Exception as e:
-                            print(f"Error trying to load more LinkedIn jobs: {e}")
-                            # Break the pagination loop if we can't load more
-                            break
+                    # If we've hit the maximum job limit, stop pagination
+                    if total_jobs_found >= max_jobs:
+                        logger.info(f"Reached maximum job limit of {max_jobs}. Stopping LinkedIn pagination.")
+                        break
+                    
+                    # With several tabs the following pages are opened by their start= offset instead of scrolling
+                    if page == 0 and pages_to_scrape > 1 and self.tabs > 1:
+                        offset_pages = True
+                        total_jobs_found = self._crawl_offsets(
+                            lambda offsets, first_page: self._load_offset_tabs([f"{url}&start={offset}" for offset in offsets]),
+                            1, card_count, card_count, pages_to_scrape, max_jobs, total_jobs_found, CARD_SELECTORS[:1])
+                        break
+                    
+                    # If there are more pages, click "Next" or scroll down and wait for the new cards
+                    if page < pages_to_scrape - 1 and not self._load_next_page(page):
+                        break
+                
+                # Record the rendered results so the search can be replayed without a browser; with
+                # --tabs this is the first page only, and the tabs recorded the others
+                if total_jobs_found:
+                    self._record_page(url, self.engine, self.driver.page_source, offset_pages)
+                
+                # Report how long we actually waited for each page
+                if self.page_timings:
+                    total_wait = sum(timing["wait"] for timing in self.page_timings)
+                    logger.info(f"Waited {total_wait:.2f}s in total for {len(self.page_timings)} LinkedIn pages")
+                logger.info(f"Network for this search: {self.network_totals['requests']} requests, "
+                            f"{self.network_totals['bytes'] / 1024:.1f} KB transferred, {self.network_totals['blocked']} blocked")
                 
                 # Summarize results
                 if self.results:
                     linkedin_jobs = [job for job in self.results if job["source"] == "LinkedIn"]
                     job_count = len(linkedin_jobs)
                     titles = ", ".join([job["title"] for job in linkedin_jobs[:3]]) + ("..." if job_count > 3 else "")
-                    print(f"Successfully scraped {job_count} jobs from LinkedIn. Examples: {titles}")
+                    logger.info(f"Successfully scraped {job_count} jobs from LinkedIn. Examples: {titles}")
                 else:
-                    print("No jobs were successfully parsed from LinkedIn")
+                    logger.info("No jobs were successfully parsed from LinkedIn")
             
             except Exception as e:
-                print(f"Error during LinkedIn pagination: {e}")
+                logger.error(f"Error during LinkedIn pagination: {e}")
                 
         except TimeoutException:
-            print("Timeout while loading LinkedIn jobs")
+            logger.warning("Timeout while loading LinkedIn jobs")
         except WebDriverException as e:
-            print(f"WebDriver error: {e}")
+            logger.error(f"WebDriver error: {e}")
         except Exception as e:
-            print(f"Error scraping LinkedIn: {str(e)}")
+            logger.error(f"Error scraping LinkedIn: {str(e)}")
     
-    def save_results(self):
-        """Save scraped job listings to a JSON file."""
+    def setup_http_session(self):
+        """Set up a pooled keep-alive HTTP session for browser-free scraping."""
+        self.session = requests.Session()
+        # One keep-alive connection per concurrent --tabs request
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max(4, self.tabs))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "User-Agent": random.choice(USER_AGENTS),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Connection": "keep-alive",
+        })
+        logger.debug("HTTP session initialized successfully")
+    
+    @property
+    def replay(self):
+        """True when every page must come from the page cache (--replay)."""
+        return self.page_cache is not None and self.page_cache.offline
+    
+    def _cached_page(self, url, engine):
+        """HTML of a cached page, counting the hit or miss; None without a page cache."""
+        if self.page_cache is None:
+            return None
+        html = self.page_cache.get(url, engine)
+        self.metrics.count("page_cache_hits" if html is not None else "page_cache_misses")
+        return html
+    
+    def _record_page(self, url, engine, html, offset_pages=False):
+        """Save a fetched page to the page cache, if there is one."""
+        if self.page_cache is None or self.replay:
+            return
         try:
-            # Each run creates a new file with timestamp, no need to read existing one
-            print(f"Saving results to new file: {self.output_file}")
-
-            # Filter out jobs with "Not available" as title or company
-            filtered_data = []
-            for job in self.results:
-                # Skip jobs with missing/unavailable titles or companies
-                if job.get("title") in ["Not available", "Not specified"] or job.get("company") in ["Not available", "Not specified"]:
-                    print(f"Skipping job with title '{job.get('title')}' at company '{job.get('company')}' - incomplete data")
-                    continue
-                filtered_data.append(job)
-            
-            print(f"Filtered out {len(self.results) - len(filtered_data)} jobs with missing title or company data")
+            self.page_cache.put(url, engine, html, offset_pages)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not save page to the page cache: {e}")
+    
+    def _fetch_guest_page(self, params, page):
+        """Return the HTML of one guest API page, from the page cache or fetched with retries on
+        connection errors, 429 and 5xx responses. None ends pagination."""
+        url = f"{self.guest_search_url}?{urllib.parse.urlencode(params)}"
+        html = self._cached_page(url, self.engine)
+        if html is not None:
+            return html
+        if self.replay:
+            logger.info(f"LinkedIn page {page+1} is not in the page cache. Stopping pagination.")
+            return None
+        
+        for attempt in range(self.retries + 1):
+            if self._stopping():
+                return None
+            self._throttle(url)
+            retry_after = 0
+            try:
+                self.metrics.count("http_requests")
+                with self.metrics.timer("fetch"):
+                    response = self.session.get(url, timeout=15)
+            except requests.RequestException as e:
+                error = error_summary(e)
+            else:
+                if response.status_code == 200:
+                    self._record_page(url, self.engine, response.text)
+                    return response.text
+                error = f"HTTP {response.status_code}"
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    self.metrics.count("http_errors")
+                    logger.warning(f"LinkedIn returned {error} for page {page+1}. Stopping pagination.")
+                    return None
+                # Respect the server's own idea of when to come back
+                retry_after = response.headers.get("Retry-After", "")
+                retry_after = min(float(retry_after), RETRY_BACKOFF_MAX) if retry_after.isdigit() else 0
             
-            # Remove duplicates based on job link within the filtered results
-            unique_data = []
-            seen_links = set()
-            for job in filtered_data:
-                if job["link"] not in seen_links:
-                    # Clean up any excessive whitespace in text fields
-                    for field in ["title", "company", "location"]:
-                        if field in job and isinstance(job[field], str):
-                            job[field] = " ".join(job[field].split())
-                    
-                    unique_data.append(job)
-                    seen_links.add(job["link"])
+            self.metrics.count("http_errors")
+            if attempt < self.retries:
+                self._backoff(attempt, f"Fetching LinkedIn page {page+1} ({error})", minimum=retry_after)
+        
+        logger.warning(f"Giving up on LinkedIn page {page+1} after {self.retries + 1} attempts ({error}). Stopping pagination.")
+        return None
+    
+    def _fetch_guest_pages(self, params, offsets, first_page):
+        """Fetch the guest API pages at several start= offsets concurrently, returned in offset order."""
+        with ThreadPoolExecutor(max_workers=len(offsets), thread_name_prefix="page") as executor:
+            return list(executor.map(lambda i: self._fetch_guest_page(dict(params, start=offsets[i]), first_page + i),
+                                     range(len(offsets))))
+    
+    def _load_offset_tabs(self, urls):
+        """Open each URL in a tab of its own so they load side by side, and return their page sources in order.
+        
+        A tab whose results list doesn't show up within wait_timeout yields None.
+        """
+        main_window = self.driver.current_window_handle
+        tabs = []
+        try:
+            for url in urls:
+                self._throttle(url)
+                self.driver.switch_to.new_window("tab")
+                # Unlike driver.get, assigning the location returns at once, so the next tab starts loading right away
+                self.driver.execute_script("window.location.href = arguments[0];", url)
+                tabs.append(self.driver.current_window_handle)
             
-            if len(unique_data) < len(filtered_data):
-                print(f"Removed {len(filtered_data) - len(unique_data)} duplicate records")
+            pages = []
+            for handle in tabs:
+                self.driver.switch_to.window(handle)
+                try:
+                    with self.metrics.timer("result_wait"):
+                        WebDriverWait(self.driver, self.wait_timeout, poll_frequency=0.25).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, RESULTS_LIST_SELECTOR))
+                        )
+                    pages.append(self.driver.page_source)
+                    self.browser_pages += 1
+                    self._record_page(urls[len(pages) - 1], self.engine, pages[-1])
+                except TimeoutException:
+                    self.metrics.count("result_wait_timeouts")
+                    logger.warning(f"No results appeared within {self.wait_timeout}s in the tab for {urls[len(pages)]}")
+                    pages.append(None)
+            return pages
+        except WebDriverException as e:
+            self.metrics.count("pagination_errors")
+            logger.warning(f"Could not load result pages in tabs: {error_summary(e)}")
+            return [None] * len(urls)
+        finally:
+            for handle in tabs:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except WebDriverException:
+                    pass
+            self.driver.switch_to.window(main_window)
+    
+    def _crawl_offsets(self, load_pages, page, start, step, pages_to_scrape, max_jobs, total_jobs_found, expected_selectors):
+        """Load the result pages from `page` on by start= offset, self.tabs at a time, and process them in order.
+        
+        load_pages(offsets, page) returns the HTML of each offset (None if it failed). The crawl
+        stops at the first page that fails, is empty or brings no new job ids. Returns the number
+        of jobs found in the search so far.
+        """
+        while page < pages_to_scrape and total_jobs_found < max_jobs:
+            offsets = [start + i * step for i in range(min(self.tabs, pages_to_scrape - page))]
+            for offset, html in zip(offsets, load_pages(offsets, page)):
+                card_count, accepted = 0, 0
+                if html is not None:
+                    card_count, accepted = self._process_html_page(html, page, max_jobs - total_jobs_found, expected_selectors)
+                # A failed or empty page has already said why pagination stops
+                if not accepted:
+                    if card_count:
+                        logger.info(f"No new jobs on LinkedIn page {page+1} (start={offset}). Stopping pagination.")
+                    return total_jobs_found
+                page += 1
+                start = offset + card_count
+                total_jobs_found += accepted
+                if not self._checkpoint(page, start, total_jobs_found):
+                    return total_jobs_found
+                if total_jobs_found >= max_jobs:
+                    logger.info(f"Reached maximum job limit of {max_jobs}. Stopping LinkedIn pagination.")
+                    return total_jobs_found
+        return total_jobs_found
+    
+    def _process_html_page(self, html, page, remaining_jobs, expected_selectors):
+        """Parse one page of result HTML and accept, dedupe and store its jobs.
+        
+        Returns (cards found, jobs accepted); no cards means there is nothing more to paginate.
+        A card selector outside expected_selectors counts as a selector fallback.
+        """
+        matches = {}
+        with self.metrics.timer("parse"):
+            card_selector, card_fields = parse_job_cards(html, self.selector_plan.orders(self.engine), matches)
+        self._record_selectors(matches)
+        if card_selector and card_selector not in expected_selectors:
+            self.metrics.count("selector_fallbacks")
+        if not card_fields:
+            if page == 0:
+                logger.warning("No job cards found on LinkedIn. All selectors failed.")
+            else:
+                logger.info(f"No more job cards found on page {page+1}. Stopping pagination.")
+            return 0, 0
+        
+        logger.info(f"Found {len(card_fields)} job cards on LinkedIn page {page+1} using selector: {card_selector}")
+        card_count = len(card_fields)
+        if card_count > remaining_jobs:
+            card_fields = card_fields[:remaining_jobs]
+            logger.info(f"Limiting to {remaining_jobs} more jobs to stay under the search's job limit")
+        
+        page_jobs = []
+        page_duplicates = 0
+        for fields in card_fields:
+            job_data = self._build_job(fields)
+            if job_data is None:
+                self.metrics.count("cards_skipped")
+                logger.debug(f"Skipping job with obfuscated or missing title/company")
+                continue
+            if self._is_duplicate(job_data):
+                page_duplicates += 1
+                continue
+            logger.debug(f"Found LinkedIn job: {job_data['title']} at {job_data['company']} in {job_data['location']}")
+            self._accept_job(job_data, page_jobs)
+        self._store_page(page_jobs)
+        self._report_duplicates(page + 1, page_duplicates, len(card_fields))
+        self._update_progress(len(card_fields), len(page_jobs))
+        return card_count, len(page_jobs)
+    
+    def scrape_linkedin_http(self, job_title, location, experience=None, pages_to_scrape=None, max_jobs=None):
+        """Scrape LinkedIn's public guest job search fragments without a browser."""
+        logger.info(f"Scraping LinkedIn (http engine) for {job_title} in {location}...")
+        self.current_search = search_key(job_title, location, experience)
+        
+        params = {"keywords": job_title, "location": location}
+        # Add experience filter if provided
+        if experience:
+            params["f_E"] = experience
+        
+        total_jobs_found = 0
+        start = 0
+        first_page = 0
+        pages_to_scrape = pages_to_scrape or self.pages_to_scrape
+        max_jobs = max_jobs or self.max_jobs
+        
+        # A resumed search continues at the guest API offset after its last completed page
+        if self.task is not None and self.task.page:
+            first_page, start, total_jobs_found = self.task.page, self.task.start, self.task.jobs
+            logger.info(f"Resuming after page {first_page} (offset {start}, {total_jobs_found} jobs so far)")
+        
+        for page in range(first_page, pages_to_scrape):
+            if total_jobs_found >= max_jobs:
+                logger.info(f"Reached maximum job limit of {max_jobs}. Stopping LinkedIn scraping.")
+                break
             
-            # Sort the json output by source and date
-            unique_data.sort(key=lambda x: (x.get("source", ""), x.get("date_posted", "")), reverse=True)
+            html = self._fetch_guest_page(dict(params, start=start), page)
+            if html is None:
+                break
             
-            # Save to the timestamped file with nice formatting
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(unique_data, f, indent=4, ensure_ascii=False, sort_keys=False)
+            # Guest API fragments have no results list wrapper, so .job-search-card is the expected match
+            card_count, accepted = self._process_html_page(html, page, max_jobs - total_jobs_found, CARD_SELECTORS[:2])
+            if not card_count:
+                break
+            # The guest API pages by card offset, not page number
+            start += card_count
+            total_jobs_found += accepted
+            if not self._checkpoint(page + 1, start, total_jobs_found):
+                break
             
-            print(f"Results saved to {self.output_file} ({len(unique_data)} jobs total)")
-            return self.output_file
-        except Exception as e:
-            print(f"Error saving results: {e}")
-            return None
+            # With several tabs the remaining offsets are requested concurrently, a batch at a time
+            if self.tabs > 1:
+                total_jobs_found = self._crawl_offsets(
+                    lambda offsets, first_page: self._fetch_guest_pages(params, offsets, first_page),
+                    page + 1, start, card_count, pages_to_scrape, max_jobs, total_jobs_found, CARD_SELECTORS[:2])
+                break
+        
+        logger.info(f"Successfully scraped {total_jobs_found} jobs from LinkedIn (http engine)")
+    
+    def _checkpoint(self, pages, start, jobs):
+        """Checkpoint the queued search after a completed page; False once another worker has taken it over
+        or the run is shutting down, which ends the search."""
+        if self.task is not None:
+            try:
+                checkpointed = self.task.checkpoint(pages, start, jobs)
+            except sqlite3.Error as e:
+                logger.error(f"Error checkpointing search {self.task.id}: {e}")
+                checkpointed = True
+            if not checkpointed:
+                logger.warning(f"Lost the lease on search {self.task.id} to another worker. Stopping this search.")
+                return False
+        if self._stopping():
+            logger.info(f"Stopping this search after page {pages}, the run is shutting down")
+            return False
+        return True
+    
+    def _stopping(self):
+        """True once the pool this scraper works for has been told to stop."""
+        return self.stop is not None and self.stop.is_set()
+    
+    def _record_query(self, pages, found, pages_before):
+        """Save the query's yield for the search planner; searches that loaded nothing, or were replayed, say nothing about it."""
+        if self.store is None or not pages or self.replay:
+            return
+        try:
+            self.store.record_query(self.current_search, pages, found, self.query_yield["unique_jobs"],
+                                    self.query_yield["last_unique_page"] - pages_before)
+        except sqlite3.Error as e:
+            self.metrics.count("store_errors")
+            logger.error(f"Error saving query stats to job store: {e}")
+    
+    def _load_earlier_jobs(self, search, since):
+        """Put the jobs earlier attempts of a resumed search stored back into the results, so its file
+        lists every job the search found and a page fetched again doesn't count them twice."""
+        if self.store is None or not since:
+            return
+        try:
+            jobs = self.store.export_jobs(self.store.found_since(search, since))
+        except sqlite3.Error as e:
+            self.metrics.count("store_errors")
+            logger.error(f"Error loading the earlier attempt's jobs from job store: {e}")
+            return
+        for job in jobs:
+            self.results.append(JobRecord.from_dict(job))
+            self.seen_job_ids.add(job_key(job))
+        logger.info(f"Loaded {len(jobs)} jobs found by the earlier attempt from the job store")
+    
+    def save_results(self):
+        """Export this search's jobs from the job store to a JSON file and bring them up to date in the full-text index."""
+        with self.metrics.timer("save_results"):
+            filename = write_results(export_from_store(self.store, self.results), self.output_file, self.near_duplicate_threshold)
+        if self.store is not None and self.results:
+            try:
+                with self.metrics.timer("search_index"):
+                    self.store.index_jobs(job_key(job) for job in self.results)
+            except sqlite3.Error as e:
+                self.metrics.count("store_errors")
+                logger.error(f"Error updating the full-text index: {e}")
+        return filename
     
-    def scrape_jobs(self, job_title, locations, experience=None):
-        """Main function to scrape jobs from LinkedIn."""
+    def scrape_jobs(self, job_title, locations, experience=None, pages_to_scrape=None, max_jobs=None, task=None):
+        """Main function to scrape jobs from LinkedIn, with a budget of pages_to_scrape pages and max_jobs jobs per location.
+        
+        With a QueueTask, progress is checkpointed after every page and a resumed task continues
+        after its last completed page.
+        """
         if not isinstance(locations, list):
             locations = [locations]
+        self.task = task
+        
+        search_started = time.perf_counter()
         
         # Clear previous results before starting a new search
         self.results = []
+        self.seen_job_ids = set()
+        self.progress = {"pages": 0, "cards": 0, "jobs": 0}
+        self.browser_memory = []
+        
+        # A resumed search continues after its checkpoint, so it counts the pages and jobs checkpointed before
+        resumed = task is not None and bool(task.page and task.start)
+        if resumed:
+            self.progress = {"pages": task.page, "cards": task.start, "jobs": task.jobs}
         
         # Create a more human-readable filename with search parameters
         current_date = datetime.now()
@@ -493,49 +3010,46 @@ class JobScraper:
         else:
             location_slug = 'multiple_locations'
             
+        # Include the experience filter so parallel searches for the same title/location don't collide
+        experience_slug = f"_{experience.replace(' ', '').replace(',', '_')}" if experience else ""
+            
         # Create the filename with search parameters
         self.output_file = os.path.join(
             self.output_dir, 
-            f"{job_slug}_{location_slug}_{date_str}_{time_str}.json"
+            f"{job_slug}_{location_slug}{experience_slug}_{date_str}_{time_str}.json"
         )
-        print(f"Results will be saved to: {self.output_file}")
+        logger.info(f"Results will be saved to: {self.output_file}")
         
         for location in locations:
-            # Attempt LinkedIn with retry mechanism
-            max_retries = 3
-            retry_count = 0
-            success = False
-            
-            while retry_count < max_retries and not success:
-                try:
-                    # Start with LinkedIn
-                    if retry_count > 0:
-                        print(f"Retry attempt {retry_count}/{max_retries} for LinkedIn scraping...")
-                    
-                    self.scrape_linkedin(job_title, location, experience)
-                    
-                    # Consider it a success if we got at least one result
-                    linkedin_count = len(self.results)
-                    if linkedin_count > 0:
-                        success = True
-                        print(f"Successfully scraped {linkedin_count} jobs from LinkedIn")
-                    else:
-                        retry_count += 1
-                        print(f"No LinkedIn results found. Retrying in 5 seconds...")
-                        time.sleep(5)
-                except Exception as e:
-                    retry_count += 1
-                    print(f"Error scraping LinkedIn: {e}")
-                    print(f"Retrying in 5 seconds... ({retry_count}/{max_retries})")
-                    time.sleep(5)
+            # Failed pages are retried inside the scrape, so each search runs once
+            if resumed:
+                self._load_earlier_jobs(search_key(job_title, location, experience), task.started_at)
+            found_before = len(self.results)
+            pages_before = self.progress["pages"]
+            self.query_yield = {"unique_jobs": 0, "last_unique_page": pages_before}
+            try:
+                if self.engine == "http":
+                    self.scrape_linkedin_http(job_title, location, experience, pages_to_scrape, max_jobs)
+                else:
+                    self.scrape_linkedin(job_title, location, experience, pages_to_scrape, max_jobs)
+            except Exception as e:
+                self.metrics.count("search_errors")
+                logger.error(f"Error scraping LinkedIn: {e}")
             
-            # If all retries failed, log a message
-            if not success:
-                print(f"Failed to scrape LinkedIn jobs for {job_title} in {location} after {max_retries} attempts")
+            found = len(self.results) - found_before
+            # Only a search run start to finish in one go tells the planner its yield
+            if not resumed and not self._stopping():
+                self._record_query(self.progress["pages"] - pages_before, found, pages_before)
+            # A resumed search may have found all its jobs before the interruption
+            succeeded = found or (resumed and task.jobs)
+            self.metrics.count("searches_completed" if succeeded else "searches_failed")
+            if succeeded:
+                logger.info(f"Successfully scraped {found} jobs from LinkedIn" + (f" ({self.progress['jobs']} with the earlier attempt)" if resumed else ""))
+            else:
+                logger.error(f"Failed to scrape LinkedIn jobs for {job_title} in {location}")
         
-        # Sort by date, with most recent first
-        # This is a simplistic approach since date formats vary
-        self.results.sort(key=lambda x: x.get('date_posted', "") if x.get('date_posted', "") != "Not specified" else "", reverse=True)
+        # Sort by posting time, most recent first (ISO and relative dates alike, unknown dates last)
+        self.results.sort(key=job_sort_key, reverse=True)
         
         # Show distribution of jobs by source
         source_counts = {}
@@ -544,23 +3058,649 @@ class JobScraper:
             source_counts[source] = source_counts.get(source, 0) + 1
         
         for source, count in source_counts.items():
-            print(f"Found {count} jobs from {source}")
+            logger.info(f"Found {count} jobs from {source}")
             
-        print(f"Keeping all {len(self.results)} jobs found")
+        logger.debug(f"Keeping all {len(self.results)} jobs found")
+        
+        # Keep what the selector plan learned for the next run
+        self.selector_plan.save()
         
         # Save results to file
         filename = self.save_results()
+        browser_memory = None
+        if self.browser_memory:
+            browser_memory = {"peak_mb": round(max(self.browser_memory) / 2**20, 1),
+                              "average_mb": round(sum(self.browser_memory) / len(self.browser_memory) / 2**20, 1)}
+            logger.info(f"Browser memory during this search: peak {browser_memory['peak_mb']:.0f} MB, "
+                        f"average {browser_memory['average_mb']:.0f} MB over {len(self.browser_memory)} pages")
+        self.metrics.record_search(self.current_search, self.engine, self.progress,
+                                   time.perf_counter() - search_started, filename, browser_memory)
+        self.task = None
         
         return filename
     
     def close(self):
-        """Close the Selenium driver."""
-        if hasattr(self, 'driver'):
+        """Close the Selenium driver, HTTP session and job store."""
+        if hasattr(self, 'session'):
+            self.session.close()
+        if self.store is not None:
+            self.store.close()
+        if self._driver is not None:
             try:
-                self.driver.quit()
-                print("Selenium WebDriver closed successfully")
+                self._driver.quit()
+                self._driver = None
+                logger.debug("Selenium WebDriver closed successfully")
             except Exception as e:
-                print(f"Error closing WebDriver: {e}")
+                logger.error(f"Error closing WebDriver: {e}")
+
+
+# Durable queue of a run's searches, so a crashed run can be resumed and several processes can drain one plan
+TASK_QUEUE_FILE = os.path.join("output", "task_queue.db")
+# A claimed search is leased for this long; every completed page renews the lease
+DEFAULT_LEASE_SECONDS = 600
+# A search whose lease has expired this many times (e.g. it keeps killing its worker) is given up on
+TASK_MAX_ATTEMPTS = 3
+
+
+def worker_id():
+    """Lease holder name of the calling thread: host:pid:thread."""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}"
+
+
+def _lease_holder_alive(owner):
+    """False only for holders known to be gone: processes on this host that no longer exist."""
+    host, _, rest = (owner or "").partition(":")
+    pid = rest.partition(":")[0]
+    # Other hosts can't be checked, and os.kill(pid, 0) would terminate the process on Windows
+    if host != socket.gethostname() or not pid.isdigit() or os.name == "nt":
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+class QueueTask:
+    """A leased search with its checkpoint: pages completed, the result offset and the jobs accepted so far.
+    
+    started_at is when the search was first claimed, which is how a resumed search finds the
+    jobs its earlier attempts stored.
+    """
+    
+    COLUMNS = ["id", "run", "position", "title", "location", "experience", "pages", "max_jobs", "page", "start", "jobs",
+               "started_at"]
+    
+    def __init__(self, task_queue, row, owner, total):
+        self.task_queue = task_queue
+        self.owner = owner
+        self.total = total
+        for column, value in zip(self.COLUMNS, row):
+            setattr(self, column, value)
+    
+    def checkpoint(self, page, start, jobs):
+        """Save progress after a completed page and renew the lease; False if the lease was lost."""
+        self.page, self.start, self.jobs = page, start, jobs
+        return self.task_queue.checkpoint(self)
+
+
+class TaskQueue:
+    """SQLite queue of every search of a run, claimed by workers under time-limited leases.
+    
+    The file may live on shared storage so processes on several hosts drain the same run,
+    which is why it keeps SQLite's rollback journal instead of WAL. Claims run in IMMEDIATE
+    transactions, so no two workers get the same search. Leases are wall clock times, so
+    the hosts' clocks need to roughly agree.
+    """
+    
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS tasks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        run TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        location TEXT NOT NULL,
+        experience TEXT,
+        pages INTEGER NOT NULL,
+        max_jobs INTEGER,
+        status TEXT NOT NULL DEFAULT 'queued',
+        owner TEXT,
+        lease_expires REAL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        page INTEGER NOT NULL DEFAULT 0,
+        start INTEGER NOT NULL DEFAULT 0,
+        jobs INTEGER NOT NULL DEFAULT 0,
+        output_file TEXT,
+        started_at TEXT,
+        updated_at TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_tasks_run_status ON tasks (run, status, position);
+    """
+    
+    def __init__(self, path=TASK_QUEUE_FILE, lease_seconds=DEFAULT_LEASE_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Transactions are managed explicitly so claims can take the write lock up front
+        self.conn = sqlite3.connect(path, timeout=60, check_same_thread=False, isolation_level=None)
+        self.conn.executescript(self.SCHEMA)
+        self._add_columns()
+    
+    def _add_columns(self):
+        """Add the columns queues created before them lack. Their searches use the scraper's job limit,
+        and a search that was already running counts as started when it is next claimed."""
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(tasks)")]
+        if "max_jobs" not in columns:
+            self.conn.execute("ALTER TABLE tasks ADD COLUMN max_jobs INTEGER")
+        if "started_at" not in columns:
+            self.conn.execute("ALTER TABLE tasks ADD COLUMN started_at TEXT")
+    
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+    
+    def enqueue(self, run, searches):
+        """Add a run's (title, location, experience, pages, max_jobs) searches in the order they should be claimed."""
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._transaction() as conn:
+            conn.executemany("""
+                INSERT INTO tasks (run, position, title, location, experience, pages, max_jobs, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [(run, position, title, location, experience, pages, max_jobs, now)
+                  for position, (title, location, experience, pages, max_jobs) in enumerate(searches)])
+    
+    def latest_run(self):
+        """The most recently queued run that still has searches to do, or None."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT run FROM tasks WHERE status IN ('queued', 'leased') ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+        return row[0] if row else None
+    
+    def claim(self, run, owner):
+        """Lease the next queued search of a run to owner, after re-queueing leases that ran out.
+        
+        A lease runs out when it expires or, on this host, when its process has died, so a
+        resumed run picks up a crashed run's searches right away. Returns a QueueTask, or
+        None when every search is done or leased to a live worker.
+        """
+        now = time.time()
+        updated_at = datetime.now().isoformat(timespec="seconds")
+        with self._transaction() as conn:
+            leases = conn.execute(
+                "SELECT id, owner, lease_expires, attempts FROM tasks WHERE run = ? AND status = 'leased'", (run,)
+            ).fetchall()
+            for task_id, holder, expires, attempts in leases:
+                if expires > now and _lease_holder_alive(holder):
+                    continue
+                status = "failed" if attempts >= TASK_MAX_ATTEMPTS else "queued"
+                conn.execute("UPDATE tasks SET status = ?, owner = NULL, lease_expires = NULL, updated_at = ? WHERE id = ?",
+                             (status, updated_at, task_id))
+                logger.warning(f"Lease of search {task_id} held by {holder} ran out; "
+                               f"{'giving up after ' + str(attempts) + ' attempts' if status == 'failed' else 're-queued it'}")
+            row = conn.execute(f"""
+                SELECT {", ".join(QueueTask.COLUMNS)} FROM tasks
+                WHERE run = ? AND status = 'queued' ORDER BY position LIMIT 1
+            """, (run,)).fetchone()
+            if row is None:
+                return None
+            conn.execute("""
+                UPDATE tasks SET status = 'leased', owner = ?, lease_expires = ?, attempts = attempts + 1,
+                    started_at = COALESCE(started_at, ?), updated_at = ?
+                WHERE id = ?
+            """, (owner, now + self.lease_seconds, updated_at, updated_at, row[0]))
+            total = conn.execute("SELECT COUNT(*) FROM tasks WHERE run = ?", (run,)).fetchone()[0]
+        # started_at is the last column
+        return QueueTask(self, row[:-1] + (row[-1] or updated_at,), owner, total)
+    
+    def _update_lease(self, task, assignments, values):
+        """Update a task only while `task.owner` still holds its lease; returns whether it did."""
+        with self._transaction() as conn:
+            cursor = conn.execute(f"""
+                UPDATE tasks SET {assignments}, updated_at = ? WHERE id = ? AND owner = ? AND status = 'leased'
+            """, tuple(values) + (datetime.now().isoformat(timespec="seconds"), task.id, task.owner))
+        return cursor.rowcount == 1
+    
+    def checkpoint(self, task):
+        return self._update_lease(task, "page = ?, start = ?, jobs = ?, lease_expires = ?",
+                                  (task.page, task.start, task.jobs, time.time() + self.lease_seconds))
+    
+    def complete(self, task, output_file):
+        return self._update_lease(task, "status = 'done', owner = NULL, lease_expires = NULL, output_file = ?", (output_file,))
+    
+    def release(self, task):
+        """Put an interrupted search back in the queue, keeping its checkpoint; it doesn't count as an attempt."""
+        return self._update_lease(task, "status = 'queued', owner = NULL, lease_expires = NULL, attempts = attempts - 1", ())
+    
+    def counts(self, run):
+        """Return {status: number of searches} for a run."""
+        with self._lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM tasks WHERE run = ? GROUP BY status", (run,)).fetchall()
+        return dict(rows)
+    
+    def leased_elsewhere(self, run):
+        """Number of the run's searches currently leased to other processes."""
+        prefix = f"{socket.gethostname()}:{os.getpid()}:"
+        with self._lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE run = ? AND status = 'leased' AND substr(owner, 1, ?) != ?",
+                (run, len(prefix), prefix)
+            ).fetchone()[0]
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+def drain_queue(task_queue, run, scraper, stop=None):
+    """Claim and run a run's searches on one scraper until none are left; returns the per-search files written."""
+    owner = worker_id()
+    output_files = []
+    while stop is None or not stop.is_set():
+        task = task_queue.claim(run, owner)
+        if task is None:
+            break
+        resuming = f", resuming after page {task.page}" if task.page else ""
+        logger.info(f"[{task.position + 1}/{task.total}] [{threading.current_thread().name}] Searching for: {task.title} "
+                    f"in {task.location} with {task.experience} years experience{resuming}...")
+        try:
+            output_file = scraper.scrape_jobs(task.title, task.location, task.experience, task.pages, task.max_jobs, task=task)
+        except BaseException:
+            task_queue.release(task)
+            raise
+        # A search cut short because the pool is shutting down is finished by a later --resume
+        if stop is not None and stop.is_set():
+            task_queue.release(task)
+            break
+        if not task_queue.complete(task, output_file):
+            logger.warning(f"Search {task.id} was taken over by another worker after its lease expired")
+        if output_file:
+            output_files.append(output_file)
+    return output_files
+
+
+class ScraperPool:
+    """Run searches concurrently on a bounded pool of workers, each with its own JobScraper."""
+    
+    def __init__(self, workers, **scraper_options):
+        self.workers = max(1, workers)
+        self.scraper_options = scraper_options
+        self.scrapers = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stop = threading.Event()
+    
+    def _get_scraper(self):
+        """Return this worker thread's scraper, starting its browser on first use."""
+        scraper = getattr(self._local, "scraper", None)
+        if scraper is None:
+            scraper = JobScraper(**self.scraper_options)
+            scraper.stop = self._stop
+            with self._lock:
+                self.scrapers.append(scraper)
+            self._local.scraper = scraper
+        return scraper
+    
+    def _drain(self, task_queue, run):
+        if self._stop.is_set():
+            return []
+        return drain_queue(task_queue, run, self._get_scraper(), self._stop)
+    
+    def run(self, task_queue, run):
+        """Drain a queued run with every worker and return the per-search output files that were written."""
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="worker")
+        futures = [executor.submit(self._drain, task_queue, run) for _ in range(self.workers)]
+        
+        output_files = []
+        try:
+            for future in as_completed(futures):
+                try:
+                    output_files.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Search failed in worker: {e}")
+        except KeyboardInterrupt:
+            # Stop queued searches from starting; running ones stop after their current page
+            self._stop.set()
+            for future in futures:
+                future.cancel()
+            logger.info("Waiting for running searches to finish their current page...")
+            raise
+        finally:
+            # Workers must be done with the store, stream and browsers before the caller closes them
+            executor.shutdown(wait=True)
+        
+        return output_files
+    
+    def close(self):
+        """Close every worker's browser."""
+        with self._lock:
+            scrapers = list(self.scrapers)
+        for scraper in scrapers:
+            scraper.close()
+
+
+def export_from_store(store, jobs):
+    """Read the given jobs back from the store, falling back to the in-memory records."""
+    if store is None or not jobs:
+        return jobs
+    try:
+        stored = store.export_jobs(job_key(job) for job in jobs)
+    except sqlite3.Error as e:
+        logger.warning(f"Error reading from job store, saving in-memory results instead: {e}")
+        return jobs
+    # Jobs that never made it into the store (e.g. a failed page upsert) are still exported
+    if len(stored) < len({job_key(job) for job in jobs}):
+        stored_ids = {job_key(job) for job in stored}
+        stored.extend(job for job in jobs if job_key(job) not in stored_ids)
+    return stored
+
+
+def finalize_stream(stream_path, output_file, store_path=None, near_duplicate_threshold=0):
+    """Turn a JSONL job stream (or a list of them) into the usual sorted, pretty-printed JSON file."""
+    stream_paths = [path for path in ([stream_path] if isinstance(stream_path, str) else stream_path) if os.path.exists(path)]
+    if not stream_paths:
+        logger.warning(f"No job stream found at {stream_path}")
+        return None
+    # Dedupe while reading so only one copy of each posting is held in memory
+    unique_jobs = {}
+    for path in stream_paths:
+        for job in read_jsonl(path):
+            unique_jobs.setdefault(job_key(job), job)
+    jobs = list(unique_jobs.values())
+    logger.info(f"Finalizing {len(jobs)} unique streamed jobs from {', '.join(stream_paths)}")
+    store = JobStore(store_path) if store_path else None
+    try:
+        # Searches cut short by a crash never reached save_results, so their jobs are indexed here
+        if store is not None:
+            try:
+                store.index_jobs(unique_jobs)
+            except sqlite3.Error as e:
+                logger.error(f"Error updating the full-text index: {e}")
+        return write_results(export_from_store(store, jobs), output_file, near_duplicate_threshold)
+    finally:
+        if store is not None:
+            store.close()
+
+
+# Columnar exports hold the canonical job id plus every record field but the variant lists; these two are numeric
+COLUMN_FIELDS = ("job_id",) + tuple(field for field in JOB_RECORD_FIELDS if field not in VARIANT_FIELDS)
+NUMERIC_COLUMNS = {"posted_epoch", "applicants"}
+
+
+def job_columns(jobs):
+    """Turn a list of jobs into {field: list of values}, one value per job for every COLUMN_FIELDS entry."""
+    columns = {field: [] for field in COLUMN_FIELDS}
+    for job in jobs:
+        columns["job_id"].append(job_key(job))
+        for field in COLUMN_FIELDS[1:]:
+            columns[field].append(job.get(field))
+    return columns
+
+
+def write_columns(jobs, output_file):
+    """Save jobs column by column for vectorized sorting, filtering and merging.
+    
+    .parquet files need pyarrow and keep every field. .npz files need numpy and hold one
+    array per field (numeric columns as float64 with NaN for unknown values) except the
+    free-text description, which would make every string column as wide as the longest one.
+    """
+    columns = job_columns(jobs)
+    try:
+        if output_file.endswith(".parquet"):
+            import pyarrow
+            import pyarrow.parquet
+            pyarrow.parquet.write_table(pyarrow.table(columns), output_file)
+        elif output_file.endswith(".npz"):
+            import numpy
+            arrays = {}
+            for field, values in columns.items():
+                if field in NUMERIC_COLUMNS:
+                    arrays[field] = numpy.array([numpy.nan if value is None else value for value in values], dtype=numpy.float64)
+                elif field != "description":
+                    arrays[field] = numpy.array(["" if value is None else str(value) for value in values], dtype=str)
+            numpy.savez_compressed(output_file, **arrays)
+        else:
+            logger.error(f"Columnar export needs a .parquet or .npz file name, not {output_file}")
+            return None
+    except ImportError as e:
+        logger.error(f"Columnar export to {output_file} needs {e.name} (pip install {'pyarrow' if e.name.startswith('pyarrow') else 'numpy'})")
+        return None
+    except OSError as e:
+        logger.error(f"Error writing columnar export: {e}")
+        return None
+    logger.info(f"Exported {len(jobs)} jobs column by column to {output_file}")
+    return output_file
+
+
+def write_results(jobs, output_file, near_duplicate_threshold=0):
+    """Filter, dedupe, collapse near-duplicates, sort and save job listings to a JSON file."""
+    try:
+        # Each run creates a new file with timestamp, no need to read existing one
+        logger.info(f"Saving results to new file: {output_file}")
+
+        # Records carry a posted_epoch; dicts from older streams get one parsed here, once
+        jobs = [JobRecord.from_dict(job) for job in jobs]
+        
+        # Filter out jobs with "Not available" as title or company
+        filtered_data = []
+        for job in jobs:
+            # Skip jobs with missing/unavailable titles or companies
+            if job.get("title") in ["Not available", "Not specified"] or job.get("company") in ["Not available", "Not specified"]:
+                logger.debug(f"Skipping job with title '{job.get('title')}' at company '{job.get('company')}' - incomplete data")
+                continue
+            filtered_data.append(job)
+
+        logger.info(f"Filtered out {len(jobs) - len(filtered_data)} jobs with missing title or company data")
+
+        # Remove duplicates based on the canonical job id within the filtered results
+        unique_data = []
+        seen_ids = set()
+        for job in filtered_data:
+            if job_key(job) not in seen_ids:
+                # Clean up any excessive whitespace in text fields
+                for field in ["title", "company", "location"]:
+                    if field in job and isinstance(job[field], str):
+                        job[field] = " ".join(job[field].split())
+
+                unique_data.append(job)
+                seen_ids.add(job_key(job))
+
+        if len(unique_data) < len(filtered_data):
+            logger.info(f"Removed {len(filtered_data) - len(unique_data)} duplicate records")
+
+        # The same job reposted under new ids (or per city) becomes one listing with variant links/locations
+        if near_duplicate_threshold:
+            unique_data = collapse_near_duplicates(unique_data, near_duplicate_threshold)
+
+        # Sort the json output by source and posting time, newest first
+        unique_data.sort(key=job_sort_key, reverse=True)
+        unique_data = [job.to_dict() for job in unique_data]
+
+        # Save to the timestamped file with nice formatting
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(unique_data, f, indent=4, ensure_ascii=False, sort_keys=False)
+
+        logger.info(f"Results saved to {output_file} ({len(unique_data)} jobs total)")
+        write_result_index(unique_data, output_file)
+        return output_file
+    except Exception as e:
+        logger.error(f"Error saving results: {e}")
+        return None
+
+
+# Companion index of each result file: fixed-size page shards, a manifest and a catalog of all runs,
+# so the web UI can serve page N of a large result file without parsing the whole thing
+INDEX_DIR_NAME = "index"
+INDEX_PAGE_SIZE = 50
+INDEX_CATALOG_FILE = "catalog.json"
+INDEX_FACET_FIELDS = ["source", "location"]
+INDEX_LOCK = threading.Lock()
+
+
+def _write_json_atomic(path, data, indent=None):
+    """Write JSON to a temporary file and move it into place so readers never see a partial file."""
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+    os.replace(temp_path, path)
+
+
+def _date_range(jobs):
+    dates = [job["date_posted"][:10] for job in jobs if ISO_DATE_PATTERN.match(job.get("date_posted") or "")]
+    return {"min": min(dates), "max": max(dates)} if dates else {"min": None, "max": None}
+
+
+def result_index_dir(output_file):
+    """Directory holding the page shards and manifest of a result file."""
+    name = os.path.splitext(os.path.basename(output_file))[0]
+    return os.path.join(os.path.dirname(output_file) or ".", INDEX_DIR_NAME, name)
+
+
+def write_result_index(jobs, output_file, page_size=INDEX_PAGE_SIZE):
+    """Write page shards and a manifest for a saved result file and add it to the run catalog."""
+    try:
+        index_dir = result_index_dir(output_file)
+        os.makedirs(index_dir, exist_ok=True)
+
+        pages = []
+        facets = {field: {} for field in INDEX_FACET_FIELDS}
+        for number, start in enumerate(range(0, len(jobs), page_size), 1):
+            chunk = jobs[start:start + page_size]
+            shard = f"page-{number:04d}.json"
+            _write_json_atomic(os.path.join(index_dir, shard), chunk)
+            pages.append({"file": shard, "start": start, "count": len(chunk), "date_range": _date_range(chunk)})
+
+            # Facets list the pages each value appears on, so a filtered slice only reads those shards
+            for field, values in facets.items():
+                for job in chunk:
+                    entry = values.setdefault(job.get(field) or "Not specified", {"count": 0, "pages": []})
+                    entry["count"] += 1
+                    if not entry["pages"] or entry["pages"][-1] != number:
+                        entry["pages"].append(number)
+
+        # Drop shards left over from an earlier, longer version of this file
+        shard_names = {page["file"] for page in pages}
+        for name in os.listdir(index_dir):
+            if name.startswith("page-") and name.endswith(".json") and name not in shard_names:
+                os.remove(os.path.join(index_dir, name))
+
+        stat = os.stat(output_file)
+        manifest = {
+            "file": os.path.basename(output_file),
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "source_size": stat.st_size,
+            "source_mtime_ms": int(stat.st_mtime * 1000),
+            "job_count": len(jobs),
+            "page_size": page_size,
+            "page_count": len(pages),
+            "date_range": _date_range(jobs),
+            "sources": {value: entry["count"] for value, entry in facets["source"].items()},
+            "pages": pages,
+            "facets": facets,
+        }
+        _write_json_atomic(os.path.join(index_dir, "manifest.json"), manifest)
+        update_result_catalog(os.path.dirname(output_file) or ".", manifest)
+        logger.debug(f"Result index written to {index_dir} ({len(pages)} pages of {page_size})")
+        return manifest
+    except (OSError, ValueError) as e:
+        # The result file itself is already saved; the UI falls back to reading it directly
+        logger.warning(f"Error writing result index for {output_file}: {e}")
+        return None
+
+
+def update_result_catalog(output_dir, manifest):
+    """Add or replace a result file's entry in output/index/catalog.json."""
+    catalog_path = os.path.join(output_dir, INDEX_DIR_NAME, INDEX_CATALOG_FILE)
+    entry = {field: manifest[field] for field in ["file", "generated_at", "job_count", "page_count", "date_range", "sources"]}
+    with INDEX_LOCK:
+        try:
+            with open(catalog_path, 'r', encoding='utf-8') as f:
+                runs = json.load(f).get("runs", [])
+        except (OSError, ValueError):
+            runs = []
+        # Keep entries whose result file still exists, newest file name first
+        runs = [run for run in runs
+                if run.get("file") != entry["file"] and os.path.exists(os.path.join(output_dir, run.get("file", "")))]
+        runs.append(entry)
+        runs.sort(key=lambda run: run["file"], reverse=True)
+        _write_json_atomic(catalog_path, {"generated_at": datetime.now().isoformat(timespec="seconds"), "runs": runs}, indent=2)
+
+
+def reindex_results(output_dir="output"):
+    """Build the page index for every result file in a directory, e.g. ones saved before indexing existed."""
+    files = sorted(name for name in os.listdir(output_dir) if name.endswith(".json")) if os.path.isdir(output_dir) else []
+    indexed = 0
+    for name in files:
+        path = os.path.join(output_dir, name)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                jobs = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping {path}: {e}")
+            continue
+        if isinstance(jobs, list) and write_result_index(jobs, path):
+            indexed += 1
+    logger.info(f"Indexed {indexed} of {len(files)} result files in {output_dir}")
+
+
+class JsonLogFormatter(logging.Formatter):
+    """One JSON object per log record, for log shippers."""
+    
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def setup_logging(debug=False, log_format="text"):
+    """Log to stderr; --debug shows per-card and per-page detail, otherwise INFO and above."""
+    handler = logging.StreamHandler()
+    if log_format == "json":
+        handler.setFormatter(JsonLogFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(message)s", "%H:%M:%S"))
+    # Third-party libraries (selenium, urllib3) only get to report warnings
+    logging.basicConfig(level=logging.WARNING, handlers=[handler], force=True)
+    logger.setLevel(logging.DEBUG if debug else logging.INFO)
+
+
+def write_run_metrics(metrics, metrics_file, prometheus_file=None):
+    """Save the run's metrics document (and Prometheus textfile) and log where the time went."""
+    snapshot = metrics.snapshot()
+    phases = ", ".join(f"{phase} {stats['seconds']:.2f}s" for phase, stats in
+                       sorted(snapshot["phases"].items(), key=lambda item: -item[1]["seconds"]))
+    if phases:
+        logger.info(f"Time by phase: {phases}")
+    hits, misses = snapshot["counters"].get("selector_plan_hits", 0), snapshot["counters"].get("selector_plan_misses", 0)
+    if hits + misses:
+        logger.info(f"Selector plan: {hits} hits, {misses} misses ({hits / (hits + misses):.1%} of lookups answered by the first selector)")
+    hits, misses = snapshot["counters"].get("page_cache_hits", 0), snapshot["counters"].get("page_cache_misses", 0)
+    if hits + misses:
+        logger.info(f"Page cache: {hits} hits, {misses} misses")
+    try:
+        metrics.write_json(metrics_file)
+        logger.info(f"Run metrics saved to {metrics_file}")
+        if prometheus_file:
+            metrics.write_prometheus(prometheus_file)
+            logger.info(f"Prometheus metrics written to {prometheus_file}")
+    except OSError as e:
+        logger.error(f"Error writing run metrics: {e}")
 
 
 def load_config():
@@ -578,16 +3718,123 @@ def load_config():
         if os.path.exists(config_file):
             with open(config_file, 'r') as f:
                 config = json.load(f)
-                print(f"Loaded configuration from {config_file}")
+                logger.info(f"Loaded configuration from {config_file}")
                 return config
         else:
-            print(f"Config file {config_file} not found. Using default values.")
+            logger.warning(f"Config file {config_file} not found. Using default values.")
             return default_config
     except Exception as e:
-        print(f"Error loading config file: {e}. Using default values.")
+        logger.warning(f"Error loading config file: {e}. Using default values.")
         return default_config
 
 
+# LinkedIn's f_E filter takes comma-separated experience codes (1 internship ... 6 executive) in one query
+EXPERIENCE_CODES_PATTERN = re.compile(r"^[1-6](,[1-6])*$")
+# A query whose last run found nothing other searches hadn't is skipped this many runs in a row, then measured again
+PLANNER_MAX_SKIPS = 2
+
+
+def merge_experience_levels(experience_levels):
+    """Combine f_E codes into one comma-separated filter; other values stay separate queries."""
+    codes, others = set(), []
+    for level in experience_levels:
+        level = level.replace(" ", "") if level else None
+        if level and EXPERIENCE_CODES_PATTERN.match(level):
+            codes.update(level.split(","))
+        elif level not in others:
+            others.append(level)
+    return ([",".join(sorted(codes))] if codes else []) + others
+
+
+def order_titles(job_titles):
+    """Order titles so overlapping ones run back to back, broadest first.
+    
+    Each title follows the one it shares the most words with, so "Software Engineer II"
+    runs right after "Software Engineer" and its overlap is measured against it.
+    """
+    words = {title: set(_normalize_text(title).split()) for title in job_titles}
+    remaining = sorted(words, key=lambda title: (len(words[title]), title))
+    ordered = remaining[:1]
+    del remaining[:1]
+    while remaining:
+        last = words[ordered[-1]]
+        # max() keeps the first of equally similar titles, i.e. the broadest
+        best = max(remaining, key=lambda title: len(last & words[title]) / (len(last | words[title]) or 1))
+        remaining.remove(best)
+        ordered.append(best)
+    return ordered
+
+
+def plan_searches(job_titles, locations, experience_levels, budgets, query_stats=None):
+    """Plan the queries for the title x location x experience product.
+    
+    budgets maps each title to its (max_pages, max_jobs) crawl budget (see crawl_budgets).
+    Experience levels are merged into one f_E filter and overlapping titles run together.
+    With the stats of earlier runs (JobStore.query_stats), queries whose last run found no
+    job other searches hadn't are skipped, and the rest stop one page after the last page
+    that still had such a job. Returns (searches, skipped, report), where searches are
+    (title, location, experience, pages, max_jobs) tuples and skipped the search keys left out.
+    """
+    query_stats = query_stats or {}
+    experiences = merge_experience_levels(experience_levels)
+    searches, skipped, shortened = [], [], 0
+    for location in dict.fromkeys(locations):
+        for job_title in order_titles(job_titles):
+            pages_to_scrape, max_jobs = budgets[job_title]
+            for experience in experiences:
+                key = search_key(job_title, location, experience)
+                stats = query_stats.get(key)
+                pages = pages_to_scrape
+                if stats and stats["pages"]:
+                    if not stats["unique_jobs"] and stats["skipped"] < PLANNER_MAX_SKIPS:
+                        skipped.append(key)
+                        continue
+                    # Results shift between runs, so allow one page past the last productive one
+                    if stats["unique_jobs"] and stats["last_unique_page"] < stats["pages"]:
+                        pages = max(1, min(pages_to_scrape, stats["last_unique_page"] + 1))
+                if pages < pages_to_scrape:
+                    shortened += 1
+                searches.append((job_title, location, experience, pages, max_jobs))
+    naive = len(job_titles) * len(locations) * len(experience_levels)
+    report = {
+        "naive_queries": naive,
+        "naive_page_loads": sum(budgets[job_title][0] for job_title in job_titles) * len(locations) * len(experience_levels),
+        "planned_queries": len(searches),
+        "planned_page_loads": sum(search[3] for search in searches),
+        "skipped_queries": len(skipped),
+        "shortened_queries": shortened,
+    }
+    return searches, skipped, report
+
+
+def crawl_budgets(job_titles, args, config):
+    """Resolve each title's (max_pages, max_jobs) crawl budget.
+    
+    --max-pages/--max-jobs win over the title's entry in config.json's crawl_budgets, which
+    wins over config.json's max_pages/max_jobs.
+    """
+    budgets = {}
+    for job_title in job_titles:
+        budget = config.get("crawl_budgets", {}).get(job_title, {})
+        budgets[job_title] = (
+            args.max_pages or budget.get("max_pages") or config.get("max_pages") or DEFAULT_PAGES_TO_SCRAPE,
+            args.max_jobs or budget.get("max_jobs") or config.get("max_jobs") or DEFAULT_MAX_JOBS,
+        )
+    return budgets
+
+
+def parse_block_resources(value, config):
+    """Resolve the resource blocking profile from the CLI value or config.json's block_resources."""
+    if value == ",".join(DEFAULT_BLOCKED_RESOURCES) and "block_resources" in config:
+        value = config["block_resources"]
+    if isinstance(value, str):
+        value = [] if value.strip().lower() == "none" else [item.strip() for item in value.split(",") if item.strip()]
+    unknown = [item for item in value if item not in BLOCKED_RESOURCE_PATTERNS]
+    if unknown:
+        logger.warning(f"Ignoring unknown resource categories: {', '.join(unknown)}")
+    return [item for item in value if item in BLOCKED_RESOURCE_PATTERNS]
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Job Portal Scraper")
@@ -596,76 +3843,421 @@ def parse_args():
     parser.add_argument("--location", "-l", help="Specific location to search in")
     parser.add_argument("--experience", "-e", help="Specific experience level to filter by (e.g., '0-1', '3-5')")
     parser.add_argument("--debug", "-d", action="store_true", help="Enable debug mode with verbose output")
+    parser.add_argument("--log-format", choices=["text", "json"], default="text",
+                        help="Log as plain text lines or as one JSON object per line (default: text)")
+    parser.add_argument("--metrics-file", metavar="FILE",
+                        help="Where to write the run's JSON metrics (default: output/all_jobs_<timestamp>.metrics.json)")
+    parser.add_argument("--prometheus-file", metavar="FILE",
+                        help="Also write the run's metrics in Prometheus text format, e.g. for node_exporter's textfile collector")
+    parser.add_argument("--extraction", choices=["batch", "legacy"], default="batch",
+                        help="Card extraction mode: one script call per page (batch) or per-element lookups (legacy)")
+    parser.add_argument("--engine", choices=["selenium", "http"], default="selenium",
+                        help="Scraping engine: headless Chrome (selenium) or browser-free guest API requests (http)")
+    parser.add_argument("--guest-url", default=LINKEDIN_GUEST_SEARCH_URL,
+                        help="Guest job search endpoint used by the http engine (e.g. a local stub server)")
+    parser.add_argument("--wait-timeout", type=float, default=15,
+                        help="Maximum seconds to wait for results to appear after a navigation or 'Next' click (default: 15)")
+    parser.add_argument("--store", default=os.path.join("output", "jobs.db"),
+                        help="SQLite job store that keeps every job across runs (default: output/jobs.db)")
+    parser.add_argument("--export-store", metavar="FILE",
+                        help="Export every job in the store to a JSON file and exit")
+    parser.add_argument("--export-columns", metavar="FILE",
+                        help="Export every job in the store column by column to a .parquet (pyarrow) or .npz (numpy) file and exit")
+    parser.add_argument("--reindex", action="store_true",
+                        help="Build the paginated web UI index for every result file in output/, rebuild the job store's "
+                             "full-text index and exit")
+    parser.add_argument("--finalize", metavar="STREAM",
+                        help="Build the sorted JSON file from a .jsonl job stream (e.g. of a killed run) and exit")
+    parser.add_argument("--block-resources", default=",".join(DEFAULT_BLOCKED_RESOURCES),
+                        help="Comma-separated resource categories the browser should not download "
+                             f"({', '.join(BLOCKED_RESOURCE_PATTERNS)}), or 'none' (default: all)")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Print where the time until the first page navigation goes")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Number of searches to run concurrently, each in its own browser (default: 1)")
+    parser.add_argument("--rpm", type=float,
+                        help=f"Maximum page requests per minute to each host, shared by all workers; 0 disables the limit "
+                             f"(default: config.json's requests_per_minute or {DEFAULT_REQUESTS_PER_MINUTE})")
+    parser.add_argument("--selector-plan", default=SELECTOR_PLAN_FILE, metavar="FILE",
+                        help=f"Where the learned selector order is kept between runs, or 'none' to start from the "
+                             f"full cascades and not save it (default: {SELECTOR_PLAN_FILE})")
+    parser.add_argument("--enrich", action="store_true",
+                        help="Fetch every job's detail page for its description, seniority, employment type and applicant count")
+    parser.add_argument("--enrich-concurrency", type=int, default=4,
+                        help="Detail pages fetched at once across all workers (default: 4)")
+    parser.add_argument("--detail-url", default=LINKEDIN_JOB_DETAIL_URL,
+                        help="Job detail endpoint used by --enrich, with a {job_id} placeholder (e.g. a local stub server)")
+    parser.add_argument("--cache", action="store_true",
+                        help="Record fetched search and detail pages to the page cache and reuse them while they are fresh")
+    parser.add_argument("--replay", action="store_true",
+                        help="Run entirely from the page cache, without any network access or browser")
+    parser.add_argument("--cache-dir", default=PAGE_CACHE_DIR, help=f"Page cache directory (default: {PAGE_CACHE_DIR})")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_PAGE_CACHE_TTL_HOURS,
+                        help=f"Hours a cached page is reused before it is fetched again; 0 keeps pages forever "
+                             f"(default: {DEFAULT_PAGE_CACHE_TTL_HOURS})")
+    parser.add_argument("--cache-size", type=float, default=DEFAULT_PAGE_CACHE_SIZE_MB,
+                        help=f"Size in MB above which the least recently used pages are evicted (default: {DEFAULT_PAGE_CACHE_SIZE_MB})")
+    parser.add_argument("--near-duplicate-threshold", type=float, nargs="?", const=NEAR_DUPLICATE_THRESHOLD, default=0,
+                        metavar="SIMILARITY",
+                        help=f"Collapse jobs whose title and company (and description, when enriched) are at least this "
+                             f"similar into one listing with variant links and locations (default: off; "
+                             f"{NEAR_DUPLICATE_THRESHOLD} when given without a value)")
+    parser.add_argument("--no-plan", action="store_true",
+                        help="Run every title x location x experience combination in full instead of the planned searches")
+    parser.add_argument("--plan-only", action="store_true",
+                        help="Print the planned searches and page loads and exit")
+    parser.add_argument("--max-pages", type=int, metavar="N",
+                        help=f"Result pages to load per search, overriding config.json's crawl budgets (default: {DEFAULT_PAGES_TO_SCRAPE})")
+    parser.add_argument("--max-jobs", type=int, metavar="N",
+                        help=f"Jobs to accept per search, overriding config.json's crawl budgets (default: {DEFAULT_MAX_JOBS})")
+    parser.add_argument("--tabs", type=tabs_count, default=1, metavar="N",
+                        help=f"Load this many result pages (at most {MAX_TABS}) at once by their start= offset, in browser tabs "
+                             f"or concurrent guest API requests; pagination stops at the first page without new jobs (default: 1)")
+    parser.add_argument("--browser-memory", type=float, default=DEFAULT_BROWSER_MEMORY_MB, metavar="MB",
+                        help=f"Restart Chrome between searches once its processes use this much memory, and empty it "
+                             f"above {BROWSER_SOFT_RECYCLE_RATIO:.0%}% of it; 0 disables it (default: {DEFAULT_BROWSER_MEMORY_MB})")
+    parser.add_argument("--browser-pages", type=int, default=DEFAULT_BROWSER_MAX_PAGES, metavar="N",
+                        help=f"Restart Chrome between searches after it has served this many pages; 0 disables it "
+                             f"(default: {DEFAULT_BROWSER_MAX_PAGES})")
+    parser.add_argument("--queue", default=TASK_QUEUE_FILE, metavar="FILE",
+                        help=f"SQLite task queue the run's searches are claimed from; put it on shared storage to "
+                             f"drain one run from several hosts (default: {TASK_QUEUE_FILE})")
+    parser.add_argument("--resume", nargs="?", const="latest", metavar="RUN",
+                        help="Continue an unfinished run from the task queue instead of starting a new one "
+                             "(default: the latest unfinished run); also how extra processes join a run")
+    parser.add_argument("--lease", type=float, default=DEFAULT_LEASE_SECONDS,
+                        help=f"Seconds a claimed search stays leased without progress before other workers may take it over "
+                             f"(default: {DEFAULT_LEASE_SECONDS})")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help=f"Retries per failed page load, with exponential backoff (default: {DEFAULT_RETRIES})")
     
     return parser.parse_args()
 
 
+def parse_date(value):
+    """argparse type for YYYY-MM-DD dates, as Unix seconds at UTC midnight like posted_epoch."""
+    try:
+        return int(datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc).timestamp())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a YYYY-MM-DD date, got {value!r}")
+
+
+def parse_query_args(argv):
+    """Parse the arguments of the query subcommand."""
+    parser = argparse.ArgumentParser(prog="job_scraper.py query", description="Search every stored job through the full-text index")
+    
+    parser.add_argument("terms", nargs="*",
+                        help='What to match, e.g. data* AND (company:acme OR company:"big corp") location:pune. Terms side by '
+                             'side must all match; AND, OR, NOT, parentheses, "phrases", prefix* and title:, company:, '
+                             'location: or description: are supported. Without terms every job matches')
+    parser.add_argument("--since", type=parse_date, metavar="YYYY-MM-DD", help="Only jobs posted on or after this date")
+    parser.add_argument("--until", type=parse_date, metavar="YYYY-MM-DD", help="Only jobs posted on or before this date")
+    parser.add_argument("--days", type=int, metavar="N", help="Only jobs posted in the last N days")
+    parser.add_argument("--page", type=int, default=1, help="Page of matches to show (default: 1)")
+    parser.add_argument("--per-page", type=int, default=20, help="Matches per page (default: 20)")
+    parser.add_argument("--sort", choices=["date", "relevance"], default="date",
+                        help="Newest first, or best match first with title matches ranked highest (default: date)")
+    parser.add_argument("--json", action="store_true", help="Print the page as JSON, with the match count")
+    parser.add_argument("--store", default=os.path.join("output", "jobs.db"),
+                        help="SQLite job store to search (default: output/jobs.db)")
+    parser.add_argument("--debug", "-d", action="store_true", help="Log the FTS5 expression the query was turned into")
+    
+    return parser.parse_args(argv)
+
+
+def run_query(argv):
+    """The query subcommand: print one page of the stored jobs matching the terms and date range."""
+    args = parse_query_args(argv)
+    setup_logging(args.debug)
+    if not os.path.exists(args.store):
+        logger.error(f"No job store at {args.store}")
+        return
+    
+    query = " ".join(args.terms)
+    since = args.since
+    if args.days is not None:
+        since = max(since or 0, int(time.time()) - args.days * 86400)
+    # --until names the last day to include
+    until = args.until + 86400 if args.until is not None else None
+    page, per_page = max(1, args.page), max(1, args.per_page)
+    try:
+        logger.debug(f"FTS5 expression: {fts_query(query) or '(none)'}")
+    except ValueError as e:
+        logger.error(f"Invalid query: {e}")
+        return
+    
+    store = JobStore(args.store)
+    try:
+        started = time.perf_counter()
+        total, jobs = store.search_jobs(query, since, until, per_page, (page - 1) * per_page, args.sort)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+    except sqlite3.OperationalError as e:
+        logger.error(f"Could not run the query: {e}")
+        return
+    finally:
+        store.close()
+    
+    pages = (total + per_page - 1) // per_page
+    if args.json:
+        print(json.dumps({"query": query, "total": total, "page": page, "pages": pages, "jobs": jobs}, indent=2, ensure_ascii=False))
+    else:
+        for job in jobs:
+            posted = datetime.fromtimestamp(job["posted_epoch"], timezone.utc).strftime("%Y-%m-%d") if job.get("posted_epoch") else "?"
+            print(f"{posted:<10}  {job['title']} | {job['company']} | {job['location']}")
+            print(f"{'':<10}  {job['link']}")
+    logger.info(f"{total} matching jobs in {elapsed_ms:.1f} ms, page {page} of {max(pages, 1)}")
+
+
 def main():
+    # `job_scraper.py query ...` searches the job store instead of scraping
+    if sys.argv[1:2] == ["query"]:
+        run_query(sys.argv[2:])
+        return
+    
     # Parse command line arguments
     args = parse_args()
     
     # Enable debug mode with verbose output if requested
+    setup_logging(args.debug, args.log_format)
     if args.debug:
-        print("Debug mode enabled")
+        logger.debug("Debug mode enabled")
+    
+    # Index result files saved by older versions (or edited by hand)
+    if args.reindex:
+        reindex_results("output")
+        if os.path.exists(args.store):
+            store = JobStore(args.store)
+            try:
+                logger.info(f"Rebuilt the full-text index of {store.index_jobs()} jobs in {args.store}")
+            finally:
+                store.close()
+        return
+    
+    near_duplicate_threshold = args.near_duplicate_threshold
+    
+    # Recover the JSON output of an earlier run from its job stream
+    if args.finalize:
+        finalize_stream(args.finalize, os.path.splitext(args.finalize)[0] + ".json", args.store, near_duplicate_threshold)
+        return
+    
+    # Export the whole job store instead of scraping
+    if args.export_store or args.export_columns:
+        store = JobStore(args.store)
+        try:
+            jobs = store.export_jobs()
+            if args.export_store:
+                write_results(jobs, args.export_store, near_duplicate_threshold)
+            if args.export_columns:
+                write_columns(jobs, args.export_columns)
+        finally:
+            store.close()
+        return
     
     # Load search parameters from config file
     config = load_config()
     
-    # Override with command line arguments if provided
-    job_titles = [args.title] if args.title else config["job_titles"]
-    locations = [args.location] if args.location else config["locations"]
-    experience_levels = [args.experience] if args.experience else config["experience_levels"]
+    # Searches live in a durable queue, so a crashed run can be resumed and other processes can help drain it
+    if args.resume:
+        task_queue = TaskQueue(args.queue, lease_seconds=args.lease)
+        run_name = task_queue.latest_run() if args.resume == "latest" else args.resume
+        counts = task_queue.counts(run_name) if run_name else {}
+        if not counts.get("queued") and not counts.get("leased"):
+            logger.error(f"No unfinished run {'' if args.resume == 'latest' else args.resume + ' '}in {args.queue}")
+            task_queue.close()
+            return
+        logger.info(f"Resuming {run_name}: {counts.get('done', 0)} searches done, {counts.get('queued', 0)} queued, "
+                    f"{counts.get('leased', 0)} leased, {counts.get('failed', 0)} failed")
+        # Each process draining a run streams to its own file; they are merged when the run is finalized
+        stream_name = f"{run_name}.{socket.gethostname()}-{os.getpid()}"
+        skipped, plan = [], None
+    else:
+        searches, skipped, plan = build_searches(args, config)
+        if args.plan_only:
+            return
+        run_name = f"all_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        task_queue = TaskQueue(args.queue, lease_seconds=args.lease)
+        task_queue.enqueue(run_name, searches)
+        logger.info(f"Queued {len(searches)} searches as {run_name} in {args.queue}")
+        stream_name = run_name
     
-    # Display search parameters
-    print("\nSearch Parameters:")
-    print(f"Job Titles: {', '.join(job_titles)}")
-    print(f"Locations: {', '.join(locations)}")
-    print(f"Experience Levels: {', '.join(experience_levels)}")
+    # Every accepted job is streamed to a JSONL file as it is found; the JSON file is built from it at the end
+    output_file = os.path.join("output", f"{run_name}.json")
+    stream = JsonlWriter(os.path.join("output", f"{stream_name}.jsonl"))
+    logger.info(f"Streaming jobs to: {stream.path}")
+    metrics = RunMetrics()
+    metrics_file = args.metrics_file or os.path.join("output", f"{stream_name}.metrics.json")
+    if plan is not None:
+        for name in ("naive_page_loads", "planned_page_loads", "skipped_queries", "shortened_queries"):
+            metrics.count(name, plan[name])
+    if skipped:
+        store = JobStore(args.store)
+        try:
+            store.skip_queries(skipped)
+        finally:
+            store.close()
+    
+    rate_limiter = RateLimiter(args.rpm if args.rpm is not None else config.get("requests_per_minute", DEFAULT_REQUESTS_PER_MINUTE))
+    page_cache = None
+    if args.cache or args.replay:
+        page_cache = PageCache(args.cache_dir, ttl=args.cache_ttl * 3600, max_bytes=args.cache_size * 2**20, offline=args.replay)
+        if args.replay:
+            logger.info(f"Replaying from the page cache in {args.cache_dir} ({page_cache.stats()['pages']} pages)")
+    # Detail pages count against the same per-host request budget as the searches
+    enricher = JobEnricher(args.detail_url, args.enrich_concurrency, rate_limiter=rate_limiter, page_cache=page_cache) if args.enrich else None
+    
+    scraper_options = {
+        "extraction": args.extraction,
+        "engine": args.engine,
+        "guest_search_url": args.guest_url,
+        "wait_timeout": args.wait_timeout,
+        "store_path": args.store,
+        "stream": stream,
+        "startup_profile": args.startup_profile,
+        "block_resources": parse_block_resources(args.block_resources, config),
+        "metrics": metrics,
+        # One limiter for the whole run so parallel workers share the request budget
+        "rate_limiter": rate_limiter,
+        "retries": max(0, args.retries),
+        "selector_plan": SelectorPlan(None if args.selector_plan.lower() == "none" else args.selector_plan),
+        "enricher": enricher,
+        "page_cache": page_cache,
+        "near_duplicate_threshold": near_duplicate_threshold,
+        "browser_memory_mb": args.browser_memory,
+        "browser_max_pages": args.browser_pages,
+        "tabs": args.tabs,
+    }
+    
+    if args.workers > 1:
+        try:
+            run_parallel(task_queue, run_name, args.workers, scraper_options, output_file)
+        finally:
+            task_queue.close()
+            if enricher is not None:
+                enricher.close()
+            if page_cache is not None:
+                page_cache.close()
+            write_run_metrics(metrics, metrics_file, args.prometheus_file)
+        return
     
     # Create a single instance of JobScraper to reuse
-    scraper = JobScraper()
-    print("Job scraper initialized.")
-    print(f"Output will be saved to: {scraper.output_file}")
+    scraper = JobScraper(**scraper_options)
+    logger.debug("Job scraper initialized.")
+    logger.info(f"Output will be saved to: {output_file}")
     
     try:
-        # Each run now creates a new timestamped output file
-        output_file = scraper.output_file
+        logger.info(f"Will perform {task_queue.counts(run_name).get('queued', 0)} different job searches...")
         
-        # Instead of nested loops, create a simpler list of job searches
-        searches = []
-        for job_title in job_titles:
-            for location in locations:
-                for experience in experience_levels:
-                    searches.append((job_title, location, experience))
+        # Claim the queued searches one by one; the shared rate limiter paces consecutive searches
+        drain_queue(task_queue, run_name, scraper)
         
-        print(f"\nWill perform {len(searches)} different job searches...")
-        
-        # Perform each search one by one
-        for i, (job_title, location, experience) in enumerate(searches, 1):
-            print(f"\n[{i}/{len(searches)}] Searching for: {job_title} in {location} with {experience} years experience...")
-            
-            # Run the scraper for this combination with retries
-            scraper.scrape_jobs(job_title, location, experience)
-            
-            # Add a small delay between searches
-            if i < len(searches):  # Don't delay after the last search
-                delay = random.uniform(3, 5)
-                print(f"Waiting {delay:.1f} seconds before next search...")
-                time.sleep(delay)
-        
-        print(f"\nAll job searches completed! Results saved to: {output_file}")
+        stream.close()
+        if finalize_run(task_queue, run_name, output_file, args.store, near_duplicate_threshold):
+            logger.info(f"All job searches completed! Results saved to: {output_file}")
     
     except KeyboardInterrupt:
-        print("\nSearch interrupted by user. Saving current results...")
+        logger.warning("Search interrupted by user. Saving current results; --resume continues the run...")
         scraper.save_results()
-        print("Partial results saved.")
+        stream.close()
+        finalize_run(task_queue, run_name, output_file, args.store, near_duplicate_threshold)
+        logger.info("Partial results saved.")
     except Exception as e:
-        print(f"\nAn error occurred: {e}")
+        logger.error(f"An error occurred: {e}")
+        stream.close()
+        finalize_run(task_queue, run_name, output_file, args.store, near_duplicate_threshold)
     finally:
         # Always close the browser
-        print("Closing browser...")
+        logger.info("Closing browser...")
         scraper.close()
-        print("Done!")
+        task_queue.close()
+        if enricher is not None:
+            enricher.close()
+        if page_cache is not None:
+            page_cache.close()
+        stream.close()
+        write_run_metrics(metrics, metrics_file, args.prometheus_file)
+        logger.info("Done!")
+
+
+def build_searches(args, config):
+    """Expand the configured titles, locations and experience levels into searches, planned unless --no-plan."""
+    # Override with command line arguments if provided
+    job_titles = [args.title] if args.title else config["job_titles"]
+    locations = [args.location] if args.location else config["locations"]
+    experience_levels = [args.experience] if args.experience else config["experience_levels"]
+    
+    # Display search parameters
+    logger.info("Search Parameters:")
+    logger.info(f"Job Titles: {', '.join(job_titles)}")
+    logger.info(f"Locations: {', '.join(locations)}")
+    logger.info(f"Experience Levels: {', '.join(experience_levels)}")
+    
+    budgets = crawl_budgets(job_titles, args, config)
+    if args.no_plan:
+        searches = [(job_title, location, experience) + budgets[job_title]
+                    for job_title in job_titles for location in locations for experience in experience_levels]
+        return searches, [], None
+    
+    # Plan the searches from the title x location x experience product and what earlier runs yielded
+    query_stats = {}
+    if os.path.exists(args.store):
+        store = JobStore(args.store)
+        try:
+            query_stats = store.query_stats()
+        finally:
+            store.close()
+    searches, skipped, plan = plan_searches(job_titles, locations, experience_levels, budgets, query_stats)
+    logger.info(f"Search plan: {plan['planned_queries']} queries and up to {plan['planned_page_loads']} page loads "
+                f"instead of {plan['naive_queries']} and {plan['naive_page_loads']} "
+                f"({plan['skipped_queries']} low-yield queries skipped, {plan['shortened_queries']} shortened)")
+    for job_title, location, experience, pages, max_jobs in searches:
+        logger.info(f"  {job_title} in {location} with {experience or 'any'} experience, {pages} page(s), up to {max_jobs} jobs")
+    return searches, skipped, plan
+
+
+def finalize_run(task_queue, run, output_file, store_path=None, near_duplicate_threshold=0):
+    """Merge every job stream of a queued run into its JSON file, unless other processes are still working on it."""
+    others = task_queue.leased_elsewhere(run)
+    if others:
+        logger.info(f"{others} searches of {run} are still running in other processes; the last one to finish writes {output_file}")
+        return None
+    counts = task_queue.counts(run)
+    if counts.get("failed"):
+        logger.warning(f"{counts['failed']} searches of {run} failed on every attempt")
+    directory = os.path.dirname(output_file)
+    streams = sorted(os.path.join(directory, name) for name in os.listdir(directory or ".")
+                     if name == f"{run}.jsonl" or (name.startswith(f"{run}.") and name.endswith(".jsonl")))
+    return finalize_stream(streams, output_file, store_path, near_duplicate_threshold)
+
+
+def run_parallel(task_queue, run, workers, scraper_options, output_file):
+    """Drain a queued run with a pool of workers and merge the run's streamed results into one file."""
+    queued = task_queue.counts(run).get("queued", 0)
+    workers = min(workers, queued) or 1
+    pool = ScraperPool(workers, **scraper_options)
+    stream = scraper_options["stream"]
+    store_path, threshold = scraper_options.get("store_path"), scraper_options.get("near_duplicate_threshold")
+    logger.info(f"Will perform {queued} different job searches across {workers} workers...")
+    
+    try:
+        output_files = pool.run(task_queue, run)
+        logger.info(f"All job searches completed! {len(output_files)} search result files written.")
+        stream.close()
+        finalize_run(task_queue, run, output_file, store_path, threshold)
+    except KeyboardInterrupt:
+        logger.warning("Search interrupted by user. Saving results streamed so far; --resume continues the run...")
+        stream.close()
+        finalize_run(task_queue, run, output_file, store_path, threshold)
+        logger.info("Partial results saved.")
+    except Exception as e:
+        logger.error(f"An error occurred: {e}")
+        stream.close()
+        finalize_run(task_queue, run, output_file, store_path, threshold)
+    finally:
+        # Always close every worker's browser
+        logger.info("Closing browsers...")
+        pool.close()
+        stream.close()
+        logger.info("Done!")
 
 
 if __name__ == "__main__":
@@ -7,6 +7,18 @@ document.addEventListener('DOMContentLoaded', function() {
     const loadingMessage = document.getElementById('loadingMessage');
     const jobListingsContainer = document.getElementById('jobListingsContainer');
     const jobListingsBody = document.getElementById('jobListingsBody');
+    const jobFilterForm = document.getElementById('jobFilterForm');
+    const filterQuery = document.getElementById('filterQuery');
+    const filterLocation = document.getElementById('filterLocation');
+    const jobPagination = document.getElementById('jobPagination');
+    const prevPageButton = document.getElementById('prevPageButton');
+    const nextPageButton = document.getElementById('nextPageButton');
+    const pageInfo = document.getElementById('pageInfo');
+    
+    // File and page currently shown (results are served one page at a time)
+    const initialFileSpan = document.getElementById('currentFileName');
+    let currentFile = initialFileSpan ? initialFileSpan.getAttribute('data-filename') : null;
+    let currentPage = 1;
 
     // Function to update the table with new job data
     function updateJobListings(jobs) {
@@ -65,8 +77,51 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    // Function to update the previous/next controls for the page that was loaded
+    function updatePagination(data) {
+        if (!jobPagination) return;
+        
+        const hasMore = data.hasMore;
+        jobPagination.classList.toggle('d-none', data.page <= 1 && !hasMore);
+        prevPageButton.disabled = data.page <= 1;
+        nextPageButton.disabled = !hasMore;
+        pageInfo.textContent = data.pageCount ? `Page ${data.page} of ${data.pageCount}` : `Page ${data.page}`;
+    }
+    
+    // Function to refill the location filter with the locations of a newly selected file
+    function updateLocationFilter(locations) {
+        if (!filterLocation || !locations) return;
+        
+        filterLocation.innerHTML = '<option value="">All locations</option>';
+        locations.forEach(([location, count]) => {
+            const option = document.createElement('option');
+            option.value = location;
+            option.textContent = `${location} (${count})`;
+            filterLocation.appendChild(option);
+        });
+    }
+    
+    // Build the page and filter query string for a job data request
+    function jobQuery(page) {
+        const params = new URLSearchParams({ page: page });
+        if (filterQuery && filterQuery.value.trim()) {
+            params.set('q', filterQuery.value.trim());
+        }
+        if (filterLocation && filterLocation.value) {
+            params.set('location', filterLocation.value);
+        }
+        return params.toString();
+    }
+    
     // Function to load job data from a specific file
-    function loadJobFile(filename) {
+    function loadJobFile(filename, page = 1) {
+        const fileChanged = filename !== currentFile;
+        if (fileChanged) {
+            // Filters of the previous file don't apply to the new one
+            if (filterQuery) filterQuery.value = '';
+            if (filterLocation) filterLocation.value = '';
+        }
+        
         // Show loading indicator
         loadingMessage.classList.remove('d-none');
         document.getElementById('loadingText').textContent = `Loading jobs from ${filename}...`;
@@ -78,7 +133,7 @@ document.addEventListener('DOMContentLoaded', function() {
         }
         
         // Fetch job data from the server
-        fetch(`/jobs/${filename}`)
+        fetch(`/jobs/${encodeURIComponent(filename)}?${jobQuery(page)}`)
             .then(response => {
                 if (!response.ok) {
                     throw new Error('Network response was not ok');
@@ -89,6 +144,13 @@ document.addEventListener('DOMContentLoaded', function() {
                 if (data.success) {
                     // Update the job listings
                     updateJobListings(data.jobs);
+                    updatePagination(data);
+                    if (fileChanged) {
+                        updateLocationFilter(data.locations);
+                    }
+                    currentFile = filename;
+                    currentPage = data.page;
+                    const countText = data.jobCount !== null ? data.jobCount : 'matching';
                     
                     // Format the filename for display
                     let displayName = filename;
@@ -113,7 +175,7 @@ document.addEventListener('DOMContentLoaded', function() {
                             fileNameSpan = document.createElement('span');
                             fileNameSpan.id = 'currentFileName';
                             // Replace any existing content with our new span
-                            headerText.innerHTML = `Showing ${data.jobCount} jobs from `;
+                            headerText.innerHTML = `Showing ${countText} jobs from `;
                             headerText.appendChild(fileNameSpan);
                         }
                         
@@ -121,12 +183,12 @@ document.addEventListener('DOMContentLoaded', function() {
                         fileNameSpan.textContent = displayName;
                         
                         // Make sure the rest of the text is correct
-                        if (headerText.textContent.indexOf(`Showing ${data.jobCount} jobs from`) === -1) {
-                            headerText.childNodes[0].nodeValue = `Showing ${data.jobCount} jobs from `;
+                        if (headerText.textContent.indexOf(`Showing ${countText} jobs from`) === -1) {
+                            headerText.childNodes[0].nodeValue = `Showing ${countText} jobs from `;
                         }
                     }
                     
-                    console.log(`Loaded ${data.jobCount} jobs from ${filename}`);
+                    console.log(`Loaded page ${data.page} (${data.jobs.length} jobs) from ${filename}`);
                 } else {
                     console.error('Error loading job data:', data.error);
                     alert(`Failed to load job data: ${data.error}`);
@@ -162,6 +224,35 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
 
+    // Page through the current file
+    if (prevPageButton && nextPageButton) {
+        prevPageButton.addEventListener('click', function() {
+            if (currentFile && currentPage > 1) {
+                loadJobFile(currentFile, currentPage - 1);
+            }
+        });
+        nextPageButton.addEventListener('click', function() {
+            if (currentFile) {
+                loadJobFile(currentFile, currentPage + 1);
+            }
+        });
+    }
+    
+    // Filter the current file by text and location, starting again from the first page
+    if (jobFilterForm) {
+        jobFilterForm.addEventListener('submit', function(e) {
+            e.preventDefault();
+            if (currentFile) {
+                loadJobFile(currentFile, 1);
+            }
+        });
+        filterLocation.addEventListener('change', function() {
+            if (currentFile) {
+                loadJobFile(currentFile, 1);
+            }
+        });
+    }
+
     // Handle form submission for running the scraper
     const scraperForm = document.querySelector('form[action="/run-scraper"]');
     if (scraperForm) {
@@ -222,11 +313,13 @@ document.addEventListener('DOMContentLoaded', function() {
                 body: JSON.stringify(formData)
             })
             .then(response => {
-                // Initial response received, now we poll for completion
+                // Job queued, now we poll for completion
                 if (response.ok) {
                     return response.json();
                 } else {
-                    throw new Error('Failed to start scraper');
+                    return response.json().then(body => {
+                        throw new Error(body.details || body.error || 'Failed to start scraper');
+                    });
                 }
             })
             .then(data => {
@@ -236,111 +329,92 @@ document.addEventListener('DOMContentLoaded', function() {
                 statusContainer.querySelector('strong').textContent = 
                     `Scraping LinkedIn for "${title}" jobs in "${location}"...`;
                 
-                // Set up a progress animation
                 const progressBar = document.getElementById('scraperProgressBar');
-                let progress = 10;
-                let progressTimer = setInterval(() => {
-                    progress += 5;
-                    if (progress > 95) progress = 95; // Never reach 100% until truly complete
-                    progressBar.style.width = `${progress}%`;
-                }, 10000); // Increment every 10 seconds
                 
-                // Poll for completion - check every 10 seconds
+                // Poll the scraper job status every few seconds
                 let pollCount = 0;
-                const maxPolls = 90; // 15 minutes max (90 * 10 seconds)
+                const maxPolls = 450; // 15 minutes max (450 * 2 seconds)
+                let pollTimer = null;
+                
+                function finishWithMessage(html) {
+                    clearTimeout(pollTimer);
+                    statusContainer.innerHTML = html;
+                    
+                    // Re-enable the submit button
+                    submitBtn.disabled = false;
+                    submitBtn.innerHTML = originalBtnText;
+                }
                 
                 function checkScraperStatus() {
                     pollCount++;
                     
-                    // Check if the latest file has been updated
-                    fetch('/api/jobs')
+                    fetch(`/scraper-status/${data.jobId}`)
                         .then(response => response.json())
-                        .then(jobs => {
-                            // Check if we have a new file
-                            const headerText = document.querySelector('header p.text-muted');
-                            const currentFileElement = document.getElementById('currentFileName');
-                            const currentFile = currentFileElement ? currentFileElement.getAttribute('data-filename') : null;
+                        .then(job => {
+                            if (job.status === 'done') {
+                                progressBar.style.width = '100%';
+                                progressBar.classList.remove('progress-bar-animated');
+                                
+                                finishWithMessage(`
+                                    <div class="alert alert-success">
+                                        <strong>Scraper completed successfully!</strong>
+                                        <p>Found ${job.progress.jobs} jobs on ${job.progress.pages} pages. <a href="javascript:void(0)" id="loadNewResults">Click here</a> to view them.</p>
+                                    </div>
+                                `);
+                                
+                                // Add event listener to the link
+                                document.getElementById('loadNewResults').addEventListener('click', function() {
+                                    loadJobFile(job.output_filename);
+                                    window.scrollTo(0, 0);
+                                });
+                                
+                                // Load the new results
+                                loadJobFile(job.output_filename);
+                                return;
+                            }
+                            
+                            if (job.status === 'failed' || (job.error && !job.status)) {
+                                finishWithMessage(`
+                                    <div class="alert alert-danger">
+                                        <strong>Scraper failed</strong>
+                                        <p>${job.error || 'Unknown error'}</p>
+                                    </div>
+                                `);
+                                return;
+                            }
                             
-                            // If poll limit reached, assume it's complete or failed
+                            // If poll limit reached, stop watching
                             if (pollCount >= maxPolls) {
-                                clearInterval(progressTimer);
-                                clearTimeout(pollTimer);
-                                
-                                // Update the status
-                                statusContainer.innerHTML = `
+                                finishWithMessage(`
                                     <div class="alert alert-warning">
                                         <strong>Scraper process timed out</strong>
                                         <p>The scraper might still be running. Refresh the page to check for new results.</p>
                                     </div>
-                                `;
-                                
-                                // Re-enable the submit button
-                                submitBtn.disabled = false;
-                                submitBtn.innerHTML = originalBtnText;
+                                `);
                                 return;
                             }
                             
-                            // Check if we have any files
-                            fetch('/')
-                                .then(response => response.text())
-                                .then(html => {
-                                    const parser = new DOMParser();
-                                    const doc = parser.parseFromString(html, 'text/html');
-                                    const fileSelector = doc.getElementById('fileSelector');
-                                    
-                                    if (fileSelector) {
-                                        const options = fileSelector.querySelectorAll('option');
-                                        if (options.length > 0) {
-                                            const latestFile = options[0].value;
-                                            
-                                            // Check if we have a new file that we didn't have before
-                                            if (currentFile && latestFile !== currentFile) {
-                                                // Scraper has finished with a new file!
-                                                clearInterval(progressTimer);
-                                                clearTimeout(pollTimer);
-                                                
-                                                // Update the progress to 100%
-                                                progressBar.style.width = '100%';
-                                                progressBar.classList.remove('progress-bar-animated');
-                                                
-                                                // Update the status
-                                                statusContainer.innerHTML = `
-                                                    <div class="alert alert-success">
-                                                        <strong>Scraper completed successfully!</strong>
-                                                        <p>New job listings have been found. <a href="javascript:void(0)" id="loadNewResults">Click here</a> to view them.</p>
-                                                    </div>
-                                                `;
-                                                
-                                                // Add event listener to the link
-                                                document.getElementById('loadNewResults').addEventListener('click', function() {
-                                                    loadJobFile(latestFile);
-                                                    window.scrollTo(0, 0);
-                                                });
-                                                
-                                                // Re-enable the submit button
-                                                submitBtn.disabled = false;
-                                                submitBtn.innerHTML = originalBtnText;
-                                                
-                                                // Load the new results
-                                                loadJobFile(latestFile);
-                                                return;
-                                            }
-                                        }
-                                    }
-                                    
-                                    // Continue polling
-                                    pollTimer = setTimeout(checkScraperStatus, 10000);
-                                });
+                            // Show real progress while the job is queued or running
+                            const label = statusContainer.querySelector('strong');
+                            if (job.status === 'queued') {
+                                label.textContent = `Waiting for a free scraper for "${title}" jobs in "${location}"...`;
+                            } else if (label) {
+                                label.textContent = `Scraping LinkedIn for "${title}" jobs in "${location}": ` +
+                                    `${job.progress.pages} pages, ${job.progress.cards} cards, ${job.progress.jobs} jobs so far...`;
+                                progressBar.style.width = `${Math.min(95, 10 + job.progress.pages * 15)}%`;
+                            }
+                            
+                            pollTimer = setTimeout(checkScraperStatus, 2000);
                         })
                         .catch(error => {
                             console.error('Error checking scraper status:', error);
                             // Continue polling despite errors
-                            pollTimer = setTimeout(checkScraperStatus, 10000);
+                            pollTimer = setTimeout(checkScraperStatus, 5000);
                         });
                 }
                 
                 // Start polling after a short delay
-                let pollTimer = setTimeout(checkScraperStatus, 5000);
+                pollTimer = setTimeout(checkScraperStatus, 1000);
             })
             .catch(error => {
                 console.error('Error starting scraper:', error);
@@ -0,0 +1,291 @@
+import json
+import logging
+import os
+import queue
+import threading
+import uuid
+import argparse
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from job_scraper import (JobEnricher, JobScraper, RateLimiter, RunMetrics, SelectorPlan, DEFAULT_BROWSER_MAX_PAGES,
+                         DEFAULT_BROWSER_MEMORY_MB, DEFAULT_REQUESTS_PER_MINUTE, LINKEDIN_GUEST_SEARCH_URL, MAX_TABS,
+                         setup_logging, tabs_count)
+
+logger = logging.getLogger("job_scraper.daemon")
+
+
+class ScraperDaemon:
+    """Long-lived scraper process that runs queued searches on warm JobScraper workers."""
+
+    def __init__(self, workers=1, queue_size=10, history_size=200, warm=True, **scraper_options):
+        self.workers = max(1, workers)
+        self.scraper_options = scraper_options
+        self.warm = warm
+        self.history_size = history_size
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.jobs = {}
+        self.scrapers = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        """Start the worker threads, each with its own scraper (and browser)."""
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"worker-{i+1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, title, location, experience=None, max_pages=None, max_jobs=None):
+        """Queue a search, optionally with its own crawl budget, and return its job record, or None if the queue is full."""
+        job = {
+            "id": uuid.uuid4().hex[:12],
+            "status": "queued",
+            "title": title,
+            "location": location,
+            "experience": experience,
+            "max_pages": max_pages,
+            "max_jobs": max_jobs,
+            "progress": {"pages": 0, "cards": 0, "jobs": 0},
+            "output_file": None,
+            "metrics": None,
+            "error": None,
+            "submitted_at": datetime.now().isoformat(timespec="seconds"),
+            "started_at": None,
+            "finished_at": None,
+        }
+        with self._lock:
+            try:
+                self.queue.put_nowait(job["id"])
+            except queue.Full:
+                return None
+            self.jobs[job["id"]] = job
+            self._trim_history()
+        logger.info(f"Queued job {job['id']}: {title} in {location} ({experience or 'any'} experience)")
+        return self.status(job["id"])
+
+    def status(self, job_id):
+        """Return a snapshot of a job's status, or None if it is unknown."""
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            snapshot = dict(job, progress=dict(job["progress"]))
+        snapshot["output_filename"] = os.path.basename(snapshot["output_file"]) if snapshot["output_file"] else None
+        return snapshot
+
+    def list_jobs(self):
+        with self._lock:
+            job_ids = list(self.jobs)
+        return [self.status(job_id) for job_id in job_ids]
+
+    def _trim_history(self):
+        """Forget the oldest finished jobs once the history is full (caller holds the lock)."""
+        finished = [job_id for job_id, job in self.jobs.items() if job["status"] in ("done", "failed")]
+        for job_id in finished[:max(0, len(self.jobs) - self.history_size)]:
+            del self.jobs[job_id]
+
+    def _worker(self):
+        scraper = JobScraper(**self.scraper_options)
+        with self._lock:
+            self.scrapers.append(scraper)
+
+        # Start the browser now so the first search doesn't pay for the cold start
+        if self.warm and scraper.engine == "selenium":
+            try:
+                scraper.driver
+            except Exception as e:
+                logger.warning(f"[{threading.current_thread().name}] Could not warm up browser: {e}")
+
+        while not self._stop.is_set():
+            try:
+                job_id = self.queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            try:
+                self._run_job(scraper, job_id)
+            finally:
+                self.queue.task_done()
+
+    def _run_job(self, scraper, job_id):
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return
+            job["status"] = "running"
+            job["started_at"] = datetime.now().isoformat(timespec="seconds")
+
+        # Mirror the scraper's page/card counters into the job record while it runs
+        done = threading.Event()
+
+        def track_progress():
+            while not done.wait(1):
+                with self._lock:
+                    job["progress"] = dict(scraper.progress)
+
+        tracker = threading.Thread(target=track_progress, daemon=True)
+        tracker.start()
+
+        # Fresh metrics per job so its status can report where the time went
+        scraper.metrics = RunMetrics()
+        try:
+            logger.info(f"[{threading.current_thread().name}] Running job {job_id}")
+            output_file = scraper.scrape_jobs(job["title"], job["location"], job["experience"],
+                                              job["max_pages"], job["max_jobs"])
+            with self._lock:
+                job["output_file"] = output_file
+                job["status"] = "done" if output_file else "failed"
+                if not output_file:
+                    job["error"] = "Results could not be saved"
+        except Exception as e:
+            logger.error(f"[{threading.current_thread().name}] Job {job_id} failed: {e}")
+            with self._lock:
+                job["status"] = "failed"
+                job["error"] = str(e)
+        finally:
+            done.set()
+            tracker.join()
+            with self._lock:
+                job["progress"] = dict(scraper.progress)
+                job["metrics"] = scraper.metrics.snapshot()
+                job["finished_at"] = datetime.now().isoformat(timespec="seconds")
+
+    def close(self):
+        """Stop the workers and close every browser."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=5)
+        with self._lock:
+            scrapers = list(self.scrapers)
+        for scraper in scrapers:
+            scraper.close()
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """Local JSON API: POST /jobs, GET /jobs, GET /jobs/<id>, GET /health."""
+
+    scraper_daemon = None
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == "/health":
+            self._send_json(200, {"status": "ok", "queued": self.scraper_daemon.queue.qsize(), "workers": self.scraper_daemon.workers})
+        elif path == "/jobs":
+            self._send_json(200, {"jobs": self.scraper_daemon.list_jobs()})
+        elif path.startswith("/jobs/"):
+            job = self.scraper_daemon.status(path[len("/jobs/"):])
+            if job is None:
+                self._send_json(404, {"error": "Job not found"})
+            else:
+                self._send_json(200, job)
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        if self.path.split("?", 1)[0].rstrip("/") != "/jobs":
+            self._send_json(404, {"error": "Not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": "Request body must be JSON"})
+            return
+
+        title, location = request.get("title"), request.get("location")
+        if not title or not location:
+            self._send_json(400, {"error": "Job title and location are required"})
+            return
+
+        try:
+            budget = [int(request[key]) if request.get(key) else None for key in ("max_pages", "max_jobs")]
+        except (TypeError, ValueError):
+            self._send_json(400, {"error": "max_pages and max_jobs must be numbers"})
+            return
+
+        job = self.scraper_daemon.submit(title, location, request.get("experience") or None, *budget)
+        if job is None:
+            self._send_json(503, {"error": "Scraper queue is full, try again later"})
+        else:
+            self._send_json(202, job)
+
+    def log_request(self, code="-", size="-"):
+        # Keep the console for scraper output; only log failed requests
+        if str(int(code) if str(code).isdigit() else code).startswith(("4", "5")):
+            super().log_request(code, size)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Job scraper daemon with a local HTTP API")
+
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--workers", "-w", type=int, default=1, help="Number of warm scraper workers (default: 1)")
+    parser.add_argument("--queue-size", type=int, default=10, help="Maximum number of queued searches (default: 10)")
+    parser.add_argument("--engine", choices=["selenium", "http"], default="selenium", help="Scraping engine")
+    parser.add_argument("--guest-url", default=LINKEDIN_GUEST_SEARCH_URL,
+                        help="Guest job search endpoint used by the http engine (e.g. a local stub server)")
+    parser.add_argument("--rpm", type=float, default=DEFAULT_REQUESTS_PER_MINUTE,
+                        help=f"Page requests per minute to each host, shared by all workers; 0 disables the limit (default: {DEFAULT_REQUESTS_PER_MINUTE})")
+    parser.add_argument("--browser-memory", type=float, default=DEFAULT_BROWSER_MEMORY_MB, metavar="MB",
+                        help=f"Restart a worker's Chrome between searches once it uses this much memory; 0 disables it (default: {DEFAULT_BROWSER_MEMORY_MB})")
+    parser.add_argument("--browser-pages", type=int, default=DEFAULT_BROWSER_MAX_PAGES, metavar="N",
+                        help=f"Restart a worker's Chrome between searches after this many pages; 0 disables it (default: {DEFAULT_BROWSER_MAX_PAGES})")
+    parser.add_argument("--tabs", type=tabs_count, default=1, metavar="N",
+                        help=f"Load this many result pages of a search (at most {MAX_TABS}) at once, in browser tabs or concurrent requests (default: 1)")
+    parser.add_argument("--enrich", action="store_true", help="Fetch every job's detail page (description, seniority, applicants)")
+    parser.add_argument("--debug", "-d", action="store_true", help="Log per-page and per-card detail")
+    parser.add_argument("--no-warm", action="store_true", help="Start each browser on its first search instead of at startup")
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    setup_logging(args.debug)
+
+    rate_limiter = RateLimiter(args.rpm)
+    enricher = JobEnricher(rate_limiter=rate_limiter) if args.enrich else None
+    daemon = ScraperDaemon(
+        workers=args.workers,
+        queue_size=args.queue_size,
+        warm=not args.no_warm,
+        engine=args.engine,
+        guest_search_url=args.guest_url,
+        rate_limiter=rate_limiter,
+        selector_plan=SelectorPlan(),
+        enricher=enricher,
+        browser_memory_mb=args.browser_memory,
+        browser_max_pages=args.browser_pages,
+        tabs=args.tabs,
+    )
+    daemon.start()
+
+    DaemonRequestHandler.scraper_daemon = daemon
+    server = ThreadingHTTPServer((args.host, args.port), DaemonRequestHandler)
+    logger.info(f"Scraper daemon listening on http://{args.host}:{args.port} with {daemon.workers} worker(s)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutting down scraper daemon...")
+    finally:
+        server.server_close()
+        daemon.close()
+        if enricher is not None:
+            enricher.close()
+        logger.info("Done!")
+
+
+if __name__ == "__main__":
+    main()
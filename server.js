@@ -2,12 +2,229 @@ const express = require('express');
 const bodyParser = require('body-parser');
 const path = require('path');
 const fs = require('fs');
-const { exec } = require('child_process');
+const http = require('http');
 
 // Initialize Express app
 const app = express();
 const PORT = process.env.PORT || 3000;
 
+// Long-running Python scraper daemon (see scraper_daemon.py)
+const SCRAPER_DAEMON_URL = new URL(process.env.SCRAPER_DAEMON_URL || 'http://127.0.0.1:8765');
+const SCRAPER_JOB_TIMEOUT = 15 * 60 * 1000;
+
+// Send a JSON request to the scraper daemon and resolve with its status code and parsed body
+function daemonRequest(method, requestPath, payload) {
+  return new Promise((resolve, reject) => {
+    const data = payload ? JSON.stringify(payload) : null;
+    const request = http.request({
+      hostname: SCRAPER_DAEMON_URL.hostname,
+      port: SCRAPER_DAEMON_URL.port,
+      path: requestPath,
+      method: method,
+      headers: data ? { 'Content-Type': 'application/json', 'Content-Length': Buffer.byteLength(data) } : {},
+      timeout: 10000
+    }, response => {
+      let body = '';
+      response.setEncoding('utf8');
+      response.on('data', chunk => { body += chunk; });
+      response.on('end', () => {
+        try {
+          resolve({ status: response.statusCode, body: JSON.parse(body || '{}') });
+        } catch (error) {
+          reject(error);
+        }
+      });
+    });
+    request.on('timeout', () => request.destroy(new Error('Scraper daemon request timed out')));
+    request.on('error', reject);
+    if (data) {
+      request.write(data);
+    }
+    request.end();
+  });
+}
+
+// Poll the daemon until a scraper job has finished (or the timeout passes)
+function waitForScraperJob(jobId) {
+  const startedAt = Date.now();
+  return new Promise((resolve, reject) => {
+    const poll = () => {
+      daemonRequest('GET', `/jobs/${encodeURIComponent(jobId)}`)
+        .then(({ body }) => {
+          if (body.status === 'done' || body.status === 'failed') {
+            return resolve(body);
+          }
+          if (Date.now() - startedAt > SCRAPER_JOB_TIMEOUT) {
+            return resolve({ status: 'timed out', error: 'Scraper job is still running' });
+          }
+          setTimeout(poll, 2000);
+        })
+        .catch(reject);
+    };
+    poll();
+  });
+}
+
+// Result files and the page index job_scraper.py writes next to them (output/index/<name>/)
+const OUTPUT_DIR = path.join(__dirname, 'output');
+const INDEX_DIR = path.join(OUTPUT_DIR, 'index');
+const DEFAULT_PAGE_SIZE = 50;
+const FILTER_FIELDS = ['location', 'source', 'q', 'since'];
+
+function readJsonFile(filePath) {
+  return JSON.parse(fs.readFileSync(filePath, 'utf8'));
+}
+
+// List result files, newest first, from the run catalog (falling back to a directory scan)
+function listResultFiles() {
+  try {
+    const catalog = readJsonFile(path.join(INDEX_DIR, 'catalog.json'));
+    return catalog.runs
+      .map(run => run.file)
+      .filter(file => file.startsWith('all_jobs_') && file.endsWith('.json'));
+  } catch (error) {
+    // No catalog yet (e.g. results saved before indexing existed)
+  }
+  
+  if (!fs.existsSync(OUTPUT_DIR)) {
+    return [];
+  }
+  return fs.readdirSync(OUTPUT_DIR)
+    .filter(file => file.startsWith('all_jobs_') && file.endsWith('.json'))
+    .sort()
+    .reverse(); // Most recent first
+}
+
+// Load a result file's manifest, or null if it has no index or the file changed since it was indexed
+function loadManifest(filename) {
+  try {
+    const manifest = readJsonFile(path.join(INDEX_DIR, path.parse(filename).name, 'manifest.json'));
+    const stat = fs.statSync(path.join(OUTPUT_DIR, filename));
+    if (manifest.source_size === stat.size && Math.abs(manifest.source_mtime_ms - Math.floor(stat.mtimeMs)) <= 1) {
+      return manifest;
+    }
+  } catch (error) {
+    // Missing or unreadable index, read the result file instead
+  }
+  return null;
+}
+
+// Pick the supported filters out of a query string
+function parseFilters(query) {
+  const filters = {};
+  FILTER_FIELDS.forEach(field => {
+    if (typeof query[field] === 'string' && query[field].trim()) {
+      filters[field] = query[field].trim();
+    }
+  });
+  return filters;
+}
+
+function matchesFilters(job, filters) {
+  if (filters.location && job.location !== filters.location) return false;
+  if (filters.source && job.source !== filters.source) return false;
+  if (filters.since && !(/^\d{4}-\d{2}-\d{2}/.test(job.date_posted || '') && job.date_posted >= filters.since)) return false;
+  if (filters.q) {
+    const text = `${job.title} ${job.company} ${job.location}`.toLowerCase();
+    if (!filters.q.toLowerCase().split(/\s+/).every(term => text.includes(term))) return false;
+  }
+  return true;
+}
+
+// Sorted [value, count] pairs for a filter dropdown
+function facetValues(counts) {
+  return Object.entries(counts).sort((a, b) => b[1] - a[1] || a[0].localeCompare(b[0]));
+}
+
+// Get page N of a result file, optionally filtered, reading only the page shards it needs
+function getJobPage(filename, page, filters) {
+  page = Math.max(1, parseInt(page, 10) || 1);
+  const manifest = loadManifest(filename);
+  
+  if (!manifest) {
+    // Not indexed: parse the whole file and slice it
+    const allJobs = readJsonFile(path.join(OUTPUT_DIR, filename));
+    const matching = allJobs.filter(job => matchesFilters(job, filters));
+    const locations = {};
+    allJobs.forEach(job => { locations[job.location] = (locations[job.location] || 0) + 1; });
+    return {
+      jobs: matching.slice((page - 1) * DEFAULT_PAGE_SIZE, page * DEFAULT_PAGE_SIZE),
+      page: page,
+      pageSize: DEFAULT_PAGE_SIZE,
+      pageCount: Math.max(1, Math.ceil(matching.length / DEFAULT_PAGE_SIZE)),
+      jobCount: matching.length,
+      hasMore: matching.length > page * DEFAULT_PAGE_SIZE,
+      locations: facetValues(locations),
+      indexed: false
+    };
+  }
+  
+  const indexDir = path.join(INDEX_DIR, path.parse(filename).name);
+  const pageSize = manifest.page_size;
+  const locations = facetValues(Object.fromEntries(
+    Object.entries(manifest.facets.location).map(([value, entry]) => [value, entry.count])));
+  const result = { page: page, pageSize: pageSize, locations: locations, indexed: true };
+  
+  if (Object.keys(filters).length === 0) {
+    const shard = manifest.pages[page - 1];
+    return Object.assign(result, {
+      jobs: shard ? readJsonFile(path.join(indexDir, shard.file)) : [],
+      pageCount: Math.max(1, manifest.page_count),
+      jobCount: manifest.job_count,
+      hasMore: page < manifest.page_count
+    });
+  }
+  
+  // Narrow down the shards using the manifest before reading any of them
+  let candidates = manifest.pages.map((shard, i) => i + 1);
+  let exactCount = null;
+  ['location', 'source'].forEach(field => {
+    if (filters[field]) {
+      const entry = manifest.facets[field][filters[field]] || { count: 0, pages: [] };
+      candidates = candidates.filter(number => entry.pages.includes(number));
+      exactCount = exactCount === null ? entry.count : null;
+    }
+  });
+  if (filters.since) {
+    candidates = candidates.filter(number => {
+      const max = manifest.pages[number - 1].date_range.max;
+      return max !== null && max >= filters.since;
+    });
+  }
+  if (filters.q || filters.since || (filters.location && filters.source)) {
+    exactCount = null;
+  }
+  
+  // Read candidate shards in order until this page (plus one job to know if there is more) is filled
+  const skip = (page - 1) * pageSize;
+  const jobs = [];
+  let matched = 0;
+  let scannedAll = true;
+  for (const number of candidates) {
+    const shardJobs = readJsonFile(path.join(indexDir, manifest.pages[number - 1].file));
+    for (const job of shardJobs) {
+      if (matchesFilters(job, filters)) {
+        matched++;
+        if (matched > skip && jobs.length < pageSize) {
+          jobs.push(job);
+        }
+      }
+    }
+    if (matched > skip + pageSize) {
+      scannedAll = false;
+      break;
+    }
+  }
+  const jobCount = exactCount !== null ? exactCount : (scannedAll ? matched : null);
+  
+  return Object.assign(result, {
+    jobs: jobs,
+    pageCount: jobCount !== null ? Math.max(1, Math.ceil(jobCount / pageSize)) : null,
+    jobCount: jobCount,
+    hasMore: matched > skip + pageSize
+  });
+}
+
 // Set up EJS as the templating engine
 app.set('view engine', 'ejs');
 app.set('views', path.join(__dirname, 'views'));
@@ -19,26 +236,18 @@ app.use(express.static(path.join(__dirname, 'public')));
 
 // Routes
 app.get('/', (req, res) => {
-  // Get the job listings from the most recent file
-  const outputDir = path.join(__dirname, 'output');
-  let jobListings = [];
+  // Get the first page of job listings from the most recent file
+  let jobPage = { jobs: [], page: 1, pageCount: 1, jobCount: 0, locations: [] };
   let latestFile = null;
   let allFiles = [];
   
   try {
-    if (fs.existsSync(outputDir)) {
-      // Get a list of all job listing files
-      allFiles = fs.readdirSync(outputDir)
-        .filter(file => file.startsWith('all_jobs_') && file.endsWith('.json'))
-        .sort()
-        .reverse(); // Most recent first
-      
-      if (allFiles.length > 0) {
-        latestFile = allFiles[0];
-        const filePath = path.join(outputDir, latestFile);
-        const fileContent = fs.readFileSync(filePath, 'utf8');
-        jobListings = JSON.parse(fileContent);
-      }
+    // Get a list of all job listing files
+    allFiles = listResultFiles();
+    
+    if (allFiles.length > 0) {
+      latestFile = allFiles[0];
+      jobPage = getJobPage(latestFile, 1, {});
     }
   } catch (error) {
     console.error('Error reading job listings:', error);
@@ -47,10 +256,13 @@ app.get('/', (req, res) => {
   // Render the index page with data
   res.render('index', {
     title: 'LinkedIn Job Scraper',
-    jobs: jobListings,
+    jobs: jobPage.jobs,
     latestFile: latestFile,
     allFiles: allFiles,
-    jobCount: jobListings.length
+    jobCount: jobPage.jobCount,
+    page: jobPage.page,
+    pageCount: jobPage.pageCount,
+    locations: jobPage.locations
   });
 });
 
@@ -65,119 +277,94 @@ app.post('/run-scraper', (req, res) => {
     });
   }
   
-  console.log(`Running scraper for: ${title} in ${location} with ${experience} years experience`);
-  
-  // Build the command to execute the Python script
-  const cmd = `python job_scraper.py --title "${title}" --location "${location}" --experience "${experience}"`;
-  
-  // Set a timeout for the scraper process (15 minutes)
-  const timeout = 15 * 60 * 1000;
+  console.log(`Submitting scraper job for: ${title} in ${location} with ${experience} years experience`);
   
   // For AJAX requests, we'll respond with JSON
-  const isAjaxRequest = req.xhr || req.headers.accept.indexOf('json') > -1;
+  const isAjaxRequest = req.xhr || (req.headers.accept || '').indexOf('json') > -1;
   
-  // Execute the command with a timeout
-  const scraperProcess = exec(cmd, { timeout: timeout }, (error, stdout, stderr) => {
-    if (error) {
-      console.error(`Error executing scraper: ${error.message}`);
+  // Hand the search to the long-running scraper daemon instead of forking Python per request
+  daemonRequest('POST', '/jobs', { title, location, experience })
+    .then(({ status, body }) => {
+      if (status !== 202) {
+        throw new Error(body.error || `Scraper daemon returned HTTP ${status}`);
+      }
+      
+      if (isAjaxRequest) {
+        return res.status(202).json({ 
+          success: true, 
+          message: 'Scraper job queued',
+          jobId: body.id,
+          status: body.status
+        });
+      }
+      
+      // For traditional form submission, wait for the job and then redirect to its results
+      return waitForScraperJob(body.id).then(job => {
+        if (job.status === 'done' && job.output_filename) {
+          return res.redirect('/?file=' + encodeURIComponent(job.output_filename));
+        }
+        return res.redirect('/?error=' + encodeURIComponent('Scraper job failed: ' + (job.error || job.status)));
+      });
+    })
+    .catch(error => {
+      console.error(`Error running scraper: ${error.message}`);
       
       // Different response based on request type
       if (isAjaxRequest) {
-        return res.status(500).json({ 
+        return res.status(503).json({ 
           success: false, 
           error: 'Failed to run the scraper', 
-          details: error.message,
-          output: stdout || null
+          details: error.message
         });
       } else {
-        // For traditional form submission, redirect with error parameter
         return res.redirect('/?error=' + encodeURIComponent('Failed to run the scraper: ' + error.message));
       }
-    }
-    
-    if (stderr) {
-      console.error(`Scraper stderr: ${stderr}`);
-    }
-    
-    console.log(`Scraper output: ${stdout}`);
-    
-    // Try to determine the output file from the stdout
-    let outputFile = null;
-    const fileMatch = stdout.match(/Results (?:will be |)saved to: .*?output[\/\\](.*?\.json)/i);
-    if (fileMatch && fileMatch[1]) {
-      outputFile = fileMatch[1];
-    }
-    
-    // Different response based on request type
-    if (isAjaxRequest) {
-      return res.status(200).json({ 
-        success: true, 
-        message: 'Scraper completed successfully',
-        output: stdout,
-        outputFile: outputFile
-      });
-    } else {
-      // For traditional form submission
-      if (outputFile) {
-        return res.redirect('/?file=' + encodeURIComponent(outputFile));
-      } else {
-        return res.redirect('/');
-      }
-    }
-  });
-  
-  // Respond immediately for AJAX requests to prevent timeout
-  if (isAjaxRequest) {
-    res.status(202).json({ 
-      success: true, 
-      message: 'Scraper started successfully',
-      estimatedTime: 'Several minutes'
     });
-  }
-  // For traditional form submissions, the response will come from the exec callback
+});
+
+// Status of a scraper job: queued/running/done/failed, progress and result file
+app.get('/scraper-status/:id', (req, res) => {
+  daemonRequest('GET', `/jobs/${encodeURIComponent(req.params.id)}`)
+    .then(({ status, body }) => res.status(status).json(body))
+    .catch(error => {
+      console.error(`Error checking scraper job ${req.params.id}:`, error);
+      res.status(503).json({ error: 'Scraper daemon is not reachable' });
+    });
 });
 
 // API endpoint to get job listings
+// Without ?page= or a filter this returns every job of the latest file, as before;
+// with them it returns one page: /api/jobs?page=2&location=...&q=...&since=YYYY-MM-DD&file=...
 app.get('/api/jobs', (req, res) => {
-  const outputDir = path.join(__dirname, 'output');
-  let jobListings = [];
+  const filters = parseFilters(req.query);
+  const paginated = req.query.page !== undefined || Object.keys(filters).length > 0;
   
   try {
-    if (fs.existsSync(outputDir)) {
-      const files = fs.readdirSync(outputDir)
-        .filter(file => file.startsWith('all_jobs_') && file.endsWith('.json'))
-        .sort()
-        .reverse();
-      
-      if (files.length > 0) {
-        const filePath = path.join(outputDir, files[0]);
-        const fileContent = fs.readFileSync(filePath, 'utf8');
-        jobListings = JSON.parse(fileContent);
-      }
+    const files = listResultFiles();
+    const filename = req.query.file ? path.basename(req.query.file) : files[0];
+    
+    if (!filename || !fs.existsSync(path.join(OUTPUT_DIR, filename))) {
+      return paginated ? res.status(404).json({ error: 'File not found' }) : res.json([]);
+    }
+    if (!paginated) {
+      return res.json(readJsonFile(path.join(OUTPUT_DIR, filename)));
     }
+    res.json(Object.assign({ filename: filename }, getJobPage(filename, req.query.page, filters)));
   } catch (error) {
     console.error('Error reading job listings:', error);
     return res.status(500).json({ error: 'Failed to load job listings' });
   }
-  
-  res.json(jobListings);
 });
 
-// Add a new route to get job data for a specific file
+// Add a new route to get one page of job data for a specific file (?page=N plus optional filters)
 app.get('/jobs/:filename', (req, res) => {
-  const filename = req.params.filename;
-  const filePath = path.join(__dirname, 'output', filename);
+  const filename = path.basename(req.params.filename);
+  const filePath = path.join(OUTPUT_DIR, filename);
   
   try {
     if (fs.existsSync(filePath)) {
-      const fileContent = fs.readFileSync(filePath, 'utf8');
-      const jobListings = JSON.parse(fileContent);
-      res.json({
-        success: true,
-        jobs: jobListings,
-        jobCount: jobListings.length,
-        filename: filename
-      });
+      const jobPage = getJobPage(filename, req.query.page, parseFilters(req.query));
+      res.json(Object.assign({ success: true, filename: filename }, jobPage));
     } else {
       res.status(404).json({ success: false, error: 'File not found' });
     }